@@ -0,0 +1,46 @@
+def _mixed_task(idx):
+    import time
+
+    if idx % 4 == 0:
+        # CPU bound
+        total = 0
+        for i in range(20000):
+            total += i * i
+        return total
+    else:
+        # I/O bound
+        time.sleep(0.005)
+        return idx
+
+
+def bench_executor_autoscale():
+    """
+    Compare fixed thread pool sizes against ``max_workers='auto'`` on a
+    mixed I/O and CPU bound workload.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_executor_autoscale.py
+    """
+    import timerit
+
+    import ubelt as ub
+
+    items = list(range(2000))
+    ti = timerit.Timerit(3, bestof=1, verbose=1, unit='ms')
+
+    for max_workers in [1, 4, 16, 64, 'auto']:
+        for timer in ti.reset('thread max_workers={}'.format(max_workers)):
+            with timer:
+                with ub.Executor(mode='thread', max_workers=max_workers) as ex:
+                    list(ex.map(_mixed_task, items))
+        if max_workers == 'auto':
+            targets = [s.target for s in ex.backend.history]
+            print(
+                'chosen workers: min={} max={} final={}'.format(
+                    min(targets), max(targets), targets[-1]
+                )
+            )
+
+
+if __name__ == '__main__':
+    bench_executor_autoscale()
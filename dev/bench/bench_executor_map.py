@@ -0,0 +1,34 @@
+def bench_executor_map():
+    """
+    Compare the backend map with one item per task against the lazily
+    chunked imap for many tiny tasks.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_executor_map.py
+    """
+    import timerit
+
+    import ubelt as ub
+
+    items = list(range(20000))
+    ti = timerit.Timerit(3, bestof=1, verbose=1, unit='ms')
+
+    for timer in ti.reset('builtin map'):
+        with timer:
+            list(map(abs, items))
+
+    for mode in ['thread', 'process']:
+        with ub.Executor(mode=mode, max_workers=4) as executor:
+            for timer in ti.reset('{} map chunksize=1'.format(mode)):
+                with timer:
+                    list(executor.map(abs, items))
+            for timer in ti.reset('{} imap chunksize=auto'.format(mode)):
+                with timer:
+                    list(executor.imap(abs, items))
+            for timer in ti.reset('{} imap_unordered auto'.format(mode)):
+                with timer:
+                    list(executor.imap_unordered(abs, items))
+
+
+if __name__ == '__main__':
+    bench_executor_map()
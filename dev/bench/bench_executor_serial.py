@@ -0,0 +1,44 @@
+def bench_executor_serial():
+    """
+    Measure the overhead the serial executor adds on top of a plain for loop
+    for many tiny tasks.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_executor_serial.py
+    """
+    import concurrent.futures
+
+    import timerit
+
+    import ubelt as ub
+
+    items = list(range(100000))
+    ti = timerit.Timerit(5, bestof=3, verbose=1, unit='ms')
+
+    for timer in ti.reset('for loop'):
+        with timer:
+            results = []
+            for item in items:
+                results.append(abs(item))
+
+    with ub.Executor(mode='serial') as executor:
+        for timer in ti.reset('serial map'):
+            with timer:
+                list(executor.map(abs, items))
+
+        for timer in ti.reset('serial submit + result'):
+            with timer:
+                jobs = [executor.submit(abs, item) for item in items]
+                [job.result() for job in jobs]
+
+    # For reference, the cost of allocating a standard future per item
+    for timer in ti.reset('stdlib Future alloc'):
+        with timer:
+            for item in items:
+                future = concurrent.futures.Future()
+                future.set_result(abs(item))
+                future.result()
+
+
+if __name__ == '__main__':
+    bench_executor_serial()
@@ -0,0 +1,44 @@
+def _lookup(table, key):
+    return table[key]
+
+
+def _lookup_shared(handle, key):
+    return handle.get()[key]
+
+
+def bench_executor_shared():
+    """
+    Compare sending a large read-only table with every process task against
+    sending it once per worker with ``shared=...``.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_executor_shared.py
+    """
+    import timerit
+
+    import ubelt as ub
+
+    table = {i: str(i) * 10 for i in range(50000)}
+    keys = list(range(200))
+    ti = timerit.Timerit(3, bestof=1, verbose=1, unit='ms')
+
+    for timer in ti.reset('process table per task'):
+        with timer:
+            with ub.Executor('process', max_workers=4) as executor:
+                jobs = [executor.submit(_lookup, table, k) for k in keys]
+                [job.result() for job in jobs]
+
+    for timer in ti.reset('process shared table'):
+        with timer:
+            with ub.Executor(
+                'process', max_workers=4, shared={'table': table}
+            ) as executor:
+                handle = executor.shared['table']
+                jobs = [
+                    executor.submit(_lookup_shared, handle, k) for k in keys
+                ]
+                [job.result() for job in jobs]
+
+
+if __name__ == '__main__':
+    bench_executor_shared()
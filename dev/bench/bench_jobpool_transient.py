@@ -0,0 +1,47 @@
+def bench_jobpool_transient():
+    """
+    Check that draining a transient JobPool scales linearly with the number
+    of jobs. The old list based registry removed each completed job with
+    ``list.remove``, which is quadratic.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_jobpool_transient.py
+    """
+    import concurrent.futures
+
+    import timerit
+
+    import ubelt as ub
+
+    def list_registry_drain(futures):
+        # Emulates the previous implementation
+        jobs = list(futures)
+        for job in concurrent.futures.as_completed(futures):
+            jobs.remove(job)
+
+    def make_done_futures(num):
+        futures = []
+        for idx in range(num):
+            future = concurrent.futures.Future()
+            future.set_result(idx)
+            futures.append(future)
+        return futures
+
+    ti = timerit.Timerit(1, bestof=1, verbose=1, unit='s')
+    for num in [10_000, 20_000, 40_000, 80_000, 160_000, 500_000]:
+        pool = ub.JobPool('serial', transient=True)
+        pool.jobs = make_done_futures(num)
+        for timer in ti.reset('JobPool transient drain n={}'.format(num)):
+            with timer:
+                for _ in pool.as_completed():
+                    pass
+        assert len(pool) == 0
+        if num <= 40_000:
+            futures = make_done_futures(num)
+            for timer in ti.reset('list.remove drain n={}'.format(num)):
+                with timer:
+                    list_registry_drain(futures)
+
+
+if __name__ == '__main__':
+    bench_jobpool_transient()
@@ -1,4 +1,6 @@
 def bench_memoize():
+    import timerit
+
     import ubelt as ub
 
     @ub.memoize
@@ -25,7 +27,7 @@ def bench_memoize():
             return object()
 
     self = Foo()
-    ti = ub.Timerit(1000, bestof=100, verbose=1, unit='ns')
+    ti = timerit.Timerit(1000, bestof=100, verbose=1, unit='ns')
 
     ti.reset('memoized method').call(lambda: self.a_memoized_method())
     ti.reset('raw method').call(lambda: self.a_raw_method())
@@ -37,9 +39,102 @@ def bench_memoize():
     ti.reset('raw property').call(lambda: self.a_raw_property)
 
 
+def bench_memoize_lru():
+    """
+    Compare bounded ub.memoize against functools.lru_cache on a workload that
+    mixes hits and evictions.
+    """
+    import functools
+    import random
+
+    import timerit
+
+    import ubelt as ub
+
+    def func(x):
+        return x * 2
+
+    rng = random.Random(0)
+    num_keys = 1000
+    keys = [rng.randint(0, num_keys) for _ in range(10000)]
+
+    ti = timerit.Timerit(10, bestof=3, verbose=1, unit='ms')
+    for maxsize in [None, 128, 512]:
+        candidates = {
+            'ub.memoize': ub.memoize(maxsize=maxsize)(func),
+            'functools.lru_cache': functools.lru_cache(maxsize=maxsize)(func),
+        }
+        if maxsize is None:
+            candidates['ub.memoize(ttl=60)'] = ub.memoize(ttl=60)(func)
+        for name, cached in candidates.items():
+            label = '{} maxsize={}'.format(name, maxsize)
+            for timer in ti.reset(label):
+                cached.cache_clear()
+                with timer:
+                    for x in keys:
+                        cached(x)
+            print('{}: {}'.format(label, cached.cache_info()))
+
+
+def bench_memoize_signatures():
+    """
+    Measure the cost of a cache hit for different kinds of call signatures.
+    """
+    import functools
+
+    import timerit
+
+    import ubelt as ub
+
+    def func(*args, **kwargs):
+        return None
+
+    memo_func = ub.memoize(func)
+    lru_func = functools.lru_cache(maxsize=None)(func)
+    signatures = {
+        'single int': ((1,), {}),
+        'three args': ((1, 'a', 2.0), {}),
+        'with kwargs': ((1,), {'a': 2}),
+        'unhashable': (([1, 2, 3],), {}),
+    }
+    ti = timerit.Timerit(10000, bestof=10, verbose=1, unit='ns')
+    for key, (args, kwargs) in signatures.items():
+        ti.reset('ub.memoize ' + key).call(lambda: memo_func(*args, **kwargs))
+        if key != 'unhashable':
+            ti.reset('functools.lru_cache ' + key).call(
+                lambda: lru_func(*args, **kwargs)
+            )
+
+
+def bench_memoize_lock_overhead():
+    """
+    Measure the overhead of the per-key lock on uncontended cache hits.
+    """
+    import timerit
+
+    import ubelt as ub
+
+    def func(x):
+        return x
+
+    candidates = {
+        'unlocked': ub.memoize(func),
+        'unlocked maxsize=128': ub.memoize(maxsize=128)(func),
+        'per-key': ub.memoize(lock='per-key')(func),
+        'per-key maxsize=128': ub.memoize(maxsize=128, lock='per-key')(func),
+    }
+    ti = timerit.Timerit(10000, bestof=10, verbose=1, unit='ns')
+    for key, cached in candidates.items():
+        cached(1)
+        ti.reset(key).call(lambda: cached(1))
+
+
 if __name__ == '__main__':
     """
     CommandLine:
-        python ~/code/ubelt/dev/bench_memoize.py
+        python ~/code/ubelt/dev/bench/bench_memoize.py
     """
     bench_memoize()
+    bench_memoize_lru()
+    bench_memoize_signatures()
+    bench_memoize_lock_overhead()
@@ -149,3 +149,245 @@ def test_cache_stamp_noproduct() -> None:
     assert not self.expired()
     product.write_text('corrupted')
     assert not self.expired()
+
+
+def test_cache_stamp_verify_stat() -> None:
+    import os
+
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-verify').ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    product = dpath / 'product.txt'
+    self = ub.CacheStamp(
+        'stat', dpath=dpath, depends='cfg', product=product, verify='stat'
+    )
+    product.write_text('content')
+    self.renew()
+    assert not self.expired()
+    # Same size and mtime is trusted without rehashing
+    stat = product.stat()
+    product.write_text('CONTENT')
+    os.utime(product, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert not self.expired()
+    # but the hash policy will notice the change
+    self.verify = 'hash'
+    assert self.expired() == 'hash_diff'
+
+
+def test_cache_stamp_verify_hash_if_stat_changed() -> None:
+    import os
+
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-verify').ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    product = dpath / 'product.txt'
+    self = ub.CacheStamp(
+        'lazy',
+        dpath=dpath,
+        depends='cfg',
+        product=product,
+        verify='hash-if-stat-changed',
+    )
+    product.write_text('content')
+    self.renew()
+    assert not self.expired()
+    # Touching the file changes the mtime, but the hash still agrees, so the
+    # stamp is valid and the certificate is updated with the new stats.
+    stat = product.stat()
+    os.utime(product, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not self.expired()
+    cert = self._get_certificate()
+    assert cert is not None
+    assert cert['mtime_ns'] == [product.stat().st_mtime_ns]
+    # Changing the content with a new mtime is detected by the hash
+    product.write_text('CONTENT')
+    os.utime(product, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert self.expired() == 'hash_diff'
+    # A size change is always an expiration
+    product.write_text('more content')
+    assert self.expired() == 'size_diff'
+
+
+def test_cache_stamp_verify_periodic() -> None:
+    import os
+
+    import pytest
+
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-verify').ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    product = dpath / 'product.txt'
+    with pytest.raises(ValueError):
+        ub.CacheStamp(
+            'periodic', dpath=dpath, product=product, verify='periodic'
+        )
+    with pytest.raises(KeyError):
+        ub.CacheStamp('periodic', dpath=dpath, product=product, verify='bad')
+    self = ub.CacheStamp(
+        'periodic',
+        dpath=dpath,
+        depends='cfg',
+        product=product,
+        verify='periodic',
+        audit_interval=10000,
+    )
+    product.write_text('content')
+    self.renew()
+    stat = product.stat()
+    product.write_text('CONTENT')
+    os.utime(product, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    # The audit is not due yet
+    assert not self.expired()
+    # Once the audit is due the hash is checked
+    self.audit_interval = 0
+    assert self.expired() == 'hash_diff'
+
+
+def test_cache_stamp_parallel_hash() -> None:
+    import os
+
+    dpath = ub.Path.appdir(
+        'ubelt/tests', 'test-cache-stamp-workers'
+    ).ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    product = [dpath / 'product{}.txt'.format(i) for i in range(20)]
+    for fpath in product:
+        fpath.write_text('content of ' + fpath.name)
+    self = ub.CacheStamp(
+        'parallel', dpath=dpath, depends='cfg', product=product, workers=4
+    )
+    cert = self.renew()
+    assert cert is not None
+    serial_hashes = ub.CacheStamp(
+        'serial', dpath=dpath, product=product
+    )._product_file_hash()
+    assert cert['hash'] == serial_hashes
+    assert not self.expired()
+    # Corrupt one file without changing its size or mtime
+    fpath = product[13]
+    stat = fpath.stat()
+    fpath.write_text(fpath.read_text().upper())
+    os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert self.expired() == 'hash_diff'
+
+
+def test_cache_stamp_directory_product() -> None:
+    import os
+
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-dir').ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    product = (dpath / 'outputs').ensuredir()
+    for idx in range(5):
+        subdir = (product / 'part{}'.format(idx)).ensuredir()
+        for jdx in range(3):
+            (subdir / 'shard{}.txt'.format(jdx)).write_text(str((idx, jdx)))
+    self = ub.CacheStamp(
+        'dir',
+        dpath=dpath,
+        depends='cfg',
+        product=product,
+        verify='hash-if-stat-changed',
+        workers=2,
+    )
+    assert self.expired() == 'no_cert'
+    cert = self.renew()
+    assert cert is not None
+    assert len(cert['files'][0]) == 15
+    assert cert['files'][0][0] == 'part0/shard0.txt'
+    assert len(cert['hash']) == 15
+    assert not self.expired()
+    assert self.manifest_diff() == {'added': [], 'removed': [], 'modified': []}
+
+    # Touching a file without changing it does not expire the stamp
+    fpath = product / 'part2' / 'shard1.txt'
+    stat = fpath.stat()
+    os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not self.expired()
+
+    # Same size, same mtime, different content is caught in hash mode
+    stat = fpath.stat()
+    fpath.write_text(fpath.read_text().replace('2', '9'))
+    os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    self.verify = 'hash'
+    assert self.expired() == 'hash_diff'
+    self.renew()
+
+    # Removing a file changes the manifest
+    fpath.unlink()
+    assert self.expired() == 'manifest_diff'
+    assert self.manifest_diff() == {
+        'added': [],
+        'removed': ['part2/shard1.txt'],
+        'modified': [],
+    }
+    self.renew()
+
+    # Moving the product directory does not change the manifest
+    moved = dpath / 'moved'
+    product.move(moved)
+    self.product = moved
+    assert not self.expired()
+    self.verify = 'hash'
+    assert not self.expired()
+
+
+def test_cache_stamp_directory_product_symlinks() -> None:
+    import os
+
+    import pytest
+
+    if ub.WIN32:
+        pytest.skip('symlinks may require admin on windows')
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-links').ensuredir()
+    ub.delete(dpath)
+    product = (dpath / 'outputs').ensuredir()
+    other = (dpath / 'other').ensuredir()
+    (other / 'data.txt').write_text('data')
+    (product / 'real.txt').write_text('real')
+    os.symlink(other / 'data.txt', product / 'file_link.txt')
+    os.symlink(other, product / 'dir_link')
+    os.symlink(dpath / 'does-not-exist', product / 'broken_link')
+    self = ub.CacheStamp('links', dpath=dpath, depends='cfg', product=product)
+    cert = self.renew()
+    assert cert is not None
+    # Links to files are hashed by content, other links are skipped
+    assert cert['files'] == [['file_link.txt', 'real.txt']]
+    assert not self.expired()
+    (other / 'data.txt').write_text('changed')
+    assert self.expired()
+
+
+def test_cache_stamp_expired_many() -> None:
+    dpath = ub.Path.appdir('ubelt/tests', 'test-cache-stamp-many').ensuredir()
+    ub.delete(dpath)
+    ub.ensuredir(dpath)
+    shared_dir = (dpath / 'shared').ensuredir()
+    (shared_dir / 'data.txt').write_text('data')
+    stamps = []
+    for idx in range(20):
+        product = dpath / 'product{}.txt'.format(idx)
+        product.write_text(str(idx))
+        stamp = ub.CacheStamp(
+            'stamp{}'.format(idx),
+            dpath=dpath,
+            depends=idx,
+            product=[shared_dir, product],
+            expires=-1 if idx == 7 else None,
+            enabled=idx != 9,
+        )
+        stamp.renew()
+        stamps.append(stamp)
+    ub.delete(dpath / 'product11.txt')
+    for workers in [0, 4]:
+        got = ub.CacheStamp.expired_many(stamps, workers=workers)
+        want = [stamp.expired() for stamp in stamps]
+        assert got == want
+        assert got[7] == 'expired_cert'
+        assert got[9] == 'disabled'
+        assert got[11] == 'missing_products'
+        assert sum(r is False for r in got) == 17
+    (shared_dir / 'new.txt').write_text('new')
+    got = ub.CacheStamp.expired_many(stamps, workers=4)
+    assert got.count('manifest_diff') == 17
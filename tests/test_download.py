@@ -166,6 +166,25 @@ def test_grabdata_cache() -> None:
     assert exists(fpath)
 
 
+@pytest.mark.timeout(TIMEOUT)
+def test_grabdata_periodic_verify() -> None:
+    """
+    The audit interval is forwarded so the periodic policy can be used.
+    """
+    url = _demo_url()
+    dpath = ub.Path.appdir('ubelt/tests/test_download/periodic').ensuredir()
+    fpath = dpath / basename(url)
+    ub.delete(fpath)
+    kw = dict(fpath=fpath, verify='periodic', audit_interval=60)
+    assert ub.Path(ub.grabdata(url, **kw)).exists()
+    # The second call trusts the stat and does not redownload
+    mtime = fpath.stat().st_mtime
+    ub.grabdata(url, **kw)
+    assert fpath.stat().st_mtime == mtime
+    with pytest.raises(ValueError):
+        ub.grabdata(url, fpath=fpath, verify='periodic')
+
+
 @pytest.mark.timeout(TIMEOUT)
 def test_grabdata_nohash() -> None:
     """
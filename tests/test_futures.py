@@ -65,6 +65,30 @@ def test_job_pool_clear_completed_thread() -> None:
         assert len(jobs.jobs) == 0
 
 
+def test_job_pool_jobs_mutations_change_the_pool() -> None:
+    import pytest
+
+    import ubelt as ub
+
+    pool: ub.JobPool[int] = ub.JobPool(mode='thread', max_workers=2)
+    with pool:
+        jobs = [pool.submit(simple_worker, jobid) for jobid in range(4)]
+        pool.jobs.remove(jobs[0])
+        assert len(pool) == 3 and jobs[0] not in pool.jobs
+        with pytest.raises(ValueError):
+            pool.jobs.remove(jobs[0])
+        pool.jobs.pop()
+        assert pool.jobs == jobs[1:3]
+        pool.jobs.insert(0, jobs[3])
+        assert pool.jobs == [jobs[3], jobs[1], jobs[2]]
+        # Only the remaining jobs are yielded
+        done = list(pool.as_completed())
+        assert set(done) == {jobs[1], jobs[2], jobs[3]}
+        pool.jobs.extend(jobs)
+        pool.jobs.clear()
+        assert len(pool) == 0
+
+
 def test_job_pool_as_completed_prog_args() -> None:
     import ubelt as ub
 
@@ -413,6 +437,760 @@ def test_as_completed_timeout() -> None:
         print('End of function')
 
 
+def _square(x: int) -> int:
+    return x * x
+
+
+def test_executor_imap_chunked() -> None:
+    import itertools as it
+
+    import ubelt as ub
+
+    modes = ['serial', 'thread', 'process']
+    if not _process_backend_available():
+        modes.remove('process')
+
+    for mode in modes:
+        with ub.Executor(mode=mode, max_workers=2) as executor:
+            expected = [x * x for x in range(500)]
+            assert list(executor.imap(_square, range(500))) == expected
+            assert list(
+                executor.map(_square, range(500), chunksize='auto')
+            ) == (expected)
+            assert (
+                list(executor.imap(_square, range(50), chunksize=7))
+                == (expected[:50])
+            )
+            unordered = executor.imap_unordered(_square, range(500))
+            assert sorted(unordered) == expected
+            # Inputs are consumed lazily
+            first = list(it.islice(executor.imap(_square, it.count()), 10))
+            assert first == expected[:10]
+
+
+def test_executor_imap_error() -> None:
+    import pytest
+
+    import ubelt as ub
+
+    with ub.Executor(mode='thread', max_workers=2) as executor:
+        with pytest.raises(ZeroDivisionError):
+            list(executor.imap(divmod, [1, 2, 3], [1, 0, 1]))
+        with pytest.raises(ValueError):
+            list(executor.imap(divmod, [1], [1], chunksize=0))
+
+
+def test_job_pool_max_pending_blocks_submit() -> None:
+    import threading
+    import time
+
+    import ubelt as ub
+
+    release = threading.Event()
+
+    def blocked(x: int) -> int:
+        release.wait()
+        return x
+
+    pool: ub.JobPool[int] = ub.JobPool('thread', max_workers=2, max_pending=2)
+    with pool:
+
+        def submitter() -> None:
+            for x in range(5):
+                pool.submit(blocked, x)
+
+        thread = threading.Thread(target=submitter)
+        thread.start()
+        time.sleep(0.1)
+        # The third submit waits until one of the first two finishes
+        assert len(pool.jobs) == 2
+        release.set()
+        thread.join()
+        assert sorted(pool.join()) == [0, 1, 2, 3, 4]
+
+
+def test_job_pool_max_pending_serial() -> None:
+    import ubelt as ub
+
+    calls = []
+
+    def record(x: int) -> int:
+        calls.append(x)
+        if x == 1:
+            raise ValueError(x)
+        return x
+
+    pool: ub.JobPool[int] = ub.JobPool('serial', max_pending=2)
+    jobs = [pool.submit(record, x) for x in range(4)]
+    # Submitting beyond the limit ran the oldest jobs
+    assert calls == [0, 1]
+    assert jobs[0].result() == 0
+    assert isinstance(jobs[1].exception(), ValueError)
+    # Serial futures run once, even when they raise
+    for _ in range(2):
+        try:
+            jobs[1].result()
+        except ValueError:
+            pass
+    assert calls == [0, 1]
+    assert [job.result() for job in jobs[2:]] == [2, 3]
+
+
+def test_job_pool_imap_bounded() -> None:
+    import threading
+
+    import ubelt as ub
+
+    in_flight = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    def work(x: int) -> int:
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        with lock:
+            in_flight[0] -= 1
+        return x + 1
+
+    pool: ub.JobPool[int] = ub.JobPool('thread', max_workers=4)
+    with pool:
+        results = list(pool.imap(work, range(1000), max_pending=3))
+    assert results == list(range(1, 1001))
+    assert peak[0] <= 3
+    assert len(pool.jobs) == 0
+
+
+def test_executor_asyncio_mode() -> None:
+    import asyncio
+    import threading
+    import time
+
+    import pytest
+
+    import ubelt as ub
+
+    running = [0]
+    peak = [0]
+
+    async def io_task(x: int) -> int:
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.05)
+        running[0] -= 1
+        return x
+
+    num_threads = threading.active_count()
+    start = time.monotonic()
+    with ub.Executor(mode='asyncio', max_workers=500) as executor:
+        jobs = [executor.submit(io_task, i) for i in range(2000)]
+        results = [job.result() for job in jobs]
+        # One event loop thread and a small thread pool, not one per task
+        assert threading.active_count() <= num_threads + 2
+    elapsed = time.monotonic() - start
+    assert results == list(range(2000))
+    # Concurrency is bounded by max_workers
+    assert peak[0] == 500
+    assert elapsed < 2.0
+
+    async def fail() -> None:
+        raise KeyError('oops')
+
+    pool: ub.JobPool[int] = ub.JobPool('asyncio', max_workers=0)
+    with pool:
+        job = pool.submit(fail)
+        with pytest.raises(KeyError):
+            job.result()
+        assert list(pool.executor.imap(io_task, range(5))) == [0, 1, 2, 3, 4]
+        assert pool.submit(sum, [1, 2]).result() == 3
+    with pytest.raises(RuntimeError):
+        pool.submit(sum, [1, 2])
+
+
+def test_executor_asyncio_shutdown_twice() -> None:
+    import asyncio
+
+    import ubelt as ub
+
+    with ub.Executor('asyncio', 2) as executor:
+        assert executor.submit(sum, [1, 2]).result() == 3
+        executor.shutdown()
+    executor.shutdown()
+
+    # Shutting down without waiting cancels the pending tasks cleanly
+    backend = ub.Executor('asyncio', 1).backend
+    jobs = [backend.submit(asyncio.sleep, 10) for _ in range(3)]
+    backend.shutdown(wait=False)
+    assert all(job.cancelled() for job in jobs)
+    backend.shutdown(wait=False)
+
+
+def test_executor_autoscale_io_bound() -> None:
+    import time
+
+    import ubelt as ub
+
+    num_tasks = 400
+    start = time.monotonic()
+    with ub.Executor(mode='thread', max_workers='auto') as executor:
+        executor.backend.interval = 0.01
+        jobs = [executor.submit(time.sleep, 0.01) for _ in range(num_tasks)]
+        for job in jobs:
+            job.result()
+    elapsed = time.monotonic() - start
+    history = executor.backend.history
+    # A single thread would need num_tasks * 0.01 seconds
+    assert elapsed < num_tasks * 0.01 / 2
+    assert max(s.target for s in history) > 4
+    assert all(1 <= s.target <= executor.max_workers for s in history)
+
+
+def test_executor_autoscale_policy_bounds() -> None:
+    import time
+
+    import pytest
+
+    import ubelt as ub
+    from ubelt.util_futures import AutoScaleExecutor
+
+    seen = []
+
+    def policy(stats) -> int:
+        seen.append(stats)
+        return 1000
+
+    executor = AutoScaleExecutor(min_workers=2, max_workers=3, policy=policy)
+    executor.interval = 0
+    with executor:
+        jobs = [executor.submit(time.sleep, 0.01) for _ in range(30)]
+        assert [job.result() for job in jobs] == [None] * 30
+        assert max(s.workers for s in seen) <= 3
+        assert {s.target for s in executor.history} == {3}
+
+        def fail() -> None:
+            raise KeyError('oops')
+
+        with pytest.raises(KeyError):
+            executor.submit(fail).result()
+    with pytest.raises(RuntimeError):
+        executor.submit(time.sleep, 0)
+
+    with pytest.raises(ValueError):
+        ub.Executor(mode='process', max_workers='auto')
+    with pytest.raises(ValueError):
+        ub.Executor(mode='thread', max_workers=2, policy=policy)
+
+
+def _pid_of(x: int) -> tuple[int, int]:
+    import os
+
+    if x < 0:
+        raise ValueError(x)
+    return x, os.getpid()
+
+
+def test_job_pool_priority_bounded_inflight() -> None:
+    import threading
+    import time
+
+    import ubelt as ub
+
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def task(x: int) -> int:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.002)
+        with lock:
+            running[0] -= 1
+        return x
+
+    pool: ub.JobPool[int] = ub.JobPool('thread', max_workers=8, max_inflight=3)
+    with pool:
+        jobs = [pool.submit(task, i, priority=-i) for i in range(50)]
+    assert [job.result() for job in jobs] == list(range(50))
+    assert peak[0] <= 3
+
+
+def test_job_pool_priority_cancel_queued() -> None:
+    import threading
+
+    import ubelt as ub
+
+    release = threading.Event()
+    pool: ub.JobPool[object] = ub.JobPool('thread', max_workers=1)
+    with pool:
+        blocker = pool.submit(release.wait, priority=0)
+        queued = pool.submit(sum, [1, 2], priority=1)
+        assert queued.cancel()
+        after = pool.submit(sum, [3, 4], priority=2)
+        release.set()
+    assert blocker.result() is True
+    assert queued.cancelled()
+    assert after.result() == 7
+
+
+def test_job_pool_group_locality() -> None:
+    import pytest
+
+    import ubelt as ub
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    pool: ub.JobPool[tuple[int, int]] = ub.JobPool(
+        'process', max_workers=2, max_inflight=1
+    )
+    with pool:
+        pool.submit(_pid_of, 0)
+        grouped = [pool.submit(_pid_of, x, group='g') for x in [1, 2, -3, 4]]
+        others = [pool.submit(_pid_of, x, priority=5) for x in range(3)]
+    assert grouped[2].exception() is not None
+    pids = {grouped[i].result()[1] for i in [0, 1, 3]}
+    # Jobs in a group run back to back in the same worker process
+    assert len(pids) == 1
+    assert [job.result()[0] for job in others] == [0, 1, 2]
+
+
+def test_executor_shared_and_initializer() -> None:
+    import threading
+
+    import pytest
+
+    import ubelt as ub
+    from ubelt.util_futures import _SHARED_REGISTRY, _demo_shared_lookup
+
+    lock = threading.Lock()
+    calls = []
+
+    def init(tag: str) -> None:
+        with lock:
+            calls.append(tag)
+
+    table = {i: str(i) for i in range(100)}
+    for mode in ['serial', 'thread', 'asyncio']:
+        calls.clear()
+        executor = ub.Executor(
+            mode, 3, initializer=init, initargs=('x',), shared={'t': table}
+        )
+        with executor:
+            handle = executor.shared['t']
+            jobs = [
+                executor.submit(_demo_shared_lookup, handle, i)
+                for i in range(20)
+            ]
+            assert [job.result() for job in jobs] == [str(i) for i in range(20)]
+        assert 1 <= len(calls) <= 3 and set(calls) == {'x'}
+        # Shared objects are released on shutdown
+        assert handle.token not in _SHARED_REGISTRY
+        with pytest.raises(KeyError):
+            handle.get()
+
+
+def test_executor_shared_process_start_methods(monkeypatch) -> None:
+    import multiprocessing
+
+    import pytest
+
+    import ubelt as ub
+    from ubelt.util_futures import _demo_shared_lookup
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    table = {i: str(i) for i in range(1000)}
+    get_context = multiprocessing.get_context
+    for method in ['fork', 'spawn']:
+        if method not in multiprocessing.get_all_start_methods():
+            continue
+        monkeypatch.setattr(
+            multiprocessing, 'get_context', lambda m=None: get_context(method)
+        )
+        with ub.Executor('process', 2, shared={'t': table}) as executor:
+            handle = executor.shared['t']
+            jobs = [
+                executor.submit(_demo_shared_lookup, handle, i)
+                for i in [1, 10, 100]
+            ]
+            assert [job.result() for job in jobs] == ['1', '10', '100']
+
+
+def test_shared_numpy_roundtrip() -> None:
+    import pytest
+
+    np = pytest.importorskip('numpy')
+    from ubelt.util_futures import _export_shared, _import_shared
+
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    payload, blocks = _export_shared({'arr': data, 'obj': [1, 2]})
+    try:
+        assert payload['arr'][0] == 'ndarray'
+        shared = _import_shared(payload)
+        assert shared['obj'] == [1, 2]
+        assert np.all(shared['arr'] == data)
+        assert not shared['arr'].flags.writeable
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def test_job_pool_telemetry_modes() -> None:
+    import json
+    import os
+
+    import pytest
+
+    import ubelt as ub
+
+    modes = ['serial', 'thread', 'asyncio']
+    if _process_backend_available():
+        modes.append('process')
+    dpath = ub.Path.appdir('ubelt/tests/futures/telemetry').ensuredir()
+    for mode in modes:
+        pool: ub.JobPool[int] = ub.JobPool(mode, max_workers=2, telemetry=True)
+        with pool:
+            for i in range(6):
+                pool.submit(_square, i)
+            failed = pool.submit(_square, 'a')
+            results = [job.result() for job in pool.jobs if job is not failed]
+            with pytest.raises(TypeError):
+                failed.result()
+        assert results == [i * i for i in range(6)]
+        telemetry = pool.telemetry
+        assert telemetry is not None
+        summary = telemetry.summary()
+        assert summary['num_jobs'] == 7
+        assert summary['num_failed'] == 1
+        assert sum(summary['run_time_hist'].values()) == 7
+        pids = {r.pid for r in telemetry.records}
+        if mode == 'process':
+            assert os.getpid() not in pids
+        else:
+            assert pids == {os.getpid()}
+        for r in telemetry.records:
+            assert r.submitted <= r.start <= r.end
+        fpath = dpath / 'trace_{}.json'.format(mode)
+        telemetry.to_chrome_trace(fpath)
+        trace = json.loads(fpath.read_text())
+        assert len(trace['traceEvents']) == 7
+        assert {e['ph'] for e in trace['traceEvents']} == {'X'}
+
+
+def test_job_pool_telemetry_queue_and_progress() -> None:
+    import time
+
+    import ubelt as ub
+
+    pool: ub.JobPool[None] = ub.JobPool(
+        'thread', max_workers=1, max_inflight=1, telemetry=True
+    )
+    with pool:
+        for _ in range(3):
+            pool.submit(time.sleep, 0.02, priority=0)
+        with ub.CaptureStdout() as cap:
+            list(pool.as_completed(desc='collect', progkw={'verbose': 3}))
+    assert 'util=' in cap.text
+    waits = sorted(r.start - r.submitted for r in pool.telemetry.records)
+    # Jobs held in the pool queue wait for the ones ahead of them
+    assert waits[-1] >= 0.03
+
+
+def _sleep_then_return(seconds: float, value: int) -> int:
+    import time
+
+    time.sleep(seconds)
+    return value
+
+
+def test_job_pool_retries() -> None:
+    import threading
+    import time
+
+    import pytest
+
+    import ubelt as ub
+
+    for mode in ['serial', 'thread', 'asyncio']:
+        lock = threading.Lock()
+        attempts = {}
+
+        def flaky(key: str, num_failures: int) -> str:
+            with lock:
+                attempts[key] = attempts.get(key, 0) + 1
+                count = attempts[key]
+            if count <= num_failures:
+                raise OSError('transient failure {}'.format(count))
+            return key
+
+        pool: ub.JobPool[str] = ub.JobPool(mode, max_workers=2, retries=2)
+        with pool:
+            ok = pool.submit(flaky, 'ok', 2)
+            bad = pool.submit(flaky, 'bad', 5)
+            once = pool.submit(flaky, 'once', 1, retries=0)
+            start = time.monotonic()
+            slow = pool.submit(flaky, 'slow', 2, backoff=0.02)
+            assert slow.result() == 'slow'
+            # Waits 0.02 then 0.04 seconds between attempts
+            assert time.monotonic() - start >= 0.05
+        assert ok.result() == 'ok'
+        with pytest.raises(OSError, match='failure 3'):
+            bad.result()
+        with pytest.raises(OSError):
+            once.result()
+        assert attempts == {'ok': 3, 'bad': 3, 'once': 1, 'slow': 3}
+
+
+def test_job_pool_job_timeout_thread() -> None:
+    import concurrent.futures
+    import threading
+    import time
+
+    import pytest
+
+    import ubelt as ub
+
+    release = threading.Event()
+    pool: ub.JobPool[object] = ub.JobPool('thread', max_workers=2)
+    start = time.monotonic()
+    with pool:
+        hung = pool.submit(release.wait, job_timeout=0.05)
+        fine = pool.submit(sum, [1, 2], job_timeout=1.0)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            hung.result()
+        assert fine.result() == 3
+        # The abandoned thread keeps running until the function returns
+        release.set()
+    assert time.monotonic() - start < 1.0
+
+
+def test_job_pool_job_timeout_process_recycles() -> None:
+    import concurrent.futures
+    import time
+
+    import pytest
+
+    import ubelt as ub
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    pool: ub.JobPool[int] = ub.JobPool(
+        'process', max_workers=2, job_timeout=1.0
+    )
+    start = time.monotonic()
+    with pool:
+        hung = pool.submit(_sleep_then_return, 30, -1, job_timeout=0.2)
+        others = [pool.submit(_sleep_then_return, 0.05, i) for i in range(6)]
+        with pytest.raises(concurrent.futures.TimeoutError):
+            hung.result()
+        # The other jobs are resubmitted to the new workers
+        assert [job.result() for job in others] == list(range(6))
+    assert time.monotonic() - start < 10
+    assert pool.executor._generation >= 1
+
+
+def test_job_pool_job_timeout_spares_plain_jobs() -> None:
+    import concurrent.futures
+    import time
+
+    import pytest
+
+    import ubelt as ub
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    # Only one job has a timeout, and the plain job is running on the other
+    # worker when it times out, so the restart waits for the plain job.
+    with ub.JobPool('process', max_workers=2) as pool:
+        plain = pool.submit(_sleep_then_return, 1.0, 1)
+        bad = pool.submit(_sleep_then_return, 30, 2, job_timeout=0.3)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            bad.result()
+        assert plain.result(timeout=20) == 1
+        deadline = time.monotonic() + 20
+        while pool.executor._generation < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.executor._generation >= 1
+
+
+def test_job_pool_process_plain_jobs_are_not_wrapped() -> None:
+    import pytest
+
+    import ubelt as ub
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    with ub.JobPool('process', max_workers=1) as pool:
+        plain = pool.submit(_sleep_then_return, 0.2, 1)
+        # Without a timeout the workers are never restarted
+        assert not pool._retrying
+        assert plain.result() == 1
+        timed = pool.submit(_sleep_then_return, 0.2, 2, job_timeout=10)
+        later = pool.submit(_sleep_then_return, 0.2, 3)
+        # Once a job can time out, plain jobs must survive a restart
+        assert later in pool._retrying
+        assert timed.result() == 2 and later.result() == 3
+
+
+def test_executor_submit_during_recycle() -> None:
+    import threading
+
+    import pytest
+
+    import ubelt as ub
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    errors = []
+    stop = threading.Event()
+    executor = ub.Executor('process', max_workers=2)
+
+    def _submit_loop() -> None:
+        while not stop.is_set():
+            try:
+                executor.submit(_square, 3)
+            except Exception as ex:
+                errors.append(ex)
+
+    with executor:
+        threads = [
+            threading.Thread(target=_submit_loop, daemon=True) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(30):
+                assert executor._recycle_workers()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        assert executor.submit(_square, 4).result() == 16
+    assert errors == []
+
+
+def test_job_pool_cancel_pending() -> None:
+    import threading
+
+    import ubelt as ub
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocker() -> bool:
+        started.set()
+        return release.wait()
+
+    pool: ub.JobPool[object] = ub.JobPool('thread', max_workers=1, retries=1)
+    with pool:
+        running = pool.submit(blocker)
+        queued = [pool.submit(sum, [i, 1]) for i in range(5)]
+        started.wait()
+        assert pool.cancel_pending() == 5
+        assert pool.cancel_pending() == 0
+        release.set()
+    assert running.result() is True
+    assert all(job.cancelled() for job in queued)
+
+
+def test_job_pool_cancel_pending_serial() -> None:
+    import concurrent.futures
+
+    import pytest
+
+    import ubelt as ub
+
+    pool: ub.JobPool[int] = ub.JobPool('serial')
+    jobs = [pool.submit(abs, -i) for i in range(3)]
+    assert pool.cancel_pending() == 3
+    # Waiting on cancelled serial jobs returns instead of hanging
+    done, not_done = concurrent.futures.wait(jobs, timeout=5)
+    assert len(done) == 3 and not not_done
+    assert all(job.cancelled() for job in pool.as_completed())
+    # Like the other modes, join reports the cancellation
+    with pytest.raises(concurrent.futures.CancelledError):
+        pool.join()
+
+
+def test_job_pool_results_ordered() -> None:
+    import ubelt as ub
+
+    pool: ub.JobPool[int] = ub.JobPool('thread', max_workers=4)
+    num = 40
+    # The first job is slow, so later results finish before it
+    pool.submit(_sleep_then_return, 0.05, 0)
+    for i in range(1, num):
+        pool.submit(_sleep_then_return, 0.001, i)
+    results = []
+    for result in pool.results():
+        if len(results) == 0:
+            # Jobs submitted while iterating are included
+            pool.submit(_sleep_then_return, 0.001, num)
+        results.append(result)
+    assert results == list(range(num + 1))
+    assert len(pool) == 0
+    pool.shutdown()
+
+
+def test_job_pool_results_window() -> None:
+    import threading
+    import time
+
+    import ubelt as ub
+
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def task(x: int) -> int:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.003)
+        with lock:
+            running[0] -= 1
+        return x
+
+    pool: ub.JobPool[int] = ub.JobPool('thread', max_workers=8)
+    pool.submit(task, 0)
+    results = []
+    max_buffered = 0
+    for result in pool.results(window=3):
+        if result == 0:
+            for i in range(1, 40):
+                pool.submit(task, i)
+        max_buffered = max(max_buffered, sum(j.done() for j in pool.jobs))
+        results.append(result)
+    assert results == list(range(40))
+    # At most 3 jobs are running or waiting to be yielded
+    assert peak[0] <= 3
+    assert max_buffered <= 4
+    pool.shutdown()
+
+
+def test_job_pool_results_unordered_and_errors() -> None:
+    import pytest
+
+    import ubelt as ub
+
+    for mode in ['serial', 'thread']:
+        pool: ub.JobPool[int] = ub.JobPool(mode, max_workers=4)
+        for i in [5, 1, 3]:
+            pool.submit(_sleep_then_return, i * 0.01, i)
+        assert sorted(pool.results(ordered=False)) == [1, 3, 5]
+        pool.submit(_square, 2)
+        pool.submit(_square, 'a')
+        pool.submit(_square, 3)
+        gen = pool.results()
+        assert next(gen) == 4
+        with pytest.raises(TypeError):
+            next(gen)
+        # The failed job was consumed, so a new iteration continues after it
+        assert list(pool.results()) == [9]
+        pool.shutdown()
+
+
 if __name__ == '__main__':
     """
     CommandLine:
@@ -421,3 +1199,197 @@ if __name__ == '__main__':
     test_as_completed_timeout()
     # import xdoctest
     # xdoctest.doctest_module(__file__)
+
+
+def test_serial_future_is_lightweight() -> None:
+    import concurrent.futures
+    import itertools as it
+
+    import pytest
+
+    import ubelt as ub
+    from ubelt.util_futures import SerialFuture
+
+    job = SerialFuture(divmod, 7, 2)
+    # Futures used only through result() never allocate a condition
+    assert job.result() == (3, 1)
+    assert job._lazy_condition is None and job._lazy_callbacks is None
+
+    failing = SerialFuture(int, 'x')
+    with pytest.raises(ValueError):
+        failing.result()
+    assert isinstance(failing.exception(), ValueError)
+
+    # The stdlib helpers still work and allocate the condition on demand
+    jobs = [SerialFuture(abs, -x) for x in range(3)]
+    done = list(concurrent.futures.as_completed(jobs))
+    assert sorted(f.result() for f in done) == [0, 1, 2]
+    assert jobs[0]._lazy_condition is not None
+
+    called = []
+    job = SerialFuture(abs, -1)
+    job.add_done_callback(called.append)
+    assert called == [job]
+    cancelled = SerialFuture(abs, -1)
+    assert cancelled.cancel() and cancelled.cancelled()
+    with pytest.raises(concurrent.futures.CancelledError):
+        cancelled.result()
+
+    # The serial map is lazy, so it works with infinite inputs
+    with ub.Executor(mode='serial') as executor:
+        results = executor.map(abs, it.count(-3))
+        assert list(it.islice(results, 5)) == [3, 2, 1, 0, 1]
+
+
+def _exit_first_time(fpath: str, value: int) -> int:
+    import os
+
+    import ubelt as ub
+
+    if not os.path.exists(fpath):
+        ub.touch(fpath)
+        os._exit(1)
+    return value
+
+
+def _hang_first_time(fpath: str, value: int) -> int:
+    import os
+    import signal
+
+    import ubelt as ub
+
+    if not os.path.exists(fpath):
+        ub.touch(fpath)
+        # Simulate a hung host, which also stops the heartbeat
+        os.kill(os.getpid(), signal.SIGSTOP)
+    return value
+
+
+def _always_exit() -> None:
+    import os
+
+    os._exit(1)
+
+
+def _cluster_available() -> bool:
+    import sys
+
+    return _process_backend_available() and sys.platform.startswith('linux')
+
+
+def test_cluster_executor_api() -> None:
+    import os
+
+    import pytest
+
+    import ubelt as ub
+
+    if not _cluster_available():
+        pytest.skip('cluster backend requires spawning local processes')
+
+    with ub.Executor(mode='cluster', max_workers=2) as executor:
+        assert executor.submit(_square, 3).result() == 9
+        assert list(executor.map(_square, range(5))) == [0, 1, 4, 9, 16]
+        assert list(executor.imap(_square, range(50))) == [
+            x * x for x in range(50)
+        ]
+        with pytest.raises(ValueError):
+            executor.submit(_pid_of, -1).result()
+        # Unpicklable tasks fail without breaking the executor
+        with pytest.raises(Exception):
+            executor.submit(lambda: 1).result()
+        pids = {pid for _, pid in executor.map(_pid_of, range(20))}
+        assert os.getpid() not in pids
+    with pytest.raises(RuntimeError):
+        executor.submit(_square, 1)
+
+    # JobPool works unchanged
+    pool: ub.JobPool[int] = ub.JobPool('cluster', max_workers=2)
+    with pool:
+        for x in range(5):
+            pool.submit(_square, x)
+        results = sorted(job.result() for job in pool.as_completed())
+        assert results == [0, 1, 4, 9, 16]
+
+    # Shared objects are sent to each worker once
+    from ubelt.util_futures import _demo_shared_lookup
+
+    table = {i: chr(i) for i in range(200)}
+    with ub.Executor('cluster', 2, shared={'table': table}) as executor:
+        handle = executor.shared['table']
+        jobs = [
+            executor.submit(_demo_shared_lookup, handle, i) for i in [97, 98]
+        ]
+        assert [job.result() for job in jobs] == ['a', 'b']
+
+    with pytest.raises(ValueError):
+        ub.Executor(mode='thread', max_workers=2, address=('127.0.0.1', 0))
+
+
+def test_cluster_executor_remote_worker() -> None:
+    import threading
+
+    import pytest
+
+    from ubelt.util_futures import ClusterExecutor, run_cluster_worker
+
+    if not _cluster_available():
+        pytest.skip('cluster backend requires spawning local processes')
+
+    # A worker that was not spawned by the executor joins over the socket
+    with ClusterExecutor(max_workers=0, heartbeat=0.1) as executor:
+        future = executor.submit(_square, 7)
+        thread = threading.Thread(
+            target=run_cluster_worker,
+            args=(executor.address, executor.authkey, 0.1),
+        )
+        thread.start()
+        assert future.result(timeout=10) == 49
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+
+def test_cluster_executor_shutdown_without_workers() -> None:
+    import concurrent.futures
+    import time
+
+    import pytest
+
+    from ubelt.util_futures import ClusterExecutor
+
+    if not _cluster_available():
+        pytest.skip('cluster backend requires spawning local processes')
+
+    # No worker ever connects, so shutdown must not wait for the task
+    executor = ClusterExecutor(max_workers=0, heartbeat=0.1)
+    future = executor.submit(_square, 3)
+    start = time.monotonic()
+    executor.shutdown()
+    assert time.monotonic() - start < 10
+    with pytest.raises(concurrent.futures.BrokenExecutor):
+        future.result(timeout=0)
+
+
+def test_cluster_executor_redispatch_on_worker_loss() -> None:
+    import pytest
+
+    import ubelt as ub
+    from ubelt.util_futures import ClusterExecutor
+
+    if not _cluster_available():
+        pytest.skip('cluster backend requires spawning local processes')
+
+    dpath = ub.Path.appdir('ubelt/tests/cluster').delete().ensuredir()
+    executor = ClusterExecutor(max_workers=2, heartbeat=0.1)
+    with executor:
+        # A worker that dies is replaced and its task runs elsewhere
+        died = executor.submit(_exit_first_time, str(dpath / 'died'), 1)
+        # A worker that hangs is dropped after missing heartbeats
+        hung = executor.submit(_hang_first_time, str(dpath / 'hung'), 2)
+        assert died.result(timeout=30) == 1
+        assert hung.result(timeout=30) == 2
+        # A task that always kills its worker eventually fails
+        doomed = executor.submit(_always_exit)
+        with pytest.raises(RuntimeError, match='lost'):
+            doomed.result(timeout=60)
+        assert executor.submit(_square, 4).result(timeout=30) == 16
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import ubelt as ub
+
+
+def test_memoize_ttl_expires() -> None:
+    import time
+
+    calls = []
+
+    @ub.memoize(ttl=0.05)
+    def compute(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    assert compute(1) == 2
+    time.sleep(0.1)
+    assert compute(1) == 2
+    assert calls == [1, 1]
+    info = compute.cache_info()  # type: ignore[attr-defined]
+    assert info.misses == 2
+    assert info.currsize == 1
+
+
+def test_memoize_lru_eviction_order() -> None:
+    calls = []
+
+    @ub.memoize(maxsize=3)
+    def compute(x: int) -> int:
+        calls.append(x)
+        return x
+
+    for x in [1, 2, 3, 1, 4, 1, 2]:
+        compute(x)
+    # 2 was evicted by 4 because 1 was used more recently
+    assert calls == [1, 2, 3, 4, 2]
+    assert list(compute.cache_info())[1:] == [5, 3, 3]  # type: ignore
+    assert len(compute.cache) == 3  # type: ignore[attr-defined]
+
+
+def test_memoize_maxsize_zero() -> None:
+    calls = []
+
+    @ub.memoize(maxsize=0)
+    def compute(x: int) -> int:
+        calls.append(x)
+        return x
+
+    compute(1)
+    compute(1)
+    assert calls == [1, 1]
+    assert compute.cache_info().currsize == 0  # type: ignore[attr-defined]
+
+
+def test_memoize_signature_keys_do_not_collide() -> None:
+    from ubelt.util_memoize import _make_signature_key
+
+    calls = []
+
+    @ub.memoize
+    def compute(*args: object, **kwargs: object) -> tuple:
+        calls.append((args, kwargs))
+        return args, kwargs
+
+    digest = _make_signature_key(([1, 2],), {})[0][1]  # type: ignore[index]
+    assert compute([1, 2]) == (([1, 2],), {})
+    assert compute(digest) == ((digest,), {})
+    assert compute(1, a=2) == ((1,), {'a': 2})
+    assert compute(1, ('a', 2)) == ((1, ('a', 2)), {})
+    assert compute(1) == ((1,), {})
+    assert compute((1,)) == (((1,),), {})
+    assert len(calls) == 6
+    # Mutating an unhashable argument produces a new key
+    items = [1, 2]
+    compute(items)
+    items.append(3)
+    compute(items)
+    assert len(calls) == 7
+
+
+def test_memoize_per_key_single_flight_stress() -> None:
+    import collections
+    import threading
+    import time
+
+    num_threads = 16
+    num_keys = 4
+    counts: collections.Counter = collections.Counter()
+    counts_lock = threading.Lock()
+    barrier = threading.Barrier(num_threads)
+
+    @ub.memoize(lock='per-key')
+    def slow(x: int) -> int:
+        with counts_lock:
+            counts[x] += 1
+        time.sleep(0.02)
+        return x * 10
+
+    results: list[int] = []
+
+    def worker(idx: int) -> None:
+        barrier.wait()
+        for x in range(num_keys):
+            results.append(slow((x + idx) % num_keys))
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(num_threads)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(results) == sorted(
+        [x * 10 for x in range(num_keys)] * num_threads
+    )
+    # Every key was computed exactly once despite the concurrent callers
+    assert counts == {x: 1 for x in range(num_keys)}
+    info = slow.cache_info()  # type: ignore[attr-defined]
+    assert info.misses == num_keys
+    assert info.hits == num_keys * (num_threads - 1)
+
+
+def test_memoize_per_key_failure_is_retried() -> None:
+    import threading
+    import time
+
+    import pytest
+
+    attempts = []
+    barrier = threading.Barrier(4)
+
+    @ub.memoize(lock='per-key')
+    def flaky(x: int) -> int:
+        attempts.append(x)
+        time.sleep(0.02)
+        if len(attempts) == 1:
+            raise RuntimeError('first attempt fails')
+        return x
+
+    errors = []
+    results = []
+
+    def worker() -> None:
+        barrier.wait()
+        try:
+            results.append(flaky(1))
+        except RuntimeError as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Only the caller that computed the failing result sees the error, the
+    # waiters retry and the first successful result is shared.
+    assert len(errors) == 1
+    assert results == [1, 1, 1]
+    assert len(attempts) == 2
+
+    with pytest.raises(KeyError):
+        ub.memoize(lock='global')
+
+
+def test_memoize_coroutine_failure_not_cached() -> None:
+    import asyncio
+
+    import pytest
+
+    attempts = []
+
+    @ub.memoize(maxsize=4, ttl=100)
+    async def flaky(x: int) -> int:
+        attempts.append(x)
+        await asyncio.sleep(0)
+        if len(attempts) == 1:
+            raise RuntimeError('first attempt fails')
+        return x
+
+    async def main() -> None:
+        with pytest.raises(RuntimeError):
+            await flaky(1)
+        assert await flaky(1) == 1
+        assert await flaky(1) == 1
+
+    asyncio.run(main())
+    assert attempts == [1, 1]
+    assert flaky.cache_info().currsize == 1  # type: ignore[attr-defined]
+
+
+def test_memoize_method_coroutine() -> None:
+    import asyncio
+
+    class Client:
+        def __init__(self, name: str) -> None:
+            self.name = name
+            self.calls = 0
+
+        @ub.memoize_method
+        async def lookup(self, key: str) -> str:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return self.name + key
+
+    async def main() -> tuple:
+        c1, c2 = Client('a'), Client('b')
+        results = await asyncio.gather(
+            c1.lookup('x'), c1.lookup('x'), c2.lookup('x')
+        )
+        return c1, c2, results
+
+    c1, c2, results = asyncio.run(main())
+    assert results == ['ax', 'ax', 'bx']
+    assert c1.calls == 1 and c2.calls == 1
+    assert asyncio.run(c1.lookup('x')) == 'ax'
+    assert c1.calls == 1
+
+
+def test_memoize_method_slots_and_eviction() -> None:
+    import gc
+
+    import pytest
+
+    calls = []
+
+    class Slotted:
+        __slots__ = ('x', '__weakref__')
+
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+        @ub.memoize_method(maxsize=2)
+        def add(self, y: int) -> int:
+            calls.append(y)
+            return self.x + y
+
+    a = Slotted(1)
+    b = Slotted(10)
+    assert [a.add(1), a.add(2), a.add(1), a.add(3), a.add(2)] == [2, 3, 2, 4, 3]
+    # 2 was evicted by 3, because 1 was used more recently
+    assert calls == [1, 2, 3, 2]
+    assert b.add(1) == 11
+    assert Slotted.add(b, 1) == 11
+    assert calls == [1, 2, 3, 2, 1]
+    assert len(Slotted.add.cache_for(a)) == 2
+
+    # The side table does not keep instances alive
+    table = Slotted.add._side_caches
+    assert len(table) == 2
+    del a
+    gc.collect()
+    assert len(table) == 1
+
+    Slotted.add.cache_clear()
+    assert len(Slotted.add.cache_for(b)) == 0
+
+    class NoWeakref:
+        __slots__ = ()
+
+        @ub.memoize_method
+        def method(self) -> int:
+            return 1
+
+    with pytest.raises(TypeError):
+        NoWeakref().method()
+
+
+def test_memoize_method_cache_clear_all_instances() -> None:
+    class Item:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @ub.memoize_method
+        def value(self) -> int:
+            self.calls += 1
+            return self.calls
+
+    items = [Item() for _ in range(3)]
+    assert [item.value() for item in items] == [1, 1, 1]
+    assert [item.value() for item in items] == [1, 1, 1]
+    Item.value.cache_clear()
+    assert [item.value() for item in items] == [2, 2, 2]
+
+
+def test_memoize_method_does_not_keep_instance_alive() -> None:
+    import gc
+    import weakref
+
+    class Node:
+        @ub.memoize_method
+        def me(self) -> Node:
+            # The cached result refers back to the instance
+            return self
+
+    obj = Node()
+    assert obj.me() is obj
+    ref = weakref.ref(obj)
+    del obj
+    gc.collect()
+    assert ref() is None
+    assert Node.me._instances.keys() == []
+
+
+def test_memoize_persist_across_wrappers() -> None:
+    import asyncio
+
+    dpath = ub.Path.appdir('ubelt/tests/memoize/persist').delete()
+    calls = []
+
+    def compute(x: int, scale: int = 1) -> int | None:
+        calls.append(x)
+        return None if x < 0 else x * scale
+
+    memo1 = ub.memoize(compute, maxsize=2, persist=True, dpath=dpath)
+    assert memo1(2, scale=3) == 6
+    assert memo1(-1) is None
+    assert memo1(2, scale=3) == 6
+    assert calls == [2, -1]
+
+    # A fresh in-memory tier reads from the disk tier, including None results
+    memo2 = ub.memoize(compute, persist=True, dpath=dpath)
+    assert memo2(2, scale=3) == 6
+    assert memo2(-1) is None
+    assert memo2(2, scale=4) == 8
+    assert calls == [2, -1, 2]
+
+    async def acompute(x: int) -> int:
+        calls.append(x)
+        return x + 1
+
+    amemo1 = ub.memoize(acompute, persist=True, dpath=dpath)
+    amemo2 = ub.memoize(acompute, persist=True, dpath=dpath)
+    assert asyncio.run(amemo1(10)) == 11
+    assert asyncio.run(amemo2(10)) == 11
+    assert calls == [2, -1, 2, 10]
+
+
+def _process_backend_available() -> bool:
+    import multiprocessing as mp
+
+    try:
+        ctx = mp.get_context()
+        ctx.Lock()
+    except (PermissionError, OSError):
+        return False
+    else:
+        return True
+
+
+_SHARED_CALLS: list[int] = []
+
+
+def _shared_square(x: int) -> int:
+    _SHARED_CALLS.append(x)
+    return x * x
+
+
+def _shared_worker(x: int, store: ub.SharedCache) -> int:
+    return ub.memoize(_shared_square, shared=store)(x)
+
+
+def test_memoize_shared_across_processes() -> None:
+    import pytest
+
+    if not _process_backend_available():
+        pytest.skip('process backend not permitted')
+
+    with ub.SharedCache() as store:
+        with ub.Executor(mode='process', max_workers=2) as executor:
+            jobs = [executor.submit(_shared_worker, x, store) for x in [2, 3]]
+            assert [job.result() for job in jobs] == [4, 9]
+        assert len(store) == 2
+        # Results computed by the workers are reused by this process
+        shared_square = ub.memoize(_shared_square, shared=store)
+        assert shared_square(2) == 4 and shared_square(3) == 9
+        assert _SHARED_CALLS == []
+        assert shared_square(4) == 16
+        assert _SHARED_CALLS == [4]
+        assert len(store) == 3
+
+
+def test_shared_cache_limits() -> None:
+    import pytest
+
+    if not _process_backend_available():
+        pytest.skip('process backend not permitted')
+
+    with pytest.raises(KeyError):
+        ub.SharedCache(serializer='marshal')
+
+    with ub.SharedCache(maxsize=2, max_item_bytes=64) as store:
+        assert store.save('a', 1)
+        assert not store.save('big', 'x' * 100)
+        assert not store.save('lambda', lambda: None)
+        assert store.save('b', 2)
+        assert not store.save('c', 3)
+        assert store.load('a') == (True, 1)
+        assert store.load('c') == (False, None)
+        store.clear()
+        assert len(store) == 0
+
+    with ub.SharedCache(serializer='json') as store:
+        assert store.save('a', {'b': [1, 2]})
+        assert store.load('a') == (True, {'b': [1, 2]})
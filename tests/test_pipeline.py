@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import os
+
+import ubelt as ub
+
+
+def _process_backend_available() -> bool:
+    import multiprocessing as mp
+
+    try:
+        ctx = mp.get_context()
+        ctx.Lock()
+    except (PermissionError, OSError):
+        return False
+    else:
+        return True
+
+
+def _write_upper(src: str | os.PathLike, dst: str | os.PathLike) -> None:
+    ub.Path(dst).write_text(ub.Path(src).read_text().upper())
+
+
+def _fail() -> None:
+    raise RuntimeError('stage failed')
+
+
+def _demo_pipeline(dpath: ub.Path, **kwargs) -> ub.Pipeline:
+    src = dpath / 'src.txt'
+    if not src.exists():
+        src.write_text('text')
+    pipe = ub.Pipeline(dpath / 'stamps', verbose=0, **kwargs)
+    for idx in range(4):
+        dst = dpath / 'dst{}.txt'.format(idx)
+        pipe.add(
+            ub.Stage(
+                'upper{}'.format(idx),
+                _write_upper,
+                args=[src, dst],
+                inputs=[src],
+                products=[dst],
+            )
+        )
+    return pipe
+
+
+def test_pipeline_external_input_change() -> None:
+    dpath = ub.Path.appdir('ubelt/tests/pipeline/external').delete()
+    dpath.ensuredir()
+    pipe = _demo_pipeline(dpath, mode='thread', max_workers=4)
+    result = pipe.run()
+    assert set(result.values()) == {'ran'}
+    assert (dpath / 'dst3.txt').read_text() == 'TEXT'
+    assert set(pipe.run().values()) == {'skipped'}
+    # Changing an input that is not produced by a stage reruns its consumers
+    (dpath / 'src.txt').write_text('new text')
+    assert set(pipe.status().values()) == {'no_cert'}
+    assert set(pipe.run().values()) == {'ran'}
+    assert (dpath / 'dst3.txt').read_text() == 'NEW TEXT'
+    # Force reruns everything
+    assert set(pipe.run(force=True).values()) == {'ran'}
+
+
+def test_pipeline_process_mode() -> None:
+    import pytest
+
+    if not _process_backend_available():
+        pytest.skip('process backend unavailable')
+    dpath = ub.Path.appdir('ubelt/tests/pipeline/process').delete()
+    dpath.ensuredir()
+    pipe = _demo_pipeline(dpath, mode='process', max_workers=2)
+    assert set(pipe.run().values()) == {'ran'}
+    assert set(pipe.run().values()) == {'skipped'}
+
+
+def test_pipeline_failure_blocks_downstream() -> None:
+    import pytest
+
+    dpath = ub.Path.appdir('ubelt/tests/pipeline/failure').delete()
+    dpath.ensuredir()
+    pipe = _demo_pipeline(dpath, mode='thread', max_workers=2)
+    pipe.add(ub.Stage('broken', _fail))
+    after = dpath / 'after.txt'
+    pipe.add(
+        ub.Stage(
+            'after',
+            _write_upper,
+            args=[dpath / 'src.txt', after],
+            products=[after],
+            depends=['broken'],
+        )
+    )
+    with pytest.raises(RuntimeError):
+        pipe.run()
+    assert not after.exists()
+
+
+def test_pipeline_bad_graph() -> None:
+    import pytest
+
+    pipe = ub.Pipeline('.')
+    pipe.add(ub.Stage('a', print, depends=['missing']))
+    with pytest.raises(KeyError):
+        pipe.order()
+    with pytest.raises(KeyError):
+        pipe.add(ub.Stage('a', print))
+
+
+def _negate(x: int) -> int:
+    return -x
+
+
+def _raise_on_three(x: int) -> int:
+    if x == 3:
+        raise ValueError('bad item')
+    return x
+
+
+def test_stream_pipeline_ordered_and_unordered() -> None:
+    import time
+
+    def slow_identity(x):
+        time.sleep(0.001 * (x % 3))
+        return x
+
+    pipe = ub.StreamPipeline(range(50)).map(slow_identity, workers=4)
+    assert list(pipe) == list(range(50))
+    unordered = pipe.map(slow_identity, workers=4, ordered=False)
+    assert sorted(unordered) == list(range(50))
+    # Pipelines are reusable and each iteration starts over
+    assert list(pipe) == list(range(50))
+
+
+def test_stream_pipeline_inline_steps() -> None:
+    pipe = (
+        ub.StreamPipeline(range(10))
+        .map(lambda x: x + 1)
+        .filter(lambda x: x % 2)
+        .batch(2)
+    )
+    assert list(pipe) == [[1, 3], [5, 7], [9]]
+    assert list(ub.StreamPipeline([0, 1, '', 'a']).filter()) == [1, 'a']
+
+
+def test_stream_pipeline_process_stage() -> None:
+    if not _process_backend_available():
+        import pytest
+
+        pytest.skip('process backend not permitted')
+    pipe = (
+        ub.StreamPipeline(range(20))
+        .map(abs, workers=2, mode='thread')
+        .map(_negate, workers=2, mode='process')
+        .batch(8)
+    )
+    assert list(pipe) == [
+        list(range(0, -8, -1)),
+        list(range(-8, -16, -1)),
+        list(range(-16, -20, -1)),
+    ]
+
+
+def test_stream_pipeline_error_propagates() -> None:
+    import pytest
+
+    pipe = ub.StreamPipeline(range(10)).map(_raise_on_three, workers=2)
+    got = []
+    with pytest.raises(ValueError, match='bad item'):
+        for item in pipe:
+            got.append(item)
+    assert got == [0, 1, 2]
+
+
+def test_stream_pipeline_backpressure_and_close() -> None:
+    import itertools as it
+    import threading
+    import time
+
+    num_pulled = 0
+    lock = threading.Lock()
+
+    def source():
+        nonlocal num_pulled
+        for x in it.count():
+            with lock:
+                num_pulled += 1
+            yield x
+
+    pipe = ub.StreamPipeline(source()).map(
+        abs, workers=2, buffer=4, chunksize=1
+    )
+    stream = iter(pipe)
+    assert next(stream) == 0
+    before = threading.active_count()
+    # Give the stage time to run ahead as far as it is allowed to
+    time.sleep(0.3)
+    # The buffer and the executor's inflight chunks bound how far ahead of
+    # the consumer the stage can get on an infinite source.
+    assert num_pulled < 20
+    stream.close()
+    assert threading.active_count() < before
+
+
+def test_stream_pipeline_bad_args() -> None:
+    import pytest
+
+    with pytest.raises(ValueError):
+        ub.StreamPipeline([]).batch(0)
+    with pytest.raises(ValueError):
+        ub.StreamPipeline([]).map(abs, buffer=0)
@@ -95,6 +95,7 @@ __submodules__ = {
     'util_memoize': None,
     'util_mixins': None,
     'util_path': None,
+    'util_pipeline': None,
     'util_platform': None,
     'util_str': None,
     'util_stream': None,
@@ -127,6 +128,7 @@ from ubelt import (
     util_memoize,
     util_mixins,
     util_path,
+    util_pipeline,
     util_platform,
     util_repr,
     util_str,
@@ -270,6 +272,7 @@ from ubelt.util_list import (
     unique_flags,
 )
 from ubelt.util_memoize import (
+    SharedCache,
     memoize,
     memoize_method,
     memoize_property,
@@ -287,6 +290,11 @@ from ubelt.util_path import (
     shrinkuser,
     userhome,
 )
+from ubelt.util_pipeline import (
+    Pipeline,
+    Stage,
+    StreamPipeline,
+)
 from ubelt.util_platform import (
     DARWIN,
     LINUX,
@@ -344,9 +352,13 @@ __all__ = [
     'OrderedSet',
     'POSIX',
     'Path',
+    'Pipeline',
     'ProgIter',
     'ReprExtensions',
     'SetDict',
+    'SharedCache',
+    'Stage',
+    'StreamPipeline',
     'TeeStringIO',
     'TempDir',
     'Timer',
@@ -463,6 +475,7 @@ __all__ = [
     'util_memoize',
     'util_mixins',
     'util_path',
+    'util_pipeline',
     'util_platform',
     'util_repr',
     'util_str',
@@ -825,6 +825,13 @@ class CacheStamp:
     that by setting ``hasher=None``, running and verifying checksums can be
     disabled.
 
+    A product can also be a directory, in which case it is fingerprinted by a
+    recursive manifest of the files it contains. The manifest stores paths
+    relative to the directory, so moving it does not expire the stamp on its
+    own. The stamp expires if a file
+    is added, removed, or modified, and :func:`CacheStamp.manifest_diff`
+    reports exactly which files changed.
+
     If the user knows what the hash of the file should be this can be specified
     to prevent renewal of the stamp unless these match the files on disk. This
     can be useful for security purposes.
@@ -832,9 +839,18 @@ class CacheStamp:
     The stamp can also be set to expire at a specified time or after a
     specified duration using the ``expires`` argument.
 
+    Hashing large products can be expensive, so the ``verify`` argument
+    controls when the checksum is recomputed. The default ``'hash'`` policy
+    always rehashes. The ``'stat'`` policy trusts the recorded size, mtime, and
+    inode of each product and never rehashes. The ``'hash-if-stat-changed'``
+    policy only rehashes products whose stats differ from the certificate, and
+    the ``'periodic'`` policy behaves like ``'stat'`` but rehashes once every
+    ``audit_interval`` seconds.
+
     Notes:
         The size, mtime, and hash mechanism is similar to how Makefile and redo
-        caches work.
+        caches work. See :class:`ubelt.util_pipeline.Pipeline` to chain
+        multiple stamps together into a make-like pipeline.
 
     Attributes:
         cacher (Cacher): underlying cacher object
@@ -863,6 +879,9 @@ class CacheStamp:
     hasher: str | None
     expires: str | int | datetime_mod.datetime | datetime_mod.timedelta | None
     hash_prefix: str | list[str] | None
+    verify: str
+    audit_interval: int | float | datetime_mod.timedelta | None
+    workers: int
 
     def __init__(
         self,
@@ -885,6 +904,9 @@ class CacheStamp:
         | datetime_mod.timedelta
         | None = None,
         ext: str = '.pkl',
+        verify: str = 'hash',
+        audit_interval: int | float | datetime_mod.timedelta | None = None,
+        workers: int = 0,
     ) -> None:
         """
         Args:
@@ -896,7 +918,8 @@ class CacheStamp:
 
             product (str | os.PathLike[str] | collections.abc.Sequence[str | os.PathLike[str]] | None):
                 Path or paths that we expect the computation to produce. If
-                specified the hash of the paths are stored.
+                specified the hash of the paths are stored. Directories are
+                expanded into the files they recursively contain.
 
             hasher (str):
                 The type of hasher used to compute the file hash of product.
@@ -927,14 +950,37 @@ class CacheStamp:
 
             hash_prefix (str | list[str] | None):
                 If specified, we verify that these match the hash(s) of the
-                product(s) in the stamp certificate.
+                product(s) in the stamp certificate. If any product is a
+                directory, these correspond to the expanded files.
 
             ext (str):
                 File extension for the cache format. Can be ``'.pkl'`` or
                 ``'.json'``. Defaults to ``'.pkl'``.
 
+            verify (str):
+                Policy that determines when product hashes are recomputed by
+                :func:`CacheStamp.expired`. Can be ``'hash'``, ``'stat'``,
+                ``'hash-if-stat-changed'``, or ``'periodic'``. Non-hash
+                policies trust a product if its size, mtime, and inode match
+                the certificate. Has no effect if ``hasher`` is None.
+                Defaults to ``'hash'``.
+
+            audit_interval (int | float | datetime.timedelta | None):
+                Only used when ``verify='periodic'``. The number of seconds
+                after which a stat-valid product is rehashed anyway.
+
+            workers (int):
+                Number of threads used to hash the products. If 0, products
+                are hashed serially. Defaults to 0.
+
             cfgstr (str | None): DEPRECATED.
         """
+        if verify not in _VERIFY_POLICIES:
+            raise KeyError(
+                'verify={!r} must be one of {}'.format(verify, _VERIFY_POLICIES)
+            )
+        if verify == 'periodic' and audit_interval is None:
+            raise ValueError("verify='periodic' requires an audit_interval")
         self.cacher = Cacher(
             fname,
             cfgstr=cfgstr,
@@ -949,13 +995,18 @@ class CacheStamp:
         self.hasher = hasher
         self.expires = expires
         self.hash_prefix = hash_prefix
+        self.verify = verify
+        self.audit_interval = audit_interval
+        self.workers = workers
 
         # The user can modify these if they want to disable size or mtime
         # checks for expiration. Not sure if I want to expose it at the
-        # top level API yet or not.
+        # top level API yet or not. Note: the inode is only checked by the
+        # non-hash verify policies.
         self._expire_checks = {
             'size': True,
             'mtime': True,
+            'inode': True,
             'hash': True,
         }
 
@@ -1028,8 +1079,10 @@ class CacheStamp:
         Compute summary info about each product on disk.
         """
         products = self._rectify_products(product)
+        assert products is not None
         product_info: dict[str, typing.Any] = {}
-        product_info.update(self._product_file_stats())
+        files, product_stats, manifest = _expand_products(products)
+        product_info.update(_file_stats_info(product_stats, manifest))
         if self.hasher is None:
             hasher_name = None
         else:
@@ -1049,7 +1102,11 @@ class CacheStamp:
             else:
                 hasher_name = self.hasher
         product_info['hasher'] = hasher_name
-        product_info['hash'] = self._product_file_hash(products)
+        product_info['hash'] = self._hash_files(files)
+        if hasher_name is not None:
+            import time
+
+            product_info['audit_time'] = time.time()
         return product_info
 
     def _product_file_stats(
@@ -1057,15 +1114,76 @@ class CacheStamp:
         product: (
             str | os.PathLike | typing.Sequence[str | os.PathLike] | None
         ) = None,
-    ) -> dict[str, list[float] | list[int]]:
+        context: _ExpireContext | None = None,
+    ) -> dict[str, list[typing.Any]]:
+        """
+        Stat each product. If any product is a directory, the stats
+        correspond to the files it contains and the ``'files'`` key holds
+        the manifest from :func:`_expand_products`.
+        """
         products = self._rectify_products(product)
         assert products is not None
-        product_stats = [p.stat() for p in products]
-        product_file_stats = {
-            'mtime': [stat.st_mtime for stat in product_stats],
-            'size': [stat.st_size for stat in product_stats],
-        }
-        return product_file_stats
+        _, product_stats, manifest = _expand_products(products, context)
+        return _file_stats_info(product_stats, manifest)
+
+    def _check_file_stats(
+        self,
+        certificate: dict[str, typing.Any],
+        product_file_stats: dict[str, typing.Any],
+    ) -> str | None:
+        """
+        Compare the stats of the products on disk to the ones recorded in the
+        certificate. Stats that do not exist in the certificate (i.e. it was
+        written by an older ubelt version) are ignored.
+
+        Returns:
+            str | None: the reason the stats differ or None if they agree
+        """
+        # The set of files only changes if a directory product has an added or
+        # removed file.
+        cert_files = certificate.get('files', None)
+        if cert_files != product_file_stats.get('files', None):
+            return 'manifest_diff'
+        # The stronger nanosecond mtime and inode checks are only used when
+        # we are trusting the stats instead of the hash.
+        trust_stats = self.verify != 'hash' and self.hasher is not None
+        sizes = certificate.get('size', None)
+        if sizes is not None and self._expire_checks['size']:
+            if sizes != product_file_stats['size']:
+                return 'size_diff'
+        if self._expire_checks['mtime']:
+            mtimes_ns = certificate.get('mtime_ns', None)
+            if trust_stats and mtimes_ns is not None:
+                if mtimes_ns != product_file_stats['mtime_ns']:
+                    return 'mtime_diff'
+            else:
+                mtimes = certificate.get('mtime', None)
+                if mtimes is not None:
+                    if mtimes != product_file_stats['mtime']:
+                        return 'mtime_diff'
+        if trust_stats and self._expire_checks['inode']:
+            inodes = certificate.get('inode', None)
+            if inodes is not None:
+                if inodes != product_file_stats['inode']:
+                    return 'inode_diff'
+        return None
+
+    def _audit_due(self, certificate: dict[str, typing.Any]) -> bool:
+        """
+        Check if a ``verify='periodic'`` stamp should rehash its products.
+        """
+        import datetime as datetime_mod
+        import time
+
+        audit_time = certificate.get('audit_time', None)
+        if audit_time is None:
+            return True
+        interval = self.audit_interval
+        if interval is None:
+            return False
+        if isinstance(interval, datetime_mod.timedelta):
+            interval = interval.total_seconds()
+        return (time.time() - audit_time) >= interval
 
     def _product_file_hash(
         self,
@@ -1073,18 +1191,112 @@ class CacheStamp:
             str | os.PathLike | typing.Sequence[str | os.PathLike] | None
         ) = None,
     ) -> list[str] | None:
+        """
+        Hash each product. The order of the returned hashes always
+        corresponds to the order of the products, even if they are computed
+        in parallel.
+
+        Example:
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('ubelt/tests/cache-stamp-workers')
+            >>> dpath.delete().ensuredir()
+            >>> products = [dpath / f'product{i}.txt' for i in range(10)]
+            >>> for fpath in products:
+            >>>     fpath.write_text(fpath.name)
+            >>> serial = ub.CacheStamp('stamp', dpath=dpath, product=products)
+            >>> threaded = ub.CacheStamp('stamp', dpath=dpath, product=products,
+            >>>                          workers=4)
+            >>> hashes = threaded._product_file_hash()
+            >>> assert hashes == serial._product_file_hash()
+            >>> assert hashes[3] == ub.hash_file(products[3], hasher='sha1')
+        """
+        if self.hasher is None:
+            return None
+        products = self._rectify_products(product)
+        assert products is not None
+        files, _, _ = _expand_products(products)
+        return self._hash_files(files)
+
+    def _hash_files(self, files: list[typing.Any]) -> list[str] | None:
+        """
+        Hash a list of paths that are known to be files.
+        """
         if self.hasher is None:
             product_file_hash = None
-        else:
-            from ubelt.util_hash import hash_file
+        elif self.workers > 0 and len(files) > 1:
+            from ubelt.util_futures import JobPool
 
-            products = self._rectify_products(product)
-            assert products is not None
-            product_file_hash = [
-                hash_file(p, hasher=self.hasher, base='hex') for p in products
-            ]
+            with JobPool('thread', max_workers=self.workers) as pool:
+                jobs = [pool.submit(self._hash_one_product, p) for p in files]
+                product_file_hash = [job.result() for job in jobs]
+        else:
+            product_file_hash = list(map(self._hash_one_product, files))
         return product_file_hash
 
+    def _hash_one_product(self, fpath: str | os.PathLike) -> str:
+        from ubelt.util_hash import hash_file
+
+        assert self.hasher is not None
+        return hash_file(fpath, hasher=self.hasher, base='hex')
+
+    def _find_hash_mismatch(
+        self,
+        products: list[typing.Any],
+        certificate_hash: list[str] | None,
+    ) -> tuple[int, str | None] | None:
+        """
+        Hash products until one of them disagrees with the certificate.
+
+        Unlike :func:`CacheStamp._product_file_hash`, this stops as soon as
+        the first mismatch is found and cancels any pending work.
+
+        Returns:
+            Tuple[int, str | None] | None:
+                The index and hash of the first product found to disagree with
+                the certificate, or None if all hashes agree.
+
+        Example:
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('ubelt/tests/cache-stamp-mismatch')
+            >>> dpath.delete().ensuredir()
+            >>> products = [dpath / f'product{i}.txt' for i in range(10)]
+            >>> for fpath in products:
+            >>>     fpath.write_text(fpath.name)
+            >>> self = ub.CacheStamp('stamp', dpath=dpath, product=products,
+            >>>                      workers=4)
+            >>> cert = self.renew()
+            >>> assert self._find_hash_mismatch(products, cert['hash']) is None
+            >>> products[7].write_text('corrupted')
+            >>> idx, _ = self._find_hash_mismatch(products, cert['hash'])
+            >>> assert idx == 7
+        """
+        if self.hasher is None:
+            return None if certificate_hash is None else (0, None)
+        if certificate_hash is None or len(certificate_hash) != len(products):
+            return (0, None)
+        if self.workers > 0 and len(products) > 1:
+            from ubelt.util_futures import JobPool
+
+            with JobPool('thread', max_workers=self.workers) as pool:
+                job_to_index = {
+                    pool.submit(self._hash_one_product, p): idx
+                    for idx, p in enumerate(products)
+                }
+                for job in pool.as_completed():
+                    idx = job_to_index[job]
+                    product_hash = job.result()
+                    if product_hash != certificate_hash[idx]:
+                        # Dont wait for hashes we no longer need.
+                        for other in job_to_index:
+                            other.cancel()
+                        return (idx, product_hash)
+        else:
+            for idx, p in enumerate(products):
+                product_hash = self._hash_one_product(p)
+                if product_hash != certificate_hash[idx]:
+                    return (idx, product_hash)
+        return None
+
     def expired(
         self,
         cfgstr: typing.Any | None = None,
@@ -1196,6 +1408,114 @@ class CacheStamp:
             return 'disabled'
 
         certificate = self._get_certificate(cfgstr=cfgstr)
+        return self._check_expired(certificate, cfgstr=cfgstr, product=product)
+
+    @classmethod
+    def expired_many(
+        cls,
+        stamps: typing.Iterable[CacheStamp],
+        workers: int = 0,
+    ) -> list[bool | str]:
+        """
+        Check if many stamps are expired at once.
+
+        This is equivalent to ``[s.expired() for s in stamps]``, but the
+        certificates are read concurrently, products shared between stamps
+        are only stat-ed (or walked) once, and the current time is only
+        computed once.
+
+        Args:
+            stamps (Iterable[CacheStamp]): the stamps to check
+
+            workers (int):
+                Number of threads used to read certificates, stat products,
+                and check stamps. If 0, work is done serially. Defaults to 0.
+
+        Returns:
+            List[bool | str]:
+                The result of :func:`CacheStamp.expired` for each stamp in
+                the same order as the input.
+
+        Example:
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('ubelt/tests/cache-stamp-many')
+            >>> dpath.delete().ensuredir()
+            >>> shared = dpath / 'shared.txt'
+            >>> shared.write_text('shared input')
+            >>> stamps = []
+            >>> for idx in range(6):
+            >>>     product = dpath / f'product{idx}.txt'
+            >>>     product.write_text(f'product {idx}')
+            >>>     stamp = ub.CacheStamp(f'stamp{idx}', dpath=dpath,
+            >>>                           depends=idx, product=[shared, product])
+            >>>     if idx != 3:
+            >>>         stamp.renew()
+            >>>     stamps.append(stamp)
+            >>> (dpath / 'product5.txt').write_text('modified product')
+            >>> reasons = ub.CacheStamp.expired_many(stamps, workers=4)
+            >>> print(reasons)
+            [False, False, False, 'no_cert', False, 'size_diff']
+            >>> assert reasons == [s.expired() for s in stamps]
+        """
+        from ubelt.util_futures import Executor
+
+        stamps = list(stamps)
+        context = _ExpireContext()
+        results: list[bool | str] = ['disabled'] * len(stamps)
+        enabled_idxs = [
+            idx for idx, stamp in enumerate(stamps) if stamp.cacher.enabled
+        ]
+        mode = 'serial' if workers == 0 else 'thread'
+        with Executor(mode=mode, max_workers=workers) as executor:
+            certificates = list(
+                executor.map(
+                    lambda idx: stamps[idx]._get_certificate(), enabled_idxs
+                )
+            )
+
+            # Stat each unique product exactly once
+            unique_products = {}
+            for idx, certificate in zip(enabled_idxs, certificates):
+                if certificate is not None:
+                    products = stamps[idx]._rectify_products()
+                    for p in products or []:
+                        unique_products[os.fspath(p)] = p
+            for _ in executor.map(context.prefetch, unique_products.values()):
+                pass
+
+            # Products are now cached, so only hashing does any real IO
+            def _check(idx: int, certificate: dict | None) -> bool | str:
+                return stamps[idx]._check_expired(certificate, context=context)
+
+            reasons = executor.map(_check, enabled_idxs, certificates)
+            for idx, reason in zip(enabled_idxs, reasons):
+                results[idx] = reason
+        return results
+
+    def _check_expired(
+        self,
+        certificate: dict[str, typing.Any] | None,
+        cfgstr: typing.Any | None = None,
+        product: typing.Any | None = None,
+        context: _ExpireContext | None = None,
+    ) -> bool | str:
+        """
+        The part of :func:`CacheStamp.expired` that runs after the
+        certificate is loaded.
+
+        Args:
+            certificate (Dict | None): the loaded certificate
+
+            cfgstr (Any): DEPRECATED
+
+            product (Any): DEPRECATED
+
+            context (_ExpireContext | None):
+                shared state that caches the current time and file stats
+                between multiple stamps.
+        """
+        if context is None:
+            context = _ExpireContext()
         if certificate is None:
             # We don't have a certificate, so we are expired
             err = 'no_cert'
@@ -1205,12 +1525,8 @@ class CacheStamp:
 
         expires = certificate.get('expires', None)
         if expires is not None:
-            from ubelt.util_time import timeparse
-
             # Need to add in the local timezone to compare against the cert.
-            now = _localnow()
-            expires_abs = timeparse(expires)
-            if now >= expires_abs:
+            if context.now >= context.timeparse(expires):
                 # We are expired
                 err = 'expired_cert'
                 if self.cacher.verbose > 0:  # pragma: nobranch
@@ -1221,7 +1537,7 @@ class CacheStamp:
         if products is None:
             # We don't have a product to check, so assume not expired
             return False
-        elif not all(map(exists, products)):
+        elif not all(context.stat(p) is not None for p in products):
             # We are expired if the expected product does not exist
             err = 'missing_products'
             if self.cacher.verbose > 0:  # pragma: nobranch
@@ -1231,38 +1547,78 @@ class CacheStamp:
             # First test to see if the size or mtime of the files has changed
             # as a potentially quicker check. If sizes or mtimes do not exist
             # in the certificate (old ubelt version), then ignore them.
-            product_file_stats = self._product_file_stats()
-            sizes = certificate.get('size', None)
-            if sizes is not None and self._expire_checks['size']:
-                if sizes != product_file_stats['size']:
-                    # The sizes are different, we are expired
-                    err = 'size_diff'
-                    if self.cacher.verbose > 0:  # pragma: nobranch
-                        print('[cacher] stamp expired {}'.format(err))
-                    return err
-            mtimes = certificate.get('mtime', None)
-            if mtimes is not None and self._expire_checks['mtime']:
-                if mtimes != product_file_stats['mtime']:
-                    # The sizes are different, we are expired
-                    err = 'mtime_diff'
-                    if self.cacher.verbose > 0:  # pragma: nobranch
-                        print('[cacher] stamp expired {}'.format(err))
-                    return err
+            product_file_stats = self._product_file_stats(products, context)
+            stat_err = self._check_file_stats(certificate, product_file_stats)
+            verify = self.verify if self.hasher is not None else 'hash'
+            # A different size always means the content changed, but other
+            # stats can be rechecked with the hash in this mode.
+            recheck_stats = verify == 'hash-if-stat-changed' and stat_err in {
+                'mtime_diff',
+                'inode_diff',
+            }
+            if stat_err is not None and not recheck_stats:
+                err = stat_err
+                if self.cacher.verbose > 0:  # pragma: nobranch
+                    if 'files' in product_file_stats or 'files' in certificate:
+                        diff = _diff_file_stats(
+                            certificate, product_file_stats, products
+                        )
+                        print('[cacher] manifest diff {}'.format(diff))
+                    print('[cacher] stamp expired {}'.format(err))
+                return err
 
             cert_err: str | None = self._check_certificate_hashes(certificate)
             if cert_err:
                 return cert_err
 
+            if verify == 'hash':
+                needs_hash = True
+            elif verify == 'periodic':
+                needs_hash = self._audit_due(certificate)
+            else:
+                needs_hash = recheck_stats
+
             # We are expired if the hash of the existing product data
             # does not match the expected hash in the certificate
-            if self._expire_checks['hash']:
+            if needs_hash and self._expire_checks['hash']:
+                files, _, _ = _expand_products(products, context)
                 certificate_hash = certificate.get('hash', None)
-                product_file_hash = self._product_file_hash(products)
-                if product_file_hash != certificate_hash:
+                if recheck_stats and certificate_hash is not None:
+                    # Only the files with changed stats need to be rehashed.
+                    diff = _diff_file_stats(
+                        certificate, product_file_stats, products
+                    )
+                    changed = set(diff['modified'])
+                    keys = _manifest_keys(
+                        product_file_stats.get('files', None), products
+                    )
+                    check_idxs = [
+                        idx for idx, key in enumerate(keys) if key in changed
+                    ]
+                else:
+                    check_idxs = list(range(len(files)))
+                mismatch = self._find_hash_mismatch(
+                    [files[idx] for idx in check_idxs],
+                    None
+                    if certificate_hash is None
+                    or len(certificate_hash) != len(files)
+                    else [certificate_hash[idx] for idx in check_idxs],
+                )
+                if mismatch is not None:
                     if self.cacher.verbose > 0:  # pragma: nobranch
+                        idx = check_idxs[mismatch[0]] if check_idxs else 0
+                        product_hash = mismatch[1]
+                        expected_hash = (
+                            None
+                            if certificate_hash is None
+                            or idx >= len(certificate_hash)
+                            else certificate_hash[idx]
+                        )
                         print(
-                            'invalid hash value (expected "{}", got "{}")'.format(
-                                product_file_hash, certificate_hash
+                            'invalid hash value for {} (expected "{}", got "{}")'.format(
+                                files[idx] if files else None,
+                                expected_hash,
+                                product_hash,
                             )
                         )
                     # The hash is different, we are expired
@@ -1270,10 +1626,63 @@ class CacheStamp:
                     if self.cacher.verbose > 0:  # pragma: nobranch
                         print('[cacher] stamp expired {}'.format(err))
                     return err
+                if verify != 'hash':
+                    # The content is unchanged, so record the current stats
+                    # and audit time to avoid rehashing on the next check.
+                    import time
+
+                    certificate.update(product_file_stats)
+                    certificate['audit_time'] = time.time()
+                    self.cacher.save(certificate, cfgstr=cfgstr)
 
         # All tests passed, we are not expired
         return False
 
+    def manifest_diff(self) -> dict[str, list[str]] | None:
+        """
+        Report which product files changed since the stamp was renewed.
+
+        Files are compared by their size and modification time, so this does
+        not read file contents. This is most useful when a product is a
+        directory. Files in a directory product are named relative to it,
+        and are prefixed by its name if the stamp has several products.
+
+        Returns:
+            Dict[str, List[str]] | None:
+                A dictionary with the ``'added'``, ``'removed'``, and
+                ``'modified'`` files, or None if there is no certificate.
+
+        Example:
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('ubelt/tests/cache-stamp-manifest')
+            >>> dpath.delete().ensuredir()
+            >>> product = (dpath / 'outputs').ensuredir()
+            >>> (product / 'sub').ensuredir()
+            >>> (product / 'a.txt').write_text('a')
+            >>> (product / 'sub' / 'b.txt').write_text('b')
+            >>> self = ub.CacheStamp('manifest', dpath=dpath, product=product)
+            >>> cert = self.renew()
+            >>> assert not self.expired()
+            >>> print(cert['files'])
+            [['a.txt', 'sub/b.txt']]
+            >>> (product / 'sub' / 'b.txt').write_text('bb')
+            >>> (product / 'sub' / 'c.txt').write_text('c')
+            >>> (product / 'a.txt').unlink()
+            >>> assert self.expired() == 'manifest_diff'
+            >>> # Files are named relative to their directory product
+            >>> print(ub.urepr(self.manifest_diff(), nl=0))
+            {'added': ['sub/c.txt'], 'removed': ['a.txt'], 'modified': ['sub/b.txt']}
+        """
+        certificate = self._get_certificate()
+        if certificate is None:
+            return None
+        products = self._rectify_products()
+        if products is None:
+            products = []
+        products = [p for p in products if exists(p)]
+        product_file_stats = self._product_file_stats(products)
+        return _diff_file_stats(certificate, product_file_stats, products)
+
     def _check_certificate_hashes(
         self, certificate: dict[str, typing.Any]
     ) -> str | None:
@@ -1450,6 +1859,270 @@ class CacheStamp:
         return certificate
 
 
+_VERIFY_POLICIES = ('hash', 'stat', 'hash-if-stat-changed', 'periodic')
+
+
+def _walk_files(
+    root: str | os.PathLike,
+) -> typing.Iterator[tuple[str, os.stat_result]]:
+    """
+    Recursively yield each file in a directory and its stat result using a
+    single :func:`os.scandir` pass per directory. The order is deterministic:
+    the files in a directory are sorted by name and are followed by the
+    contents of its sorted subdirectories. Symlinks to files are reported
+    with the stat of their target. Symlinks to directories are not followed
+    and, like broken symlinks, are skipped.
+
+    Example:
+        >>> from ubelt.util_cache import _walk_files
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/walk-files').delete().ensuredir()
+        >>> (dpath / 'b' / 'c').ensuredir()
+        >>> (dpath / 'b' / 'c' / 'f2.txt').write_text('2')
+        >>> (dpath / 'a.txt').write_text('1')
+        >>> (dpath / 'b' / 'f3.txt').write_text('33')
+        >>> items = list(_walk_files(dpath))
+        >>> print([ub.Path(p).relative_to(dpath).as_posix() for p, _ in items])
+        ['a.txt', 'b/f3.txt', 'b/c/f2.txt']
+        >>> print([st.st_size for _, st in items])
+        [1, 2, 1]
+    """
+    from stat import S_ISREG
+
+    stack = [os.fspath(root)]
+    while stack:
+        dpath = stack.pop()
+        with os.scandir(dpath) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            try:
+                stat = entry.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                # A broken symlink, or a file removed while walking
+                continue
+            if entry.is_symlink() and not S_ISREG(stat.st_mode):
+                continue
+            yield entry.path, stat
+        # Push in reverse so the subdirectories are visited in sorted order
+        stack.extend(reversed(subdirs))
+
+
+class _ExpireContext:
+    """
+    Shared state used when checking if stamps are expired. This holds the
+    current time and memoizes file stats, directory walks, and parsed
+    timestamps so they are only computed once when many stamps share them.
+    The memos are filled at most once per key, so it is safe to share this
+    between threads.
+    """
+
+    def __init__(self) -> None:
+        self.now = _localnow()
+        self._stats: dict[str, os.stat_result | None] = {}
+        self._walks: dict[str, list[tuple[str, os.stat_result]]] = {}
+        self._times: dict[str, datetime_mod.datetime] = {}
+
+    def stat(self, path: str | os.PathLike) -> os.stat_result | None:
+        """
+        Returns the stat result or None if the path does not exist.
+        """
+        key = os.fspath(path)
+        try:
+            return self._stats[key]
+        except KeyError:
+            pass
+        try:
+            result: os.stat_result | None = os.stat(key)
+        except (FileNotFoundError, NotADirectoryError):
+            result = None
+        self._stats[key] = result
+        return result
+
+    def walk(self, path: str | os.PathLike) -> list[tuple[str, os.stat_result]]:
+        key = os.fspath(path)
+        try:
+            return self._walks[key]
+        except KeyError:
+            pass
+        result = list(_walk_files(key))
+        self._walks[key] = result
+        return result
+
+    def timeparse(self, text: str) -> datetime_mod.datetime:
+        try:
+            return self._times[text]
+        except KeyError:
+            pass
+        from ubelt.util_time import timeparse
+
+        result = timeparse(text)
+        self._times[text] = result
+        return result
+
+    def prefetch(self, path: str | os.PathLike) -> None:
+        """
+        Stat a product and walk it if it is a directory.
+        """
+        import stat as stat_mod
+
+        product_stat = self.stat(path)
+        if product_stat is not None and stat_mod.S_ISDIR(product_stat.st_mode):
+            self.walk(path)
+
+
+def _expand_products(
+    products: list[typing.Any],
+    context: _ExpireContext | None = None,
+) -> tuple[list[typing.Any], list[os.stat_result], list[typing.Any] | None]:
+    """
+    Expand directory products into the files they contain.
+
+    Args:
+        products (List[Path | str]): the product paths, which must exist
+        context (_ExpireContext | None): if specified, stats are memoized here
+
+    Returns:
+        Tuple[List[Path | str], List[os.stat_result], List[List[str] | None] | None]:
+            The file paths, their stats, and the manifest. The manifest is
+            None if no product is a directory. Otherwise it has an item for
+            each product, which is None for a file and the list of its file
+            paths relative to it (with "/" separators) for a directory, so
+            it does not change if the directories are moved.
+
+    Example:
+        >>> from ubelt.util_cache import _expand_products
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/expand-products').delete().ensuredir()
+        >>> (dpath / 'd' / 'sub').ensuredir()
+        >>> (dpath / 'd' / 'sub' / 'x.txt').write_text('x')
+        >>> (dpath / 'f.txt').write_text('f')
+        >>> files, stats, manifest = _expand_products([dpath / 'f.txt', dpath / 'd'])
+        >>> print(manifest)
+        [None, ['sub/x.txt']]
+        >>> assert files[1] == str(dpath / 'd' / 'sub' / 'x.txt')
+    """
+    import stat as stat_mod
+
+    files: list[typing.Any] = []
+    stats: list[os.stat_result] = []
+    manifest: list[typing.Any] = []
+    has_dirs = False
+    for product in products:
+        if context is None:
+            product_stat = os.stat(product)
+        else:
+            maybe_stat = context.stat(product)
+            if maybe_stat is None:
+                raise FileNotFoundError(product)
+            product_stat = maybe_stat
+        if stat_mod.S_ISDIR(product_stat.st_mode):
+            has_dirs = True
+            walker = (
+                _walk_files(product)
+                if context is None
+                else context.walk(product)
+            )
+            # Walked paths always start with the product path
+            prefix_len = len(os.path.join(os.fspath(product), ''))
+            relpaths = []
+            for fpath, file_stat in walker:
+                files.append(fpath)
+                stats.append(file_stat)
+                relpaths.append(fpath[prefix_len:].replace(os.sep, '/'))
+            manifest.append(relpaths)
+        else:
+            files.append(product)
+            stats.append(product_stat)
+            manifest.append(None)
+    return files, stats, (manifest if has_dirs else None)
+
+
+def _file_stats_info(
+    stats: list[os.stat_result], manifest: list[typing.Any] | None
+) -> dict[str, list[typing.Any]]:
+    """
+    Build the stat lists stored in a certificate from
+    :func:`_expand_products`.
+    """
+    info: dict[str, list[typing.Any]] = {
+        'mtime': [stat.st_mtime for stat in stats],
+        'size': [stat.st_size for stat in stats],
+        'mtime_ns': [stat.st_mtime_ns for stat in stats],
+        'inode': [stat.st_ino for stat in stats],
+    }
+    if manifest is not None:
+        info['files'] = manifest
+    return info
+
+
+def _manifest_keys(
+    manifest: list[typing.Any] | None, products: list[typing.Any]
+) -> list[str]:
+    """
+    Name each file of a manifest from :func:`_expand_products` for display.
+    Files in a directory product are named relative to it, and prefixed by
+    its name if there are several products. File products are named by
+    their path.
+    """
+    keys = []
+    for idx, product in enumerate(products):
+        entries = None
+        if manifest is not None and idx < len(manifest):
+            entries = manifest[idx]
+        if entries is None:
+            keys.append(os.fspath(product))
+        elif len(products) > 1:
+            name = basename(os.path.normpath(os.fspath(product)))
+            keys.extend(name + '/' + rel for rel in entries)
+        else:
+            keys.extend(entries)
+    return keys
+
+
+def _diff_file_stats(
+    certificate: dict[str, typing.Any],
+    product_file_stats: dict[str, typing.Any],
+    products: list[typing.Any],
+) -> dict[str, list[str]]:
+    """
+    Determine which files were added, removed, or modified relative to the
+    certificate based on their stats. Only stats recorded in the certificate
+    are compared.
+    """
+    # Prefer the most precise stats that the certificate recorded
+    keys = [k for k in ['size', 'mtime_ns', 'inode'] if k in certificate]
+    if 'mtime_ns' not in keys and 'mtime' in certificate:
+        keys.append('mtime')
+
+    def _file_table(
+        info: dict[str, typing.Any], files: list[typing.Any]
+    ) -> dict[str, tuple]:
+        columns = [info.get(k, None) or [None] * len(files) for k in keys]
+        return {
+            os.fspath(f): tuple(col[idx] for col in columns)
+            for idx, f in enumerate(files)
+        }
+
+    old_manifest = certificate.get('files', None)
+    if old_manifest is None:
+        old_files = certificate.get('product', None) or []
+    else:
+        old_files = _manifest_keys(old_manifest, products)
+    new_files = _manifest_keys(product_file_stats.get('files', None), products)
+    old = _file_table(certificate, old_files)
+    new = _file_table(product_file_stats, new_files)
+    diff = {
+        'added': [f for f in new if f not in old],
+        'removed': [f for f in old if f not in new],
+        'modified': [f for f in new if f in old and new[f] != old[f]],
+    }
+    return diff
+
+
 def _localnow() -> datetime_mod.datetime:
     # Might be nice to have a util_time function add in tzinfo
     import datetime as datetime_mod
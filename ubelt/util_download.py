@@ -385,6 +385,8 @@ def grabdata(
     hash_prefix: str | None = None,
     hasher: str | HasherLike = 'sha512',
     expires: str | int | 'datetime.datetime' | None = None,
+    verify: str = 'hash',
+    audit_interval: int | float | 'datetime.timedelta' | None = None,
     **download_kw: Any,
 ) -> str | os.PathLike:
     """
@@ -433,6 +435,17 @@ def grabdata(
             when the cache should expire and redownload or the number of
             seconds to wait before the cache should expire.
 
+        verify (str):
+            The policy used to check the existing file against the stamp.
+            Using ``'stat'`` or ``'hash-if-stat-changed'`` avoids rehashing
+            large files when their size and mtime are unchanged. See
+            :class:`ubelt.util_cache.CacheStamp` for details. Defaults to
+            ``'hash'``.
+
+        audit_interval (int | float | datetime.timedelta | None):
+            Required when ``verify='periodic'``. The number of seconds after
+            which a stat-valid file is rehashed anyway.
+
         **download_kw: additional kwargs to pass to
             :func:`ubelt.util_download.download`. This includes ``chunksize``,
             ``filesize``, ``timeout``, ``progkw``, and ``requestkw``.
@@ -565,6 +578,8 @@ def grabdata(
         hash_prefix=hash_prefix,
         verbose=verbose,
         expires=expires,
+        verify=verify,
+        audit_interval=audit_interval,
     )
     if redo or stamp.expired():
         try:
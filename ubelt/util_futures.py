@@ -10,8 +10,13 @@ The :class:`Executor` class lets you choose the right level of concurrency
 (which might be no concurrency). An excellent blog post on when to use
 threads, processes, or asyncio [ChooseTheRightConcurrency]_.
 
-Note that executor does not currently support asyncio, but this might be a
-feature added in the future, but its unclear how interoperable this would be.
+The "asyncio" mode runs tasks on an event loop in a background thread, which
+lets thousands of I/O bound coroutines run concurrently while still returning
+regular :class:`concurrent.futures.Future` objects.
+
+The "cluster" mode sends tasks to worker processes over a TCP or Unix socket.
+The executor spawns local workers, and workers on other hosts can join with
+:func:`run_cluster_worker`.
 
 References:
     .. [ChooseTheRightConcurrency] https://superfastpython.com/python-concurrency-choose-api/
@@ -52,8 +57,11 @@ Example:
 
 from __future__ import annotations
 
+import collections
 import concurrent.futures
+import threading
 import typing
+from collections.abc import MutableSequence
 from concurrent.futures import as_completed
 from typing import Protocol, cast
 
@@ -62,6 +70,7 @@ __all__ = ['Executor', 'JobPool']
 T = typing.TypeVar('T')
 
 if typing.TYPE_CHECKING:
+    import os
     from concurrent.futures import (
         Future,
     )
@@ -101,11 +110,26 @@ else:
     _ExecutorBackend = typing.Any
 
 
+# Future states, looked up once rather than on every call
+_FINISHED = concurrent.futures._base.FINISHED
+_CANCELLED_STATES = (
+    concurrent.futures._base.CANCELLED,
+    concurrent.futures._base.CANCELLED_AND_NOTIFIED,
+)
+
+# Guards the lazy creation of SerialFuture conditions
+_SERIAL_CONDITION_LOCK = threading.Lock()
+
+
 class SerialFuture(concurrent.futures.Future, typing.Generic[T]):
     """
     Non-threading / multiprocessing version of future for drop in compatibility
     with concurrent.futures.
 
+    Serial futures are often created by the million in debugging runs, so
+    they only allocate the condition, waiter list, and callback list of a
+    regular future if something asks for them.
+
     TODO:
         warn if the user specifies timeout as we cannot handle it without
         threads
@@ -114,6 +138,16 @@ class SerialFuture(concurrent.futures.Future, typing.Generic[T]):
         func (Callable): function to be called
         args (Tuple): positional arguments to call the function with
         kw (Dict): keyword arguments to call the function with
+
+    Example:
+        >>> from ubelt.util_futures import SerialFuture  # NOQA
+        >>> self = SerialFuture(divmod, 7, 2)
+        >>> assert self._lazy_condition is None
+        >>> assert self.done() and self.result() == (3, 1)
+        >>> # The condition is only created when it is needed
+        >>> self.add_done_callback(lambda f: print('done'))
+        done
+        >>> assert self._lazy_condition is not None
     """
 
     func: typing.Callable[..., T]
@@ -123,19 +157,71 @@ class SerialFuture(concurrent.futures.Future, typing.Generic[T]):
     def __init__(
         self, func: typing.Callable[..., T], *args: typing.Any, **kw: typing.Any
     ) -> None:
-        super(SerialFuture, self).__init__()
+        # The base initializer is skipped to avoid allocating a condition
         self.func = func
         self.args = args
         self.kw = kw
-        # self._condition = FakeCondition()
         self._run_count = 0
         # fake being finished to cause __get_result to be called
-        self._state = concurrent.futures._base.FINISHED
+        self._state = _FINISHED
+        self._result = None
+        self._exception = None
+        self._lazy_condition = None
+        self._lazy_waiters = None
+        self._lazy_callbacks = None
+
+    @property  # type: ignore[override]
+    def _condition(self) -> typing.Any:
+        cond = self._lazy_condition
+        if cond is None:
+            with _SERIAL_CONDITION_LOCK:
+                cond = self._lazy_condition
+                if cond is None:
+                    cond = self._lazy_condition = threading.Condition()
+        return cond
+
+    @property  # type: ignore[override]
+    def _waiters(self) -> list:
+        if self._lazy_waiters is None:
+            self._lazy_waiters = []
+        return self._lazy_waiters
+
+    @property  # type: ignore[override]
+    def _done_callbacks(self) -> list:
+        if self._lazy_callbacks is None:
+            self._lazy_callbacks = []
+        return self._lazy_callbacks
+
+    def _invoke_callbacks(self) -> None:
+        if self._lazy_callbacks:
+            super()._invoke_callbacks()  # type: ignore
 
     def _run(self) -> None:
-        result = self.func(*self.args, **self.kw)
-        self.set_result(result)
-        self._run_count += 1
+        try:
+            result = self.func(*self.args, **self.kw)
+        except Exception as ex:
+            self._run_count += 1
+            self._set_exception(ex)
+        else:
+            self._run_count += 1
+            self.set_result(result)
+
+    def _set_exception(self, exception: BaseException) -> None:
+        # The base class refuses to set an exception on a finished future,
+        # and we fake being finished.
+        if self._lazy_condition is None:
+            # Nothing can wait on or register a callback with this future
+            # without creating its condition first.
+            self._exception = exception
+            self._state = _FINISHED
+            return
+        with self._condition:
+            self._exception = exception
+            self._state = _FINISHED
+            for waiter in self._waiters:  # nocover
+                waiter.add_exception(self)
+            self._condition.notify_all()
+        self._invoke_callbacks()
 
     def set_result(self, result: T) -> None:
         """
@@ -160,9 +246,13 @@ class SerialFuture(concurrent.futures.Future, typing.Generic[T]):
             >>> ret = self.result()
             >>> print('ret = {!r}'.format(ret))
         """
+        if self._lazy_condition is None:
+            self._result = result
+            self._state = _FINISHED
+            return
         with self._condition:
             self._result = result
-            self._state = concurrent.futures._base.FINISHED
+            self._state = _FINISHED
             # I'm cheating a little by not covering this.
             # Lets call it, cheating in good faith. *shifty eyes*
             # I don't know how to test it, and its not a critical pieces of the
@@ -170,12 +260,61 @@ class SerialFuture(concurrent.futures.Future, typing.Generic[T]):
             for waiter in self._waiters:  # nocover
                 waiter.add_result(self)
             self._condition.notify_all()
-        self._invoke_callbacks()  # type: ignore
+        self._invoke_callbacks()
+
+    def cancel(self) -> bool:
+        """
+        Cancels the job if it has not been run yet.
+
+        Returns:
+            bool: True if the job was cancelled
+
+        Example:
+            >>> from ubelt.util_futures import SerialFuture  # NOQA
+            >>> self = SerialFuture(sum, [1, 2])
+            >>> assert self.cancel() and self.cancelled()
+            >>> other = SerialFuture(sum, [1, 2])
+            >>> assert other.result() == 3
+            >>> assert not other.cancel()
+        """
+        if self._run_count or self._state != _FINISHED:
+            return self._state in _CANCELLED_STATES
+        # A serial job is never running, so waiters can be told right away
+        # instead of waiting for set_running_or_notify_cancel.
+        self._state = concurrent.futures._base.CANCELLED_AND_NOTIFIED
+        if self._lazy_condition is not None:
+            with self._condition:
+                for waiter in self._waiters:  # nocover
+                    waiter.add_cancelled(self)
+                self._condition.notify_all()
+            self._invoke_callbacks()
+        return True
+
+    def cancelled(self) -> bool:
+        return self._state in _CANCELLED_STATES
+
+    def running(self) -> bool:
+        return False
+
+    def done(self) -> bool:
+        return True
+
+    def result(self, timeout: float | None = None) -> T:
+        if self._state in _CANCELLED_STATES:
+            raise concurrent.futures.CancelledError()
+        return self._Future__get_result()
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        if self._state in _CANCELLED_STATES:
+            raise concurrent.futures.CancelledError()
+        return self._exception
 
     def _Future__get_result(self) -> typing.Any:
         # overrides private __getresult method
         if not self._run_count:
             self._run()
+        if self._exception is not None:
+            raise self._exception
         return self._result
 
 
@@ -289,140 +428,176 @@ class SerialExecutor:
         if len(kwargs) != 0:  # nocover
             raise ValueError('Unknown arguments {}'.format(kwargs))
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
-        for f in fs:
-            yield f.result()
+        # There is nothing to wait on, so skip creating a future per item
+        yield from map(fn, *iterables)
+
 
+def _call_chunk(
+    fn: Callable[..., T], chunk: list[tuple[Any, ...]]
+) -> tuple[list[T], float]:
+    """
+    Runs a function over a chunk of argument tuples in a worker and measures
+    how long it took, excluding the time the chunk spent in the queue.
+    """
+    import time
 
-# See ../dev/experimental/async_executor_poc.py for
-# work ona potential AsyncIOExecutor class
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return results, time.perf_counter() - start
 
 
-class Executor:
+def _call_group(calls: list[tuple[Callable, tuple, dict]]) -> list:
     """
-    A concrete asynchronous executor with a configurable backend.
+    Runs a batch of calls that share a group key in the same worker and
+    returns an ``(ok, value)`` outcome for each of them, so one failure does
+    not hide the results of the others.
+    """
+    outcomes = []
+    for func, args, kwargs in calls:
+        try:
+            outcomes.append((True, func(*args, **kwargs)))
+        except Exception as ex:
+            outcomes.append((False, ex))
+    return outcomes
 
-    The type of parallelism (or lack thereof) is configured via the ``mode``
-    parameter, which can be: "process", "thread", or "serial".  This allows the
-    user to easily enable / disable parallelism or switch between processes and
-    threads without modifying the surrounding logic.
 
-    SeeAlso:
-        * :class:`concurrent.futures.ThreadPoolExecutor`
-        * :class:`concurrent.futures.ProcessPoolExecutor`
-        * :class:`concurrent.futures.InterpreterPoolExecutor`
-        * :class:`SerialExecutor`
-        * :class:`JobPool`
+class _QueuedJob:
+    """
+    A job held in the :class:`JobPool` priority queue until it is dispatched.
+    """
 
-    In the case where you cant or dont want to use ubelt.Executor you can get
-    similar behavior with the following pure-python snippet:
+    __slots__ = (
+        'proxy',
+        'func',
+        'args',
+        'kwargs',
+        'group',
+        'submitted',
+        'policy',
+        'taken',
+    )
 
-    .. code:: python
+    def __init__(
+        self,
+        proxy: concurrent.futures.Future,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        group: Any,
+        submitted: float | None,
+        policy: tuple[int, float, float | None] | None,
+    ) -> None:
+        self.proxy = proxy
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.group = group
+        self.submitted = submitted
+        self.policy = policy
+        self.taken = False
 
-        def Executor(max_workers):
-            # Stdlib-only "ubelt.Executor"-like behavior
-            if max_workers == 1:
-                import contextlib
-                def submit_partial(func, *args, **kwargs):
-                    def wrapper():
-                        return func(*args, **kwargs)
-                    wrapper.result = wrapper
-                    return wrapper
-                executor = contextlib.nullcontext()
-                executor.submit = submit_partial
-            else:
-                from concurrent.futures import ThreadPoolExecutor
-                executor = ThreadPoolExecutor(max_workers=max_workers)
-            return executor
 
-        executor = Executor(0)
-        with executor:
-            jobs = []
+class _ChunkSizer:
+    """
+    Chooses how many items to send to a worker at a time.
 
-            for arg in range(1000):
-                job = executor.submit(chr, arg)
-                jobs.append(job)
+    When ``chunksize='auto'``, chunks start with a single item and are resized
+    after each chunk completes so the next chunk takes approximately
+    ``time_thresh`` seconds of work. Like the frequency adjustment in
+    :class:`ubelt.progiter.ProgIter`, the size changes by at most a factor of
+    ``rel_adjust_limit`` at a time.
 
-            results = []
-            for job in jobs:
-                result = job.result()
-                results.append(result)
+    Example:
+        >>> from ubelt.util_futures import _ChunkSizer
+        >>> sizer = _ChunkSizer('auto', time_thresh=0.1)
+        >>> assert sizer.chunksize == 1
+        >>> # Fast items grow the chunk size, but not too fast
+        >>> sizer.update(1, 0.0001)
+        >>> assert sizer.chunksize == 4
+        >>> sizer.update(4, 0.0004)
+        >>> assert sizer.chunksize == 16
+        >>> # Slow items shrink it
+        >>> sizer.update(16, 16.0)
+        >>> assert sizer.chunksize == 4
+        >>> assert _ChunkSizer(7).chunksize == 7
+    """
 
-        print('results = {}'.format(ub.urepr(results, nl=1)))
+    def __init__(
+        self,
+        chunksize: int | str = 'auto',
+        time_thresh: float = 0.05,
+        rel_adjust_limit: float = 4.0,
+    ) -> None:
+        self.auto = chunksize == 'auto'
+        self.chunksize = 1 if self.auto else int(chunksize)
+        if self.chunksize < 1:
+            raise ValueError('chunksize must be positive')
+        self.time_thresh = time_thresh
+        self.rel_adjust_limit = rel_adjust_limit
 
+    def update(self, num_items: int, elapsed: float) -> None:
+        """
+        Record that ``num_items`` took ``elapsed`` seconds to process.
+        """
+        if not self.auto:
+            return
+        eps = 1e-9
+        new_size = int(self.time_thresh * num_items / max(eps, elapsed))
+        # Don't make drastic changes based on a single measurement
+        rel_limit = self.rel_adjust_limit
+        max_size = int(self.chunksize * rel_limit)
+        min_size = int(self.chunksize // rel_limit)
+        self.chunksize = max(min(new_size, max_size), min_size, 1)
 
-    Attributes:
-        backend (SerialExecutor | ThreadPoolExecutor | ProcessPoolExecutor):
 
-    Example:
-        >>> import ubelt as ub
-        >>> # Prototype code using simple serial processing
-        >>> executor = ub.Executor(mode='serial', max_workers=0)
-        >>> jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
-        >>> print([job.result() for job in jobs])
-        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+class AsyncIOExecutor:
+    """
+    Implements the concurrent.futures API around an asyncio event loop that
+    runs in a dedicated background thread.
 
-        >>> # Enable parallelism by only changing one parameter
-        >>> executor = ub.Executor(mode='process', max_workers=2)
-        >>> jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
-        >>> print([job.result() for job in jobs])
-        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    Coroutine functions are scheduled as tasks on the loop. Other callables
+    are run in a thread pool so they do not block the loop. A semaphore
+    bounds the number of tasks that run at the same time. The returned
+    futures are regular :class:`concurrent.futures.Future` objects, so they
+    can be used from synchronous code.
 
-        >>> # In 3.14 the interpreter backend is available
-        >>> import sys
-        >>> if sys.version_info[0:2] >= (3, 14):
-        >>>     executor = ub.Executor(mode='interpreter', max_workers=2)
-        >>>     jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
-        >>>     results = [job.result() for job in jobs]
-        >>>     assert results == [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    Example:
+        >>> from ubelt.util_futures import AsyncIOExecutor  # NOQA
+        >>> import asyncio
+        >>> async def fetch(x):
+        >>>     await asyncio.sleep(0.01)
+        >>>     return x * 2
+        >>> with AsyncIOExecutor(max_workers=100) as executor:
+        >>>     # Hundreds of concurrent sleeps take about as long as one
+        >>>     futures = [executor.submit(fetch, i) for i in range(300)]
+        >>>     # Synchronous callables are supported too
+        >>>     futures.append(executor.submit(sum, [1, 2, 3]))
+        >>>     results = [f.result() for f in futures]
+        >>> assert results[:3] == [0, 2, 4] and results[-1] == 6
     """
 
-    backend: _ExecutorBackend
+    max_workers: int
 
-    def __init__(self, mode: str = 'thread', max_workers: int = 0) -> None:
+    def __init__(self, max_workers: int = 0) -> None:
         """
         Args:
-            mode (str):
-                The backend parallelism mechanism.  Can be either thread, serial,
-                or process. Defaults to 'thread'.
-
             max_workers (int):
-                number of workers. If 0, serial is forced. Defaults to 0.
+                the maximum number of tasks that can run at the same time.
+                This also bounds the number of threads used for synchronous
+                callables. If 0, tasks run one at a time. Defaults to 0.
         """
-        from concurrent import futures
+        import threading
 
-        backend: _ExecutorBackend
-        if mode == 'serial' or max_workers == 0:
-            backend = SerialExecutor()
-        elif mode == 'thread':
-            backend = cast(
-                _ExecutorBackend,
-                futures.ThreadPoolExecutor(max_workers=max_workers),
-            )
-        elif mode == 'process':
-            backend = cast(
-                _ExecutorBackend,
-                futures.ProcessPoolExecutor(max_workers=max_workers),
-            )
-        elif mode == 'interpreter':  # nocover
-            # Requires 3.14+
-            InterpreterPoolExecutor = getattr(
-                futures, 'InterpreterPoolExecutor', None
-            )
-            if InterpreterPoolExecutor is None:
-                raise RuntimeError(
-                    "Executor(mode='interpreter') requires Python 3.14+"
-                )
-            backend = InterpreterPoolExecutor(max_workers=max_workers)
-        # elif mode == 'asyncio':
-        #     # Experimental
-        #     backend = AsyncIOExecutor()
-        else:
-            raise KeyError(mode)
-        self.backend = backend
+        self.max_workers = max_workers
+        self._loop: Any = None
+        self._thread: threading.Thread | None = None
+        self._thread_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._semaphore: Any = None
+        self._lock = threading.Lock()
+        self._outstanding: set = set()
+        self._shutdown = False
 
-    def __enter__(self) -> Executor:
-        self.backend.__enter__()
+    def __enter__(self) -> AsyncIOExecutor:
         return self
 
     def __exit__(
@@ -430,7 +605,7 @@ class Executor:
         ex_type: Type[BaseException] | None,
         ex_value: BaseException | None,
         ex_traceback: TracebackType | None,
-    ) -> bool | None:
+    ) -> None:
         """
         Args:
             ex_type (Type[BaseException] | None):
@@ -440,8 +615,52 @@ class Executor:
         Returns:
             bool | None
         """
-        # Note: the following call will block
-        return self.backend.__exit__(ex_type, ex_value, ex_traceback)
+        self.shutdown(wait=True)
+        return None
+
+    def _ensure_loop(self) -> Any:
+        import asyncio
+        import threading
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='AsyncIOExecutor',
+                    daemon=True,
+                )
+                thread.start()
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers),
+                    thread_name_prefix='AsyncIOExecutor',
+                )
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    async def _run(
+        self, func: Callable[..., Any], args: tuple, kw: dict
+    ) -> Any:
+        import asyncio
+        import functools
+        import inspect
+
+        if self._semaphore is None:
+            # Created here so it belongs to the running loop
+            self._semaphore = asyncio.Semaphore(max(1, self.max_workers))
+        async with self._semaphore:
+            if inspect.iscoroutinefunction(func):
+                return await func(*args, **kw)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._thread_pool, functools.partial(func, *args, **kw)
+            )
+            if inspect.isawaitable(result):
+                result = await result
+            return result
 
     def submit(
         self,
@@ -450,129 +669,2643 @@ class Executor:
         **kw: Any,
     ) -> concurrent.futures.Future[T]:
         """
-        Calls the submit function of the underlying backend.
+        Schedule a coroutine function or callable on the event loop
 
         Returns:
             concurrent.futures.Future:
                 a future representing the job
         """
-        return self.backend.submit(func, *args, **kw)
+        import asyncio
 
-    def shutdown(self) -> None:
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(func, args, kw), loop
+        )
+        with self._lock:
+            self._outstanding.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._outstanding.discard(future)
+
+    def shutdown(self, wait: bool = True) -> None:
         """
-        Calls the shutdown function of the underlying backend.
+        Stops accepting new tasks and stops the event loop thread. Calling
+        this more than once has no effect.
+
+        Args:
+            wait (bool):
+                if True, wait for submitted tasks to finish, otherwise they
+                are cancelled. Defaults to True.
         """
-        return self.backend.shutdown()
+        import asyncio
+
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            loop = self._loop
+            outstanding = list(self._outstanding)
+        if loop is None:
+            return
+        if wait:
+            concurrent.futures.wait(outstanding)
+        else:
+            for future in outstanding:
+                future.cancel()
+
+        async def _drain() -> None:
+            # Let cancelled tasks unwind before the loop is closed
+            current = asyncio.current_task()
+            tasks = [t for t in asyncio.all_tasks() if t is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(_drain(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        assert self._thread is not None
+        self._thread.join()
+        loop.close()
+        assert self._thread_pool is not None
+        self._thread_pool.shutdown(wait=wait)
 
     def map(
         self,
         fn: Callable[..., T],
         *iterables: Iterable[Any],
         **kwargs: Any,
-    ) -> Iterator[T]:
-        """
-        Calls the map function of the underlying backend.
+    ) -> Generator[T, None, None]:
+        """Returns an iterator equivalent to map(fn, iter).
 
         Args:
             fn (Callable[..., T]): Function to apply to items from `iterables`.
-            *iterables (Iterable[Any]): One or more iterables supplying arguments to `fn`.
-            **kwargs (Any): Supports:
-                - chunksize (int): Chunk size hint for process-based backends.
-                - timeout (float | None): Optional timeout in seconds.
 
-        Returns:
-            Iterator[T]: Iterator yielding results from applying `fn`.
+            *iterables (Iterable[Any]):
+                One or more iterables supplying arguments to `fn`.
 
-        CommandLine:
-            xdoctest -m ubelt.util_futures Executor.map
+            timeout (float | None):
+                The maximum number of seconds to wait for all results.
+
+            chunksize:
+                This argument is ignored for AsyncIOExecutor
+
+        Yields:
+            Any: equivalent to: map(func, *iterables)
 
         Example:
-            >>> import ubelt as ub
-            >>> import concurrent.futures
-            >>> import string
-            >>> with ub.Executor(mode='serial') as executor:
-            ...     result_iter = executor.map(int, string.digits)
-            ...     results = list(result_iter)
-            >>> print('results = {!r}'.format(results))
-            results = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-            >>> with ub.Executor(mode='thread', max_workers=2) as executor:
-            ...     result_iter = executor.map(int, string.digits)
-            ...     results = list(result_iter)
-            >>> # xdoctest: +IGNORE_WANT
+            >>> from ubelt.util_futures import AsyncIOExecutor  # NOQA
+            >>> with AsyncIOExecutor(max_workers=4) as executor:
+            ...     results = list(executor.map(abs, range(-3, 3)))
             >>> print('results = {!r}'.format(results))
-            results = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+            results = [3, 2, 1, 0, 1, 2]
         """
-        # Hack for python2
-        chunksize = kwargs.pop('chunksize', 1)
+        import time
+
+        kwargs.pop('chunksize', None)
         timeout = kwargs.pop('timeout', None)
         if len(kwargs) != 0:  # nocover
             raise ValueError('Unknown arguments {}'.format(kwargs))
-        return self.backend.map(
-            fn, *iterables, timeout=timeout, chunksize=chunksize
-        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        try:
+            for f in fs:
+                if deadline is None:
+                    yield f.result()
+                else:
+                    yield f.result(max(0.0, deadline - time.monotonic()))
+        finally:
+            for f in fs:
+                f.cancel()
 
 
-class JobPool(typing.Generic[T]):
+_AutoScaleStats = collections.namedtuple(
+    'AutoScaleStats',
+    [
+        'time',
+        'target',
+        'workers',
+        'busy',
+        'queue_depth',
+        'latency',
+        'throughput',
+        'cpu',
+    ],
+)
+
+
+class AutoScalePolicy:
     """
-    Abstracts away boilerplate of submitting and collecting jobs
+    The default concurrency policy used by :class:`AutoScaleExecutor`.
 
-    This is a basic wrapper around :class:`ubelt.util_futures.Executor` that
-    simplifies the most basic case by 1. keeping track of references to
-    submitted futures for you and 2. providing an as_completed method to
-    consume those futures as they are ready.
+    This is a hill climbing controller. While there is a backlog it keeps
+    moving the target concurrency in the same direction as long as throughput
+    improves, and reverses direction when throughput drops. Like TCP slow
+    start, the target doubles until the first time throughput stops
+    improving, and then moves in steps of a quarter. When throughput
+    is flat and the process is using a full core of CPU (e.g. GIL bound
+    work), it backs off instead of adding threads. Without a backlog the
+    target shrinks toward the number of busy workers.
+
+    Any callable that accepts an ``AutoScaleStats`` sample and returns the
+    new target number of workers can be used as a policy instead. A sample
+    has the fields:
+
+        * time - :func:`time.monotonic` timestamp of the sample
+        * target - the current target number of workers
+        * workers - the number of live worker threads
+        * busy - the number of workers running a task
+        * queue_depth - the number of submitted tasks waiting for a worker
+        * latency - mean seconds from submission to completion of the tasks
+          that finished since the last sample (or None)
+        * throughput - tasks completed per second since the last sample
+        * cpu - process CPU seconds used per wall clock second since the
+          last sample
+
+    Example:
+        >>> from ubelt.util_futures import AutoScalePolicy, _AutoScaleStats
+        >>> policy = AutoScalePolicy()
+        >>> stats = _AutoScaleStats(0, 4, 4, 4, 10, 0.1, 40.0, 0.1)
+        >>> policy(stats)
+        8
+        >>> # Throughput improved, so keep growing
+        >>> policy(stats._replace(target=8, throughput=80.0))
+        16
+        >>> # Throughput dropped, so back off
+        >>> policy(stats._replace(target=16, throughput=60.0))
+        12
+    """
+
+    def __init__(self, tolerance: float = 0.05, cpu_saturation: float = 0.9):
+        """
+        Args:
+            tolerance (float):
+                relative change in throughput that is considered noise.
+                Defaults to 0.05.
+
+            cpu_saturation (float):
+                process CPU seconds per second at or above which the work is
+                considered CPU bound. Defaults to 0.9.
+        """
+        self.tolerance = tolerance
+        self.cpu_saturation = cpu_saturation
+        self._direction = 1
+        self._slow_start = True
+        self._prev_throughput: float | None = None
+
+    def __call__(self, stats: Any) -> int:
+        target = stats.target
+        step = max(1, target // 4)
+        if stats.queue_depth == 0:
+            # No backlog: release capacity that is not being used
+            self._prev_throughput = None
+            self._direction = 1
+            self._slow_start = True
+            if stats.busy < target:
+                return max(stats.busy, target - step)
+            return target
+        prev = self._prev_throughput
+        self._prev_throughput = stats.throughput
+        if prev is not None:
+            if stats.throughput > prev * (1 + self.tolerance):
+                pass
+            elif stats.throughput < prev * (1 - self.tolerance):
+                self._direction = -self._direction
+                self._slow_start = False
+            elif stats.cpu >= self.cpu_saturation:
+                # More threads cannot help CPU bound work
+                self._direction = -1
+                self._slow_start = False
+            else:
+                self._direction = 1
+        if self._slow_start:
+            step = target
+        return target + self._direction * step
+
+
+class AutoScaleExecutor:
+    """
+    Implements the concurrent.futures API around a thread pool that grows and
+    shrinks its number of workers while it runs.
+
+    Every ``interval`` seconds the pool samples its queue depth, task latency,
+    throughput, and CPU utilization, and asks a policy for a new target
+    number of workers between ``min_workers`` and ``max_workers``. Extra
+    workers are started when there is a backlog, and surplus workers exit
+    after finishing their current task. Each sample is recorded in
+    ``history``, so the chosen concurrency can be inspected afterwards.
 
     Attributes:
-        executor (Executor): internal executor object
-        jobs (List[Future]): internal job list. Note: do not rely on this attribute, it
-            may change in the future.
+        history (List[AutoScaleStats]):
+            the recorded samples, where ``target`` is the number of workers
+            chosen after the sample was taken.
 
     Example:
-        >>> import ubelt as ub
-        >>> def worker(data):
-        >>>     return data + 1
-        >>> pool = ub.JobPool('thread', max_workers=16)
-        >>> for data in ub.ProgIter(range(10), desc='submit jobs'):
-        >>>     pool.submit(worker, data)
-        >>> final = []
-        >>> for job in pool.as_completed(desc='collect jobs'):
-        >>>     info = job.result()
-        >>>     final.append(info)
-        >>> print('final = {!r}'.format(final))
+        >>> from ubelt.util_futures import AutoScaleExecutor  # NOQA
+        >>> import time
+        >>> with AutoScaleExecutor(max_workers=32, interval=0.01) as executor:
+        >>>     futures = [executor.submit(time.sleep, 0.005) for i in range(200)]
+        >>>     for f in futures:
+        >>>         f.result()
+        >>> # I/O bound work causes the pool to grow
+        >>> peak = max(s.target for s in executor.history)
+        >>> assert 1 < peak <= 32
     """
 
-    executor: Executor
-    jobs: list[Future[T]]
-    transient: bool
+    min_workers: int
+    max_workers: int
+    history: list[Any]
 
     def __init__(
         self,
-        mode: str = 'thread',
-        max_workers: int = 0,
-        transient: bool = False,
+        min_workers: int = 1,
+        max_workers: int | None = None,
+        policy: Callable[[Any], int] | None = None,
+        interval: float = 0.1,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple = (),
     ) -> None:
         """
         Args:
-            mode (str):
-                The backend parallelism mechanism.  Can be either thread, serial,
-                or process. Defaults to 'thread'.
+            min_workers (int):
+                the fewest number of workers to keep. Defaults to 1.
 
-            max_workers (int):
-                number of workers. If 0, serial is forced. Defaults to 0.
+            max_workers (int | None):
+                the most workers to run at the same time. Defaults to
+                ``max(32, 4 * os.cpu_count())``.
 
-            transient (bool):
-                if True, references to jobs will be discarded as they are
-                returned by :func:`as_completed`. Otherwise the ``jobs`` attribute
-                holds a reference to all jobs ever submitted. Default to False.
-        """
+            policy (Callable[[AutoScaleStats], int] | None):
+                called with each sample to choose the next target number of
+                workers. Defaults to a new :class:`AutoScalePolicy`.
+
+            interval (float):
+                the minimum number of seconds between samples.
+                Defaults to 0.1.
+
+            initializer (Callable | None):
+                called with ``initargs`` at the start of each worker thread.
+
+            initargs (tuple):
+                arguments passed to ``initializer``.
+        """
+        import os
+        import threading
+        import time
+
+        if max_workers is None:
+            max_workers = max(32, 4 * (os.cpu_count() or 1))
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError('need 1 <= min_workers <= max_workers')
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.policy = AutoScalePolicy() if policy is None else policy
+        self.interval = interval
+        self.initializer = initializer
+        self.initargs = initargs
+        self.history = []
+        self._target = min_workers
+        self._queue: collections.deque = collections.deque()
+        self._cond = threading.Condition()
+        self._threads: set = set()
+        self._num_busy = 0
+        self._shutdown = False
+        # Counters accumulated between samples
+        self._num_done = 0
+        self._latency_total = 0.0
+        self._last_wall = time.monotonic()
+        self._last_cpu = time.process_time()
+
+    def __enter__(self) -> AutoScaleExecutor:
+        return self
+
+    def __exit__(
+        self,
+        ex_type: Type[BaseException] | None,
+        ex_value: BaseException | None,
+        ex_traceback: TracebackType | None,
+    ) -> None:
+        """
+        Args:
+            ex_type (Type[BaseException] | None):
+            ex_value (BaseException | None):
+            ex_traceback (TracebackType | None):
+
+        Returns:
+            bool | None
+        """
+        self.shutdown(wait=True)
+        return None
+
+    def submit(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        **kw: Any,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Schedule a callable to run on a worker thread
+
+        Returns:
+            concurrent.futures.Future:
+                a future representing the job
+        """
+        import time
+
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._queue.append((future, func, args, kw, time.monotonic()))
+            self._cond.notify()
+            self._maybe_adjust()
+            self._spawn_workers()
+        return future
+
+    def _spawn_workers(self) -> None:
+        """
+        Starts workers while there is a backlog and room under the target.
+        Must be called while holding the lock.
+        """
+        import threading
+
+        num_idle = len(self._threads) - self._num_busy
+        backlog = len(self._queue) - num_idle
+        num_new = min(backlog, self._target - len(self._threads))
+        for _ in range(num_new):
+            thread = threading.Thread(
+                target=self._worker, name='AutoScaleExecutor', daemon=True
+            )
+            self._threads.add(thread)
+            thread.start()
+
+    def _maybe_adjust(self) -> None:
+        """
+        Samples the pool and updates the target if an interval has passed.
+        Must be called while holding the lock.
+        """
+        import time
+
+        now = time.monotonic()
+        wall = now - self._last_wall
+        if wall < self.interval:
+            return
+        cpu_now = time.process_time()
+        num_done = self._num_done
+        stats = _AutoScaleStats(
+            time=now,
+            target=self._target,
+            workers=len(self._threads),
+            busy=self._num_busy,
+            queue_depth=len(self._queue),
+            latency=(self._latency_total / num_done) if num_done else None,
+            throughput=num_done / wall,
+            cpu=(cpu_now - self._last_cpu) / wall,
+        )
+        self._num_done = 0
+        self._latency_total = 0.0
+        self._last_wall = now
+        self._last_cpu = cpu_now
+        target = int(self.policy(stats))
+        target = max(self.min_workers, min(self.max_workers, target))
+        self._target = target
+        self.history.append(stats._replace(target=target))
+        if len(self._threads) > target:
+            # Wake idle workers so the surplus can exit
+            self._cond.notify_all()
+
+    def _worker(self) -> None:
+        import threading
+        import time
+
+        thread = threading.current_thread()
+        cond = self._cond
+        if self.initializer is not None:
+            self.initializer(*self.initargs)
+        while True:
+            with cond:
+                while not self._queue:
+                    if self._shutdown or len(self._threads) > self._target:
+                        self._threads.discard(thread)
+                        return
+                    if not cond.wait(timeout=self.interval):
+                        self._maybe_adjust()
+                if len(self._threads) > self._target:
+                    self._threads.discard(thread)
+                    # Hand the waiting work to another worker
+                    cond.notify()
+                    return
+                future, func, args, kw, submitted = self._queue.popleft()
+                self._num_busy += 1
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args, **kw)
+                except BaseException as ex:
+                    future.set_exception(ex)
+                else:
+                    future.set_result(result)
+                del future
+            with cond:
+                self._num_busy -= 1
+                self._num_done += 1
+                self._latency_total += time.monotonic() - submitted
+                self._maybe_adjust()
+                self._spawn_workers()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting new tasks. Workers exit once the queue is empty.
+
+        Args:
+            wait (bool):
+                if True, wait for submitted tasks to finish, otherwise tasks
+                that have not started are cancelled. Defaults to True.
+        """
+        with self._cond:
+            self._shutdown = True
+            if not wait:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+            self._cond.notify_all()
+        while wait:
+            # Workers may start others while draining the queue
+            with self._cond:
+                threads = list(self._threads)
+            if not threads:
+                break
+            for thread in threads:
+                thread.join()
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        **kwargs: Any,
+    ) -> Generator[T, None, None]:
+        """Returns an iterator equivalent to map(fn, iter).
+
+        Args:
+            fn (Callable[..., T]): Function to apply to items from `iterables`.
+
+            *iterables (Iterable[Any]):
+                One or more iterables supplying arguments to `fn`.
+
+            timeout (float | None):
+                The maximum number of seconds to wait for all results.
+
+            chunksize:
+                This argument is ignored for AutoScaleExecutor
+
+        Yields:
+            Any: equivalent to: map(func, *iterables)
+
+        Example:
+            >>> from ubelt.util_futures import AutoScaleExecutor  # NOQA
+            >>> with AutoScaleExecutor(max_workers=4) as executor:
+            ...     results = list(executor.map(abs, range(-3, 3)))
+            >>> print('results = {!r}'.format(results))
+            results = [3, 2, 1, 0, 1, 2]
+        """
+        import time
+
+        kwargs.pop('chunksize', None)
+        timeout = kwargs.pop('timeout', None)
+        if len(kwargs) != 0:  # nocover
+            raise ValueError('Unknown arguments {}'.format(kwargs))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        try:
+            for f in fs:
+                if deadline is None:
+                    yield f.result()
+                else:
+                    yield f.result(max(0.0, deadline - time.monotonic()))
+        finally:
+            for f in fs:
+                f.cancel()
+
+
+# Shared read-only objects by executor token. Worker processes either
+# inherit this on fork or fill it in from their initializer.
+_SHARED_REGISTRY: dict[str, dict[str, Any]] = {}
+# Shared memory blocks attached in this worker, kept alive for its lifetime
+_ATTACHED_BLOCKS: list = []
+
+
+class SharedHandle:
+    """
+    A small picklable reference to a read-only object that was given to an
+    :class:`Executor` with ``shared=...``. Pass the handle to a task instead
+    of the object, and call :func:`SharedHandle.get` inside the task.
+
+    Example:
+        >>> import ubelt as ub
+        >>> table = {i: i * i for i in range(1000)}
+        >>> with ub.Executor('thread', 2, shared={'table': table}) as executor:
+        >>>     handle = executor.shared['table']
+        >>>     job = executor.submit(lambda h, k: h.get()[k], handle, 7)
+        >>>     print(job.result())
+        49
+    """
+
+    __slots__ = ('token', 'key')
+
+    def __init__(self, token: str, key: str) -> None:
+        self.token = token
+        self.key = key
+
+    def __repr__(self) -> str:
+        return 'SharedHandle({!r})'.format(self.key)
+
+    def get(self) -> Any:
+        """
+        Returns:
+            Any: the shared object in the current process
+        """
+        return _SHARED_REGISTRY[self.token][self.key]
+
+
+def _export_shared(shared: dict[str, Any]) -> tuple[dict[str, tuple], list]:
+    """
+    Prepares shared objects to be sent to a worker that does not inherit
+    memory from the parent. NumPy arrays are copied into shared memory once
+    and sent by name, other objects are pickled once per worker.
+    """
+    import sys
+
+    np = sys.modules.get('numpy', None)
+    payload = {}
+    blocks = []
+    for key, value in shared.items():
+        if (
+            np is not None
+            and isinstance(value, np.ndarray)
+            and (value.dtype.kind != 'O')
+        ):
+            from multiprocessing import shared_memory
+
+            block = shared_memory.SharedMemory(
+                create=True, size=max(1, value.nbytes)
+            )
+            blocks.append(block)
+            view = np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)
+            view[...] = value
+            payload[key] = ('ndarray', block.name, value.shape, value.dtype.str)
+        else:
+            payload[key] = ('object', value)
+    return payload, blocks
+
+
+def _import_shared(payload: dict[str, tuple]) -> dict[str, Any]:
+    """
+    Rebuilds the shared objects inside a worker from :func:`_export_shared`.
+    """
+    import sys
+
+    shared = {}
+    for key, info in payload.items():
+        if info[0] == 'ndarray':
+            from multiprocessing import shared_memory
+
+            import numpy as np
+
+            _, name, shape, dtype = info
+            if sys.version_info[0:2] >= (3, 13):
+                block = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                block = shared_memory.SharedMemory(name=name)
+            _ATTACHED_BLOCKS.append(block)
+            value = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            value.flags.writeable = False
+            shared[key] = value
+        else:
+            shared[key] = info[1]
+    return shared
+
+
+def _demo_shared_lookup(handle: SharedHandle, key: Any) -> Any:
+    return handle.get()[key]
+
+
+def _init_worker(
+    token: str,
+    payload: dict[str, tuple] | None,
+    initializer: Callable[..., Any] | None,
+    initargs: tuple,
+) -> None:
+    """
+    Runs once in each worker before it accepts tasks.
+    """
+    if payload is not None:
+        _SHARED_REGISTRY[token] = _import_shared(payload)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class _ClusterTask:
+    """
+    A task waiting for or running on a :class:`ClusterExecutor` worker.
+    """
+
+    __slots__ = ('task_id', 'future', 'payload', 'attempts')
+
+    def __init__(
+        self, task_id: int, future: concurrent.futures.Future, payload: bytes
+    ) -> None:
+        self.task_id = task_id
+        self.future = future
+        self.payload = payload
+        # The number of times the task was lost with its worker
+        self.attempts = 0
+
+
+class _ClusterWorker:
+    """
+    The executor side of a connection to a :func:`run_cluster_worker`.
+    """
+
+    __slots__ = ('conn', 'send_lock', 'info', 'last_seen', 'inflight', 'alive')
+
+    def __init__(self, conn: Any, info: dict[str, Any]) -> None:
+        import threading
+        import time
+
+        self.conn = conn
+        self.send_lock = threading.Lock()
+        self.info = info
+        self.last_seen = time.monotonic()
+        self.inflight: dict[int, _ClusterTask] = {}
+        self.alive = True
+
+    def send(self, msg: tuple) -> None:
+        with self.send_lock:
+            self.conn.send(msg)
+
+
+def run_cluster_worker(
+    address: str | tuple[str, int],
+    authkey: bytes,
+    heartbeat: float = 1.0,
+) -> None:
+    """
+    Connects to a :class:`ClusterExecutor` and runs its tasks one at a time
+    until the executor shuts down or the connection is lost.
+
+    This is the entry point of the workers that the executor spawns. Run it
+    on another host to add that host to the pool.
+
+    Args:
+        address (str | Tuple[str, int]):
+            the ``address`` of the executor, either a ``(host, port)`` tuple
+            or the path of a Unix socket.
+
+        authkey (bytes): the ``authkey`` of the executor
+
+        heartbeat (float):
+            seconds between the messages that tell the executor this worker
+            is alive. Defaults to 1.0.
+    """
+    import os
+    import pickle
+    import socket
+    import threading
+    from multiprocessing.connection import Client
+
+    conn = Client(address, authkey=authkey)
+    send_lock = threading.Lock()
+    stop = threading.Event()
+
+    def _send(msg: tuple) -> None:
+        with send_lock:
+            conn.send(msg)
+
+    def _beat() -> None:
+        while not stop.wait(heartbeat):
+            try:
+                _send(('heartbeat',))
+            except (OSError, ValueError):
+                return
+
+    _send(('hello', {'host': socket.gethostname(), 'pid': os.getpid()}))
+    threading.Thread(target=_beat, name='ClusterHeartbeat', daemon=True).start()
+    try:
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break
+            if msg[0] == 'stop':
+                break
+            elif msg[0] == 'init':
+                initializer, initargs = msg[1], msg[2]
+                try:
+                    initializer(*initargs)
+                except Exception as ex:
+                    _send(('init_failed', repr(ex)))
+                    break
+            elif msg[0] == 'task':
+                task_id = msg[1]
+                # Tasks and results are pickled separately from the message
+                # so a failure to (un)pickle one is reported as its error.
+                try:
+                    func, args, kw = pickle.loads(msg[2])
+                    ok, value = True, func(*args, **kw)
+                except Exception as ex:
+                    ok, value = False, ex
+                try:
+                    payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                except Exception as ex:
+                    ok = False
+                    payload = pickle.dumps(
+                        RuntimeError('cannot pickle result: {!r}'.format(ex))
+                    )
+                _send(('result', task_id, ok, payload))
+    finally:
+        stop.set()
+        conn.close()
+
+
+class ClusterExecutor:
+    """
+    Implements the concurrent.futures API by sending tasks to worker
+    processes over a TCP or Unix socket, so the workers can run on other
+    hosts.
+
+    The executor listens on ``address`` and spawns ``max_workers`` local
+    workers with :func:`run_cluster_worker`. More workers can join at any
+    time by running :func:`run_cluster_worker` with the same address and
+    ``authkey``. Each worker runs one task at a time. Tasks and results are
+    pickled, so functions must be importable by the workers.
+
+    Workers send a heartbeat every ``heartbeat`` seconds. A worker that
+    disconnects or is silent for ``heartbeat_timeout`` seconds is dropped and
+    its unfinished task is sent to another worker. A local worker that is
+    dropped is replaced. A task that is lost more than ``max_redispatch``
+    times fails with a :class:`RuntimeError`.
+
+    Warning:
+        Anyone with the ``authkey`` can run arbitrary code on the executor
+        and its workers, so only listen on trusted networks.
+
+    Example:
+        >>> from ubelt.util_futures import ClusterExecutor  # NOQA
+        >>> with ClusterExecutor(max_workers=2) as executor:
+        >>>     host, port = executor.address
+        >>>     futures = [executor.submit(pow, i, 2) for i in range(5)]
+        >>>     print([f.result() for f in futures])
+        [0, 1, 4, 9, 16]
+
+    Example:
+        >>> # Workers can also connect over a Unix socket
+        >>> import ubelt as ub
+        >>> from ubelt.util_futures import ClusterExecutor  # NOQA
+        >>> import sys
+        >>> if sys.platform.startswith('win32'):
+        >>>     import pytest
+        >>>     pytest.skip('requires unix sockets')
+        >>> dpath = ub.Path.appdir('ubelt/tests/cluster').ensuredir()
+        >>> address = str(dpath / 'executor.sock')
+        >>> with ClusterExecutor(max_workers=1, address=address) as executor:
+        >>>     print(list(executor.map(abs, [-1, -2])))
+        [1, 2]
+    """
+
+    max_workers: int
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        address: str | tuple[str, int] | None = None,
+        authkey: bytes | None = None,
+        heartbeat: float = 1.0,
+        heartbeat_timeout: float | None = None,
+        max_redispatch: int = 3,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        """
+        Args:
+            max_workers (int):
+                the number of local workers to spawn. If 0, tasks wait for
+                workers started elsewhere. Defaults to 0.
+
+            address (str | Tuple[str, int] | None):
+                a ``(host, port)`` tuple to listen on TCP, or a path to
+                listen on a Unix socket. Defaults to a free port on
+                127.0.0.1. Use ``('0.0.0.0', port)`` to accept workers from
+                other hosts.
+
+            authkey (bytes | None):
+                the secret that workers must know to connect. Defaults to a
+                random key.
+
+            heartbeat (float):
+                seconds between worker heartbeats. Defaults to 1.0.
+
+            heartbeat_timeout (float | None):
+                seconds without a message after which a worker is considered
+                lost. Defaults to five heartbeats.
+
+            max_redispatch (int):
+                the number of times a task can be lost with its worker
+                before it fails. Defaults to 3.
+
+            initializer (Callable | None):
+                called with ``initargs`` in each worker before it runs any
+                tasks.
+
+            initargs (tuple):
+                arguments passed to ``initializer``.
+        """
+        import itertools as it
+        import os
+        import threading
+        from multiprocessing.connection import Listener
+
+        if authkey is None:
+            authkey = os.urandom(32)
+        if address is None:
+            address = ('127.0.0.1', 0)
+        if heartbeat_timeout is None:
+            heartbeat_timeout = heartbeat * 5
+        self.max_workers = max_workers
+        self.authkey = authkey
+        self.heartbeat = heartbeat
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_redispatch = max_redispatch
+        self._init = None if initializer is None else (initializer, initargs)
+        self._listener = Listener(address, authkey=authkey)
+        self.address = self._listener.address
+        self._cond = threading.Condition()
+        self._queue: collections.deque = collections.deque()
+        self._workers: list[_ClusterWorker] = []
+        # Local worker processes by pid
+        self._processes: dict[int, Any] = {}
+        self._task_ids = it.count()
+        self._shutdown = False
+        self._closed = threading.Event()
+        self._broken: str | None = None
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name='ClusterAccept', daemon=True
+        )
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop, name='ClusterMonitor', daemon=True
+        )
+        self._accept_thread.start()
+        self._monitor_thread.start()
+        for _ in range(max_workers):
+            self._spawn_worker()
+
+    def __enter__(self) -> ClusterExecutor:
+        return self
+
+    def __exit__(
+        self,
+        ex_type: Type[BaseException] | None,
+        ex_value: BaseException | None,
+        ex_traceback: TracebackType | None,
+    ) -> None:
+        """
+        Args:
+            ex_type (Type[BaseException] | None):
+            ex_value (BaseException | None):
+            ex_traceback (TracebackType | None):
+
+        Returns:
+            bool | None
+        """
+        self.shutdown(wait=True)
+        return None
+
+    @property
+    def workers(self) -> list[dict[str, Any]]:
+        """
+        Returns:
+            List[Dict[str, Any]]:
+                the host and pid of each connected worker, and the number of
+                its unfinished tasks.
+        """
+        with self._cond:
+            return [
+                dict(w.info, inflight=len(w.inflight)) for w in self._workers
+            ]
+
+    def _spawn_worker(self) -> None:
+        import multiprocessing
+
+        # Spawned workers share nothing with this process, like remote ones
+        ctx = multiprocessing.get_context('spawn')
+        proc = ctx.Process(
+            target=run_cluster_worker,
+            args=(self.address, self.authkey, self.heartbeat),
+            name='ClusterWorker',
+            daemon=True,
+        )
+        proc.start()
+        self._processes[proc.pid] = proc
+
+    def _accept_loop(self) -> None:
+        import threading
+        from multiprocessing import AuthenticationError
+
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self._closed.is_set():
+                    return
+                continue
+            if self._closed.is_set():
+                conn.close()
+                return
+            threading.Thread(
+                target=self._serve_worker,
+                args=(conn,),
+                name='ClusterWorkerConn',
+                daemon=True,
+            ).start()
+
+    def _serve_worker(self, conn: Any) -> None:
+        """
+        Reads the messages of one worker until it disconnects.
+        """
+        import pickle
+        import time
+
+        try:
+            hello = conn.recv()
+        except (EOFError, OSError):
+            conn.close()
+            return
+        worker = _ClusterWorker(conn, hello[1])
+        try:
+            if self._init is not None:
+                worker.send(('init',) + self._init)
+        except (OSError, ValueError):
+            conn.close()
+            return
+        with self._cond:
+            self._workers.append(worker)
+        self._dispatch()
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break
+            if not worker.alive:
+                break
+            worker.last_seen = time.monotonic()
+            if msg[0] == 'result':
+                _, task_id, ok, payload = msg
+                with self._cond:
+                    task = worker.inflight.pop(task_id, None)
+                    self._cond.notify_all()
+                if task is not None:
+                    try:
+                        value = pickle.loads(payload)
+                    except Exception as ex:
+                        ok, value = False, ex
+                    if ok:
+                        task.future.set_result(value)
+                    else:
+                        task.future.set_exception(value)
+                self._dispatch()
+            elif msg[0] == 'init_failed':
+                self._set_broken(
+                    'a worker initializer failed with {}'.format(msg[1])
+                )
+                break
+        self._lose_worker(worker)
+        conn.close()
+
+    def _monitor_loop(self) -> None:
+        """
+        Drops workers that stopped sending heartbeats.
+        """
+        import time
+
+        while not self._closed.wait(self.heartbeat):
+            now = time.monotonic()
+            with self._cond:
+                stale = [
+                    w
+                    for w in self._workers
+                    if now - w.last_seen > self.heartbeat_timeout
+                ]
+            for worker in stale:
+                self._lose_worker(worker)
+
+    def _dispatch(self) -> None:
+        """
+        Sends queued tasks to idle workers.
+        """
+        sends = []
+        with self._cond:
+            for worker in self._workers:
+                while self._queue and not worker.inflight:
+                    task = self._queue.popleft()
+                    if task.attempts == 0:
+                        if not task.future.set_running_or_notify_cancel():
+                            continue
+                    worker.inflight[task.task_id] = task
+                    sends.append((worker, task))
+        for worker, task in sends:
+            try:
+                worker.send(('task', task.task_id, task.payload))
+            except (OSError, ValueError):
+                self._lose_worker(worker)
+
+    def _lose_worker(self, worker: _ClusterWorker) -> None:
+        """
+        Forgets a worker and queues its unfinished tasks again.
+        """
+        with self._cond:
+            if not worker.alive:
+                return
+            worker.alive = False
+            self._workers.remove(worker)
+            failed = []
+            for task in reversed(list(worker.inflight.values())):
+                task.attempts += 1
+                if task.attempts > self.max_redispatch:
+                    failed.append(task)
+                else:
+                    self._queue.appendleft(task)
+            worker.inflight.clear()
+            self._cond.notify_all()
+            respawn = not self._shutdown and self._broken is None
+            proc = self._processes.pop(worker.info.get('pid'), None)
+        for task in failed:
+            task.future.set_exception(
+                RuntimeError(
+                    'task was lost with its worker {} times'.format(
+                        task.attempts
+                    )
+                )
+            )
+        if proc is not None:
+            # The worker may be hung rather than dead
+            proc.kill()
+            proc.join()
+            if respawn:
+                self._spawn_worker()
+        self._dispatch()
+
+    def _set_broken(self, reason: str) -> None:
+        with self._cond:
+            self._broken = reason
+            tasks = list(self._queue)
+            self._queue.clear()
+            for worker in self._workers:
+                tasks.extend(worker.inflight.values())
+                worker.inflight.clear()
+            self._cond.notify_all()
+        for task in tasks:
+            task.future.set_exception(concurrent.futures.BrokenExecutor(reason))
+
+    def submit(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        **kw: Any,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Queue a job to be sent to a worker
+
+        Returns:
+            concurrent.futures.Future:
+                a future representing the job
+        """
+        import pickle
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            payload = pickle.dumps((func, args, kw), pickle.HIGHEST_PROTOCOL)
+        except Exception as ex:
+            future.set_exception(ex)
+            return future
+        with self._cond:
+            if self._broken is not None:
+                raise concurrent.futures.BrokenExecutor(self._broken)
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._queue.append(
+                _ClusterTask(next(self._task_ids), future, payload)
+            )
+        self._dispatch()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting new tasks, and stops the workers after the submitted
+        tasks finish. If no worker is connected or starting for
+        ``heartbeat_timeout`` seconds, the remaining tasks fail with
+        :class:`concurrent.futures.BrokenExecutor` instead.
+
+        Args:
+            wait (bool):
+                if True, block until the workers are stopped, otherwise
+                stop them in the background. Defaults to True.
+        """
+        import threading
+
+        with self._cond:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        if wait:
+            self._close()
+        else:
+            threading.Thread(
+                target=self._close, name='ClusterShutdown', daemon=True
+            ).start()
+
+    def _close(self) -> None:
+        import time
+        from multiprocessing.connection import Client
+
+        abandoned = False
+        with self._cond:
+            idle_since = None
+            while self._broken is None and (
+                self._queue or any(w.inflight for w in self._workers)
+            ):
+                # Local workers that are still starting may connect later
+                live = self._workers or any(
+                    proc.is_alive() for proc in self._processes.values()
+                )
+                now = time.monotonic()
+                if live:
+                    idle_since = None
+                elif idle_since is None:
+                    idle_since = now
+                elif now - idle_since >= self.heartbeat_timeout:
+                    abandoned = True
+                    break
+                self._cond.wait(self.heartbeat)
+            workers = list(self._workers)
+        if abandoned:
+            self._set_broken('no workers were available to run the tasks')
+        for worker in workers:
+            try:
+                worker.send(('stop',))
+            except (OSError, ValueError):
+                pass
+        self._closed.set()
+        # Wake up the thread that is waiting for connections
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except Exception:  # nocover
+            pass
+        self._accept_thread.join()
+        self._listener.close()
+        self._monitor_thread.join()
+        with self._cond:
+            connected = {w.info.get('pid') for w in self._workers}
+        for pid, proc in list(self._processes.items()):
+            if pid not in connected:
+                # Still starting up, and there is nothing left to run
+                proc.kill()
+            proc.join(timeout=5)
+            if proc.is_alive():  # nocover
+                proc.kill()
+                proc.join()
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        **kwargs: Any,
+    ) -> Generator[T, None, None]:
+        """Returns an iterator equivalent to map(fn, iter).
+
+        Args:
+            fn (Callable[..., T]): Function to apply to items from `iterables`.
+
+            *iterables (Iterable[Any]):
+                One or more iterables supplying arguments to `fn`.
+
+            timeout (float | None):
+                The maximum number of seconds to wait for all results.
+
+            chunksize:
+                This argument is ignored for ClusterExecutor, use
+                :func:`Executor.imap` to send items in chunks.
+
+        Yields:
+            Any: equivalent to: map(func, *iterables)
+        """
+        import time
+
+        kwargs.pop('chunksize', None)
+        timeout = kwargs.pop('timeout', None)
+        if len(kwargs) != 0:  # nocover
+            raise ValueError('Unknown arguments {}'.format(kwargs))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        try:
+            for f in fs:
+                if deadline is None:
+                    yield f.result()
+                else:
+                    yield f.result(max(0.0, deadline - time.monotonic()))
+        finally:
+            for f in fs:
+                f.cancel()
+
+
+class Executor:
+    """
+    A concrete asynchronous executor with a configurable backend.
+
+    The type of parallelism (or lack thereof) is configured via the ``mode``
+    parameter, which can be: "process", "thread", "asyncio", "cluster", or
+    "serial".
+    This allows the user to easily enable / disable parallelism or switch
+    between processes and threads without modifying the surrounding logic.
+
+    SeeAlso:
+        * :class:`concurrent.futures.ThreadPoolExecutor`
+        * :class:`concurrent.futures.ProcessPoolExecutor`
+        * :class:`concurrent.futures.InterpreterPoolExecutor`
+        * :class:`SerialExecutor`
+        * :class:`AsyncIOExecutor`
+        * :class:`ClusterExecutor`
+        * :class:`JobPool`
+
+    In the case where you cant or dont want to use ubelt.Executor you can get
+    similar behavior with the following pure-python snippet:
+
+    .. code:: python
+
+        def Executor(max_workers):
+            # Stdlib-only "ubelt.Executor"-like behavior
+            if max_workers == 1:
+                import contextlib
+                def submit_partial(func, *args, **kwargs):
+                    def wrapper():
+                        return func(*args, **kwargs)
+                    wrapper.result = wrapper
+                    return wrapper
+                executor = contextlib.nullcontext()
+                executor.submit = submit_partial
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            return executor
+
+        executor = Executor(0)
+        with executor:
+            jobs = []
+
+            for arg in range(1000):
+                job = executor.submit(chr, arg)
+                jobs.append(job)
+
+            results = []
+            for job in jobs:
+                result = job.result()
+                results.append(result)
+
+        print('results = {}'.format(ub.urepr(results, nl=1)))
+
+
+    Attributes:
+        backend (SerialExecutor | ThreadPoolExecutor | ProcessPoolExecutor | AsyncIOExecutor | AutoScaleExecutor | ClusterExecutor):
+
+        shared (Dict[str, SharedHandle]):
+            handles to the objects passed as ``shared``, which can be sent to
+            tasks instead of the objects themselves.
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Prototype code using simple serial processing
+        >>> executor = ub.Executor(mode='serial', max_workers=0)
+        >>> jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
+        >>> print([job.result() for job in jobs])
+        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+
+        >>> # Enable parallelism by only changing one parameter
+        >>> executor = ub.Executor(mode='process', max_workers=2)
+        >>> jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
+        >>> print([job.result() for job in jobs])
+        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+
+        >>> # In 3.14 the interpreter backend is available
+        >>> import sys
+        >>> if sys.version_info[0:2] >= (3, 14):
+        >>>     executor = ub.Executor(mode='interpreter', max_workers=2)
+        >>>     jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
+        >>>     results = [job.result() for job in jobs]
+        >>>     assert results == [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+
+        >>> # Send a large lookup table to each worker once, not per task
+        >>> from ubelt.util_futures import _demo_shared_lookup
+        >>> table = {i: chr(i) for i in range(10000)}
+        >>> with ub.Executor('process', 2, shared={'table': table}) as executor:
+        >>>     handle = executor.shared['table']
+        >>>     jobs = [executor.submit(_demo_shared_lookup, handle, i)
+        >>>             for i in range(97, 100)]
+        >>>     print([job.result() for job in jobs])
+        ['a', 'b', 'c']
+
+        >>> # Let the thread pool choose its own size
+        >>> with ub.Executor(mode='thread', max_workers='auto') as executor:
+        >>>     jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
+        >>>     print([job.result() for job in jobs])
+        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+
+        >>> # The asyncio backend runs coroutine functions concurrently
+        >>> import asyncio
+        >>> async def async_sum(items):
+        >>>     await asyncio.sleep(0)
+        >>>     return sum(items)
+        >>> with ub.Executor(mode='asyncio', max_workers=8) as executor:
+        >>>     jobs = [executor.submit(async_sum, [i + 1, i]) for i in range(10)]
+        >>>     print([job.result() for job in jobs])
+        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+
+        >>> # The cluster backend sends tasks to workers over a socket.
+        >>> # Workers on other hosts can join with run_cluster_worker.
+        >>> with ub.Executor(mode='cluster', max_workers=2) as executor:
+        >>>     jobs = [executor.submit(sum, [i + 1, i]) for i in range(10)]
+        >>>     print([job.result() for job in jobs])
+        [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    """
+
+    backend: _ExecutorBackend
+    mode: str
+    max_workers: int
+    shared: dict[str, SharedHandle]
+
+    def __init__(
+        self,
+        mode: str = 'thread',
+        max_workers: int | str = 0,
+        policy: Callable[[Any], int] | None = None,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple = (),
+        shared: dict[str, Any] | None = None,
+        address: str | tuple[str, int] | None = None,
+        authkey: bytes | None = None,
+    ) -> None:
+        """
+        Args:
+            mode (str):
+                The backend parallelism mechanism.  Can be either thread, serial,
+                process, interpreter, asyncio, or cluster. Defaults to 'thread'.
+
+            max_workers (int | str):
+                number of workers. If 0, serial is forced. Defaults to 0.
+                In asyncio mode this is the number of tasks that may run at
+                the same time, and 0 runs them one at a time on the event loop
+                (coroutine functions cannot be run by the serial backend).
+                In thread mode this can be "auto", which uses an
+                :class:`AutoScaleExecutor` that adjusts the number of threads
+                while it runs. In cluster mode this is the number of local
+                workers to spawn, and 0 waits for workers started elsewhere.
+
+            policy (Callable[[AutoScaleStats], int] | None):
+                the policy that chooses the number of threads when
+                ``max_workers="auto"``. See :class:`AutoScalePolicy`.
+
+            initializer (Callable | None):
+                called with ``initargs`` once in each worker before it runs
+                any tasks, e.g. to load a model. In serial and asyncio mode it
+                is called once in the current process.
+
+            initargs (tuple):
+                arguments passed to ``initializer``.
+
+            shared (Dict[str, Any] | None):
+                large read-only objects that tasks need. Each worker receives
+                them once instead of with every task. Process workers inherit
+                them when the start method is "fork", otherwise NumPy arrays
+                are placed in shared memory and other objects are pickled
+                once per worker. Tasks access them through the
+                :class:`SharedHandle` objects in :attr:`Executor.shared`,
+                which stay valid until the executor is shut down. Cluster
+                workers receive a pickled copy when they connect.
+
+            address (str | Tuple[str, int] | None):
+                In cluster mode, the TCP ``(host, port)`` or Unix socket path
+                that workers connect to. See :class:`ClusterExecutor`.
+
+            authkey (bytes | None):
+                In cluster mode, the secret that workers must know to
+                connect. Defaults to a random key.
+        """
+        import functools
+        import multiprocessing
+        import uuid
+        from concurrent import futures
+
+        self.shared = {}
+        self._shared_token: str | None = None
+        self._shared_blocks: list = []
+        self._backend_factory: Callable[[], Any] | None = None
+        # Incremented each time the workers are replaced
+        self._generation = 0
+        # Held while submitting and while the backend is replaced, so no job
+        # is handed to a backend that is shutting down.
+        self._backend_lock = threading.Lock()
+        token = None
+        if shared:
+            token = uuid.uuid4().hex
+            _SHARED_REGISTRY[token] = dict(shared)
+            self._shared_token = token
+            self.shared = {key: SharedHandle(token, key) for key in shared}
+        worker_init = None
+        if self._shared_token is not None or initializer is not None:
+            worker_init = (self._shared_token, None, initializer, initargs)
+
+        backend: _ExecutorBackend
+        if max_workers == 'auto':
+            if mode != 'thread':
+                raise ValueError(
+                    'max_workers="auto" is only supported in thread mode'
+                )
+            autoscale = AutoScaleExecutor(
+                policy=policy, initializer=initializer, initargs=initargs
+            )
+            max_workers = autoscale.max_workers
+            backend = cast(_ExecutorBackend, autoscale)
+        elif not isinstance(max_workers, int):
+            raise ValueError('max_workers must be an int or "auto"')
+        elif policy is not None:
+            raise ValueError('policy requires max_workers="auto"')
+        elif mode != 'cluster' and (address is not None or authkey is not None):
+            raise ValueError('address and authkey require mode="cluster"')
+        elif mode == 'cluster':
+            if worker_init is not None and shared:
+                # Workers on other hosts cannot attach to shared memory
+                payload = {
+                    key: ('object', value) for key, value in shared.items()
+                }
+                worker_init = (token, payload, initializer, initargs)
+            cluster = ClusterExecutor(
+                max_workers=max_workers,
+                address=address,
+                authkey=authkey,
+                initializer=None if worker_init is None else _init_worker,
+                initargs=() if worker_init is None else worker_init,
+            )
+            backend = cast(_ExecutorBackend, cluster)
+        elif mode == 'asyncio':
+            backend = cast(
+                _ExecutorBackend, AsyncIOExecutor(max_workers=max_workers)
+            )
+            if initializer is not None:
+                initializer(*initargs)
+        elif mode == 'serial' or max_workers == 0:
+            backend = SerialExecutor()
+            if initializer is not None:
+                initializer(*initargs)
+        elif mode == 'thread':
+            backend = cast(
+                _ExecutorBackend,
+                futures.ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=initializer,
+                    initargs=initargs,
+                ),
+            )
+        elif mode == 'process':
+            pool_kw: dict[str, Any] = {'max_workers': max_workers}
+            if worker_init is not None:
+                mp_context = multiprocessing.get_context()
+                if shared and mp_context.get_start_method() != 'fork':
+                    payload, self._shared_blocks = _export_shared(shared)
+                    worker_init = (token, payload, initializer, initargs)
+                pool_kw['mp_context'] = mp_context
+                pool_kw['initializer'] = _init_worker
+                pool_kw['initargs'] = worker_init
+            # Kept so the workers can be replaced, see _recycle_workers
+            self._backend_factory = functools.partial(
+                futures.ProcessPoolExecutor, **pool_kw
+            )
+            backend = cast(_ExecutorBackend, self._backend_factory())
+        elif mode == 'interpreter':  # nocover
+            # Requires 3.14+
+            InterpreterPoolExecutor = getattr(
+                futures, 'InterpreterPoolExecutor', None
+            )
+            if InterpreterPoolExecutor is None:
+                raise RuntimeError(
+                    "Executor(mode='interpreter') requires Python 3.14+"
+                )
+            if worker_init is None:
+                backend = InterpreterPoolExecutor(max_workers=max_workers)
+            else:
+                # Interpreters do not share module state with this one
+                if shared:
+                    payload, self._shared_blocks = _export_shared(shared)
+                    worker_init = (token, payload, initializer, initargs)
+                backend = InterpreterPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=worker_init,
+                )
+        else:
+            raise KeyError(mode)
+        self.mode = mode
+        self.max_workers = max_workers
+        self.backend = backend
+
+    def __enter__(self) -> Executor:
+        self.backend.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        ex_type: Type[BaseException] | None,
+        ex_value: BaseException | None,
+        ex_traceback: TracebackType | None,
+    ) -> bool | None:
+        """
+        Args:
+            ex_type (Type[BaseException] | None):
+            ex_value (BaseException | None):
+            ex_traceback (TracebackType | None):
+
+        Returns:
+            bool | None
+        """
+        # Note: the following call will block
+        try:
+            return self.backend.__exit__(ex_type, ex_value, ex_traceback)
+        finally:
+            self._release_shared()
+
+    def submit(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        **kw: Any,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Calls the submit function of the underlying backend.
+
+        Returns:
+            concurrent.futures.Future:
+                a future representing the job
+        """
+        with self._backend_lock:
+            return self.backend.submit(func, *args, **kw)
+
+    def shutdown(self) -> None:
+        """
+        Calls the shutdown function of the underlying backend.
+        """
+        try:
+            return self.backend.shutdown()
+        finally:
+            self._release_shared()
+
+    def _release_shared(self) -> None:
+        """
+        Forgets the shared objects and frees their shared memory.
+        """
+        if self._shared_token is not None:
+            _SHARED_REGISTRY.pop(self._shared_token, None)
+        for block in self._shared_blocks:
+            block.close()
+            block.unlink()
+        self._shared_blocks = []
+
+    def _recycle_workers(self, backend: Any = None) -> bool:
+        """
+        Terminates the worker processes and starts a new pool, which frees
+        workers that are stuck on a task. Jobs that were running in the old
+        pool fail with :class:`BrokenProcessPool`.
+
+        Args:
+            backend (Any): if specified, only recycle if this is still the
+                current backend.
+
+        Returns:
+            bool: False if the backend cannot be recycled
+        """
+        if self._backend_factory is None:
+            return False
+        with self._backend_lock:
+            old = self.backend
+            if backend is not None and backend is not old:
+                # Already replaced by another recycle
+                return False
+            self.backend = cast(_ExecutorBackend, self._backend_factory())
+            self._generation += 1
+        # There is no public API to stop a single worker
+        processes = getattr(old, '_processes', None) or {}
+        for process in list(processes.values()):
+            process.terminate()
+        cast(typing.Any, old).shutdown(wait=False)
+        return True
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """
+        Calls the map function of the underlying backend.
+
+        Args:
+            fn (Callable[..., T]): Function to apply to items from `iterables`.
+            *iterables (Iterable[Any]): One or more iterables supplying arguments to `fn`.
+            **kwargs (Any): Supports:
+                - chunksize (int | str): Chunk size hint for process-based
+                  backends. If "auto", items are lazily grouped into chunks
+                  sized from the measured time per item (see
+                  :func:`Executor.imap`).
+                - timeout (float | None): Optional timeout in seconds.
+
+        Returns:
+            Iterator[T]: Iterator yielding results from applying `fn`.
+
+        CommandLine:
+            xdoctest -m ubelt.util_futures Executor.map
+
+        Example:
+            >>> import ubelt as ub
+            >>> import concurrent.futures
+            >>> import string
+            >>> with ub.Executor(mode='serial') as executor:
+            ...     result_iter = executor.map(int, string.digits)
+            ...     results = list(result_iter)
+            >>> print('results = {!r}'.format(results))
+            results = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+            >>> with ub.Executor(mode='thread', max_workers=2) as executor:
+            ...     result_iter = executor.map(int, string.digits)
+            ...     results = list(result_iter)
+            >>> # xdoctest: +IGNORE_WANT
+            >>> print('results = {!r}'.format(results))
+            results = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        """
+        # Hack for python2
+        chunksize = kwargs.pop('chunksize', 1)
+        timeout = kwargs.pop('timeout', None)
+        if len(kwargs) != 0:  # nocover
+            raise ValueError('Unknown arguments {}'.format(kwargs))
+        if chunksize == 'auto':
+            return self.imap(
+                fn, *iterables, chunksize=chunksize, timeout=timeout
+            )
+        with self._backend_lock:
+            return self.backend.map(
+                fn, *iterables, timeout=timeout, chunksize=chunksize
+            )
+
+    def imap(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        chunksize: int | str = 'auto',
+        timeout: float | None = None,
+    ) -> Generator[T, None, None]:
+        """
+        Lazily maps a function over iterables and yields results in order.
+
+        Unlike :func:`Executor.map`, the inputs are consumed incrementally
+        and only a small number of chunks (twice the number of workers) are
+        in flight at once, so this works with very long or infinite inputs.
+        Grouping items into chunks amortizes the pickling and IPC overhead of
+        each task in process mode.
+
+        Args:
+            fn (Callable[..., T]): Function to apply to items from `iterables`.
+
+            *iterables (Iterable[Any]):
+                One or more iterables supplying arguments to `fn`.
+
+            chunksize (int | str):
+                The number of items sent to a worker at a time. If "auto",
+                the size starts at 1 and is tuned so each chunk takes
+                approximately 50 milliseconds of work. Defaults to "auto".
+
+            timeout (float | None):
+                The maximum number of seconds to wait for all results.
+
+        Yields:
+            T: the result of ``fn`` for each item, in input order.
+
+        Example:
+            >>> import ubelt as ub
+            >>> import itertools as it
+            >>> with ub.Executor(mode='thread', max_workers=2) as executor:
+            ...     # Inputs are consumed lazily, so this can be infinite
+            ...     result_iter = executor.imap(pow, it.count(), it.repeat(2))
+            ...     results = list(it.islice(result_iter, 5))
+            >>> print('results = {!r}'.format(results))
+            results = [0, 1, 4, 9, 16]
+        """
+        return self._imap(fn, iterables, chunksize, timeout, ordered=True)
+
+    def imap_unordered(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        chunksize: int | str = 'auto',
+        timeout: float | None = None,
+    ) -> Generator[T, None, None]:
+        """
+        Like :func:`Executor.imap`, but yields results as soon as their chunk
+        finishes, which may not be the input order.
+
+        Args:
+            fn (Callable[..., T]): Function to apply to items from `iterables`.
+            *iterables (Iterable[Any]): One or more iterables supplying arguments to `fn`.
+            chunksize (int | str): See :func:`Executor.imap`.
+            timeout (float | None): See :func:`Executor.imap`.
+
+        Yields:
+            T: the result of ``fn`` for each item, in completion order.
+
+        Example:
+            >>> import ubelt as ub
+            >>> with ub.Executor(mode='thread', max_workers=4) as executor:
+            ...     results = set(executor.imap_unordered(abs, range(-5, 5)))
+            >>> assert results == {0, 1, 2, 3, 4, 5}
+        """
+        return self._imap(fn, iterables, chunksize, timeout, ordered=False)
+
+    def _imap(
+        self,
+        fn: Callable[..., T],
+        iterables: tuple[Iterable[Any], ...],
+        chunksize: int | str,
+        timeout: float | None,
+        ordered: bool,
+    ) -> Generator[T, None, None]:
+        import collections
+        import itertools as it
+        import time
+
+        sizer = _ChunkSizer(chunksize)
+        arg_iter = zip(*iterables)
+
+        if isinstance(self.backend, SerialExecutor):
+            # Chunking has no benefit without workers
+            for args in arg_iter:
+                yield fn(*args)
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def _remaining() -> float | None:
+            if deadline is None:
+                return None
+            return max(0.0, deadline - time.monotonic())
+
+        # Coroutine functions must be awaited on the event loop, so the
+        # asyncio backend receives one item per task.
+        chunked = not isinstance(self.backend, AsyncIOExecutor)
+        if not chunked:
+            sizer = _ChunkSizer(1)
+
+        # Keep every worker busy with one chunk while the next one waits
+        max_inflight = max(1, self.max_workers) * 2
+        pending: collections.deque = collections.deque()
+        exhausted = False
+
+        def _fill() -> None:
+            nonlocal exhausted
+            while not exhausted and len(pending) < max_inflight:
+                chunk = list(it.islice(arg_iter, sizer.chunksize))
+                if not chunk:
+                    exhausted = True
+                    break
+                if chunked:
+                    future = self.submit(_call_chunk, fn, chunk)
+                else:
+                    future = self.submit(fn, *chunk[0])
+                pending.append((future, len(chunk)))
+
+        def _results(future: Future, num: int) -> list:
+            if not chunked:
+                return [future.result(timeout=_remaining())]
+            results, elapsed = future.result(timeout=_remaining())
+            sizer.update(num, elapsed)
+            return results
+
+        try:
+            _fill()
+            while pending:
+                if ordered:
+                    future, num = pending.popleft()
+                    results = _results(future, num)
+                    _fill()
+                    yield from results
+                else:
+                    done, _ = concurrent.futures.wait(
+                        [f for f, _ in pending],
+                        timeout=_remaining(),
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        raise concurrent.futures.TimeoutError
+                    finished = [item for item in pending if item[0] in done]
+                    for item in finished:
+                        pending.remove(item)
+                    batches = [
+                        _results(future, num) for future, num in finished
+                    ]
+                    _fill()
+                    for results in batches:
+                        yield from results
+        finally:
+            for future, _ in pending:
+                future.cancel()
+
+
+def _call_timed(func: Callable, args: tuple, kwargs: dict) -> tuple:
+    """
+    Runs a job in a worker process and returns its ``(ok, value)`` outcome
+    along with its start and end times and the id of the worker.
+    """
+    import os
+    import threading
+    import time
+
+    start = time.time()
+    try:
+        outcome: tuple = (True, func(*args, **kwargs))
+    except Exception as ex:
+        outcome = (False, ex)
+    return outcome + (start, time.time(), os.getpid(), threading.get_ident())
+
+
+_JobRecord = collections.namedtuple(
+    'JobRecord', ['name', 'submitted', 'start', 'end', 'pid', 'tid', 'ok']
+)
+
+# Upper edges (in seconds) of the duration histogram buckets
+_HISTOGRAM_EDGES = [
+    (1e-4, '<100us'),
+    (1e-3, '<1ms'),
+    (1e-2, '<10ms'),
+    (1e-1, '<100ms'),
+    (1.0, '<1s'),
+    (10.0, '<10s'),
+]
+
+
+def _duration_histogram(durations: list[float]) -> dict[str, int]:
+    import bisect
+
+    edges = [edge for edge, _ in _HISTOGRAM_EDGES]
+    labels = [label for _, label in _HISTOGRAM_EDGES] + ['>=10s']
+    hist = dict.fromkeys(labels, 0)
+    for duration in durations:
+        hist[labels[bisect.bisect_right(edges, duration)]] += 1
+    return hist
+
+
+class JobTelemetry:
+    """
+    Records when each job of a :class:`JobPool` was submitted, started, and
+    finished, and on which worker, when the pool is created with
+    ``telemetry=True``.
+
+    Timestamps are taken with :func:`time.time` inside the worker, so they
+    are comparable across processes. Queue wait is the time between
+    :func:`JobPool.submit` and the start of the job.
+
+    Attributes:
+        records (List[JobRecord]):
+            one record per finished job with the fields
+            ``name, submitted, start, end, pid, tid, ok``.
+
+    Example:
+        >>> import ubelt as ub
+        >>> pool = ub.JobPool('thread', max_workers=2, telemetry=True)
+        >>> with pool:
+        >>>     for i in range(10):
+        >>>         pool.submit(sum, [i, i])
+        >>>     results = pool.join()
+        >>> summary = pool.telemetry.summary()
+        >>> print(summary['num_jobs'])
+        10
+        >>> assert 0 <= summary['utilization']
+        >>> trace = pool.telemetry.to_chrome_trace()
+        >>> assert len(trace['traceEvents']) == 10
+    """
+
+    num_workers: int
+    records: list[Any]
+
+    def __init__(self, num_workers: int = 1) -> None:
+        """
+        Args:
+            num_workers (int):
+                the number of workers, used to compute utilization.
+        """
+        import threading
+
+        self.num_workers = max(1, num_workers)
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        submitted: float,
+        start: float,
+        end: float,
+        pid: int,
+        tid: int,
+        ok: bool,
+    ) -> None:
+        """
+        Adds the timing of one finished job
+        """
+        rec = _JobRecord(name, submitted, start, end, pid, tid, ok)
+        with self._lock:
+            self.records.append(rec)
+
+    def wrap(
+        self, func: Callable[..., T], name: str, submitted: float
+    ) -> Callable[..., T]:
+        """
+        Returns a version of ``func`` that records its timing when it is run
+        in this process.
+        """
+        import functools
+        import inspect
+        import os
+        import threading
+        import time
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.time()
+                ok = False
+                try:
+                    result = await func(*args, **kwargs)
+                    ok = True
+                finally:
+                    self.record(
+                        name,
+                        submitted,
+                        start,
+                        time.time(),
+                        os.getpid(),
+                        threading.get_ident(),
+                        ok,
+                    )
+                return result
+
+            return cast(Callable[..., T], async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            start = time.time()
+            ok = False
+            try:
+                result = func(*args, **kwargs)
+                ok = True
+            finally:
+                self.record(
+                    name,
+                    submitted,
+                    start,
+                    time.time(),
+                    os.getpid(),
+                    threading.get_ident(),
+                    ok,
+                )
+            return result
+
+        return wrapper
+
+    def wrap_future(
+        self, future: concurrent.futures.Future, name: str, submitted: float
+    ) -> concurrent.futures.Future:
+        """
+        Returns a future for the result of a job submitted with
+        :func:`_call_timed` in another process and records its timing when
+        it finishes.
+        """
+        proxy: concurrent.futures.Future = concurrent.futures.Future()
+
+        def _forward_cancel(proxy: concurrent.futures.Future) -> None:
+            if proxy.cancelled():
+                future.cancel()
+
+        def _finish(future: concurrent.futures.Future) -> None:
+            try:
+                if future.cancelled():
+                    proxy.cancel()
+                elif future.exception() is not None:
+                    proxy.set_exception(future.exception())
+                else:
+                    ok, value, start, end, pid, tid = future.result()
+                    self.record(name, submitted, start, end, pid, tid, ok)
+                    if ok:
+                        proxy.set_result(value)
+                    else:
+                        proxy.set_exception(value)
+            except concurrent.futures.InvalidStateError:
+                # The proxy was cancelled while the job was running
+                pass
+
+        proxy.add_done_callback(_forward_cancel)
+        future.add_done_callback(_finish)
+        return proxy
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Aggregates the records into queue wait and run time statistics.
+
+        Returns:
+            Dict[str, Any]:
+                contains ``num_jobs``, ``num_failed``, ``wall_time``,
+                ``throughput`` (jobs per second), ``utilization`` (the
+                fraction of worker time spent running jobs), ``queue_wait``
+                and ``run_time`` statistics, and a histogram of each.
+        """
+        import statistics
+
+        with self._lock:
+            records = list(self.records)
+        waits = sorted(max(0.0, r.start - r.submitted) for r in records)
+        runs = sorted(r.end - r.start for r in records)
+
+        def _stats(values: list[float]) -> dict[str, float]:
+            if not values:
+                return {}
+            return {
+                'mean': statistics.mean(values),
+                'p50': values[len(values) // 2],
+                'p90': values[int(len(values) * 0.9)],
+                'max': values[-1],
+            }
+
+        if records:
+            wall_time = max(r.end for r in records) - min(
+                r.submitted for r in records
+            )
+        else:
+            wall_time = 0.0
+        busy = sum(runs)
+        return {
+            'num_jobs': len(records),
+            'num_failed': sum(not r.ok for r in records),
+            'num_workers_seen': len({(r.pid, r.tid) for r in records}),
+            'wall_time': wall_time,
+            'throughput': len(records) / wall_time if wall_time else 0.0,
+            'utilization': (
+                busy / (self.num_workers * wall_time) if wall_time else 0.0
+            ),
+            'queue_wait': _stats(waits),
+            'run_time': _stats(runs),
+            'queue_wait_hist': _duration_histogram(waits),
+            'run_time_hist': _duration_histogram(runs),
+        }
+
+    def status(self) -> str:
+        """
+        Returns:
+            str: a short line with the current throughput and utilization
+        """
+        import time
+
+        with self._lock:
+            records = list(self.records)
+        if not records:
+            return ''
+        first = min(r.submitted for r in records)
+        elapsed = max(time.time() - first, 1e-9)
+        busy = sum(r.end - r.start for r in records)
+        util = busy / (self.num_workers * elapsed)
+        mean_wait = sum(r.start - r.submitted for r in records) / len(records)
+        return 'jobs/s={:.1f} util={:.0%} wait={:.3g}s'.format(
+            len(records) / elapsed, util, mean_wait
+        )
+
+    def to_chrome_trace(
+        self, fpath: str | os.PathLike | None = None
+    ) -> dict[str, Any]:
+        """
+        Exports the records in the Chrome trace event format, which can be
+        viewed in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+        Each job is a complete event on the row of the worker that ran it.
+
+        Args:
+            fpath (str | PathLike | None):
+                if specified, the trace is also written to this file as JSON.
+
+        Returns:
+            Dict[str, Any]: the trace
+        """
+        import json
+
+        with self._lock:
+            records = list(self.records)
+        origin = min((r.submitted for r in records), default=0.0)
+        events = []
+        for r in records:
+            events.append(
+                {
+                    'name': r.name,
+                    'cat': 'job' if r.ok else 'job,failed',
+                    'ph': 'X',
+                    'ts': (r.start - origin) * 1e6,
+                    'dur': (r.end - r.start) * 1e6,
+                    'pid': r.pid,
+                    'tid': r.tid,
+                    'args': {
+                        'queue_wait_ms': (r.start - r.submitted) * 1e3,
+                        'ok': r.ok,
+                    },
+                }
+            )
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if fpath is not None:
+            with open(fpath, 'w') as file:
+                json.dump(trace, file)
+        return trace
+
+
+def _call_with_retries(
+    func: Callable[..., T],
+    args: tuple,
+    kwargs: dict,
+    retries: int,
+    backoff: float,
+) -> T:
+    """
+    Runs a job inline, retrying it with exponential backoff when it raises.
+    This is how serial jobs are retried.
+    """
+    import time
+
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            if attempt >= retries:
+                raise
+            if backoff:
+                time.sleep(backoff * 2**attempt)
+            attempt += 1
+
+
+class _RetryingJob:
+    """
+    Drives the attempts of a :class:`JobPool` job that has a retry or
+    timeout policy, and resolves :attr:`proxy` with the final outcome.
+
+    Each attempt is submitted with ``submit_attempt``. Failed attempts are
+    resubmitted after ``backoff * 2 ** attempt`` seconds until ``retries``
+    is used up. The pool watchdog calls :func:`check_timeout` to abandon
+    attempts that run longer than ``timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        submit_attempt: Callable[[], concurrent.futures.Future],
+        executor: Executor,
+        retries: int,
+        backoff: float,
+        timeout: float | None,
+        on_timeout: Callable[[concurrent.futures.Future], None],
+    ) -> None:
+        import threading
+        import weakref
+
+        self.proxy: concurrent.futures.Future = concurrent.futures.Future()
+        self.submit_attempt = submit_attempt
+        self.executor = executor
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.on_timeout = on_timeout
+        self.attempt = 0
+        self.future: concurrent.futures.Future | None = None
+        self.started: float | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        # A weak reference avoids a proxy -> callback -> job -> proxy cycle,
+        # which would keep finished jobs alive until the garbage collector
+        # runs.
+        self_ref = weakref.ref(self)
+
+        def _forward_cancel(proxy: concurrent.futures.Future) -> None:
+            job = self_ref()
+            if job is not None:
+                job._forward_cancel(proxy)
+
+        self.proxy.add_done_callback(_forward_cancel)
+
+    def start(self) -> None:
+        """
+        Submits the next attempt
+        """
+        import functools
+        import time
+
+        if self.proxy.done():
+            return
+        generation = self.executor._generation
+        try:
+            future = self.submit_attempt()
+        except Exception as ex:
+            self._finish(exception=ex)
+            return
+        with self._lock:
+            self.future = future
+            self._generation = generation
+            self.started = None
+            # Asyncio futures only report running once they are done, so
+            # their timeout starts at submission.
+            if self.executor.mode == 'asyncio':
+                self.started = time.monotonic()
+        future.add_done_callback(functools.partial(self._on_done, generation))
+
+    def is_pending(self) -> bool:
+        """
+        Returns:
+            bool: True if the current attempt has not started running
+        """
+        future = self.future
+        return future is not None and not (future.running() or future.done())
+
+    def _forward_cancel(self, proxy: concurrent.futures.Future) -> None:
+        if proxy.cancelled():
+            with self._lock:
+                future = self.future
+                self.future = None
+            if future is not None:
+                future.cancel()
+
+    def _finish(
+        self, result: Any = None, exception: BaseException | None = None
+    ) -> None:
+        try:
+            if exception is None:
+                self.proxy.set_result(result)
+            else:
+                self.proxy.set_exception(exception)
+        except concurrent.futures.InvalidStateError:
+            # The job was cancelled while an attempt was running
+            pass
+
+    def _on_done(
+        self, generation: int, future: concurrent.futures.Future
+    ) -> None:
+        from concurrent.futures.process import BrokenProcessPool
+
+        with self._lock:
+            if future is not self.future:
+                # This attempt was abandoned after it timed out
+                return
+            self.future = None
+        if future.cancelled():
+            self.proxy.cancel()
+            return
+        exception = future.exception()
+        if exception is None:
+            self._finish(result=future.result())
+        elif (
+            isinstance(exception, BrokenProcessPool)
+            and generation < self.executor._generation
+        ):
+            # The workers were replaced to free a timed out job, so this
+            # attempt did not fail on its own and does not use a retry.
+            self.start()
+        else:
+            self._retry_or_fail(exception)
+
+    def _retry_or_fail(self, exception: BaseException) -> None:
+        import threading
+
+        if self.proxy.done():
+            return
+        if self.attempt >= self.retries:
+            self._finish(exception=exception)
+            return
+        delay = self.backoff * 2**self.attempt
+        self.attempt += 1
+        if delay > 0:
+            timer = threading.Timer(delay, self.start)
+            timer.daemon = True
+            timer.start()
+        else:
+            self.start()
+
+    def check_timeout(self, now: float) -> None:
+        """
+        Abandons the current attempt if it has run longer than the timeout.
+
+        Args:
+            now (float): the current :func:`time.monotonic` time
+        """
+        if self.timeout is None:
+            return
+        with self._lock:
+            future = self.future
+            if future is None or future.done():
+                return
+            if self.started is None:
+                if future.running():
+                    self.started = now
+                return
+            if now - self.started <= self.timeout:
+                return
+            self.future = None
+        future.cancel()
+        self.on_timeout(future)
+        self._retry_or_fail(
+            concurrent.futures.TimeoutError(
+                'job did not finish within {} seconds'.format(self.timeout)
+            )
+        )
+
+
+class _JobList(MutableSequence):
+    """
+    A list-like view of the jobs tracked by a :class:`JobPool`.
+
+    Reads and mutations go to the pool's registry of jobs, so code that
+    edits ``pool.jobs`` in place, e.g. ``pool.jobs.remove(job)``, changes the
+    pool. Membership tests and removal by value do not scan the jobs.
+
+    Example:
+        >>> import ubelt as ub
+        >>> pool = ub.JobPool('serial')
+        >>> jobs = [pool.submit(abs, -i) for i in range(3)]
+        >>> pool.jobs.remove(jobs[1])
+        >>> len(pool)
+        2
+        >>> pool.jobs == [jobs[0], jobs[2]]
+        True
+        >>> del pool.jobs[0]
+        >>> pool.jobs.append(jobs[0])
+        >>> [job.result() for job in pool.jobs]
+        [2, 0]
+    """
+
+    __slots__ = ('_pool',)
+
+    def __init__(self, pool: JobPool) -> None:
+        self._pool = pool
+
+    def __len__(self) -> int:
+        return len(self._pool._jobs)
+
+    def __iter__(self) -> Iterator[Future]:
+        return iter(list(self._pool._jobs))
+
+    def __contains__(self, job: object) -> bool:
+        return job in self._pool._jobs
+
+    def __getitem__(self, index: Any) -> Any:
+        return list(self._pool._jobs)[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        with self._pool._window_cond:
+            jobs = list(self._pool._jobs)
+            jobs[index] = value
+            self._pool._jobs = dict.fromkeys(jobs)
+
+    def __delitem__(self, index: Any) -> None:
+        with self._pool._window_cond:
+            jobs = list(self._pool._jobs)
+            del jobs[index]
+            self._pool._jobs = dict.fromkeys(jobs)
+
+    def insert(self, index: int, value: Future) -> None:
+        with self._pool._window_cond:
+            jobs = list(self._pool._jobs)
+            jobs.insert(index, value)
+            self._pool._jobs = dict.fromkeys(jobs)
+
+    def append(self, value: Future) -> None:
+        with self._pool._window_cond:
+            self._pool._jobs[value] = None
+
+    def remove(self, value: Future) -> None:
+        with self._pool._window_cond:
+            try:
+                del self._pool._jobs[value]
+            except KeyError:
+                raise ValueError('job is not in the pool') from None
+
+    def clear(self) -> None:
+        with self._pool._window_cond:
+            self._pool._jobs = {}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _JobList):
+            other = list(other)
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class JobPool(typing.Generic[T]):
+    """
+    Abstracts away boilerplate of submitting and collecting jobs
+
+    This is a basic wrapper around :class:`ubelt.util_futures.Executor` that
+    simplifies the most basic case by 1. keeping track of references to
+    submitted futures for you and 2. providing an as_completed method to
+    consume those futures as they are ready.
+
+    Attributes:
+        executor (Executor): internal executor object
+        jobs (MutableSequence[Future]): a list-like view of the tracked jobs
+            in submission order. Editing it in place changes the pool.
+            Note: do not rely on this attribute, it may change in the future.
+        telemetry (JobTelemetry | None):
+            timing records of submitted jobs if ``telemetry=True``.
+
+    Example:
+        >>> import ubelt as ub
+        >>> def worker(data):
+        >>>     return data + 1
+        >>> pool = ub.JobPool('thread', max_workers=16)
+        >>> for data in ub.ProgIter(range(10), desc='submit jobs'):
+        >>>     pool.submit(worker, data)
+        >>> final = []
+        >>> for job in pool.as_completed(desc='collect jobs'):
+        >>>     info = job.result()
+        >>>     final.append(info)
+        >>> print('final = {!r}'.format(final))
+
+    Example:
+        >>> # Urgent jobs can jump ahead of queued batch jobs
+        >>> import ubelt as ub
+        >>> import threading
+        >>> pool = ub.JobPool('thread', max_workers=1, max_inflight=1)
+        >>> order = []
+        >>> release = threading.Event()
+        >>> with pool:
+        >>>     # Keep the only worker busy while the queue fills up
+        >>>     pool.submit(release.wait)
+        >>>     for idx in range(3):
+        >>>         pool.submit(order.append, 'batch', priority=10)
+        >>>     pool.submit(order.append, 'urgent', priority=0)
+        >>>     release.set()
+        >>> print(order)
+        ['urgent', 'batch', 'batch', 'batch']
+    """
+
+    executor: Executor
+    transient: bool
+    max_pending: int | None
+    max_inflight: int | None
+    telemetry: JobTelemetry | None
+    # Insertion ordered registry of jobs, which allows O(1) removal
+    _jobs: dict[Future[T], None]
+
+    def __init__(
+        self,
+        mode: str = 'thread',
+        max_workers: int | str = 0,
+        transient: bool = False,
+        max_pending: int | None = None,
+        max_inflight: int | None = None,
+        telemetry: bool = False,
+        retries: int = 0,
+        backoff: float = 0.0,
+        job_timeout: float | None = None,
+    ) -> None:
+        """
+        Args:
+            mode (str):
+                The backend parallelism mechanism.  Can be either thread, serial,
+                or process. Defaults to 'thread'.
+
+            max_workers (int | str):
+                number of workers. If 0, serial is forced. In thread mode
+                this can be "auto" to adapt the number of threads to the
+                workload. Defaults to 0.
+
+            transient (bool):
+                if True, references to jobs will be discarded as they are
+                returned by :func:`as_completed`. Otherwise the ``jobs`` attribute
+                holds a reference to all jobs ever submitted. Default to False.
+
+            max_pending (int | None):
+                if specified, :func:`JobPool.submit` blocks while this many
+                submitted jobs have not finished, which bounds the number of
+                argument payloads held in memory. In serial mode the oldest
+                pending job is run instead. Combine with ``transient=True``
+                (or use :func:`JobPool.imap`) to also bound the number of
+                completed futures that are kept. Defaults to None.
+
+            max_inflight (int | None):
+                if specified, jobs are held in a priority queue in the pool
+                and at most this many are handed to the executor at a time.
+                The queue is also used when ``submit`` is given a
+                ``priority`` or ``group``, in which case this defaults to the
+                number of workers. Ignored in serial mode.
+
+            telemetry (bool):
+                if True, record when each job was submitted, started, and
+                finished, and which worker ran it, in :attr:`telemetry`.
+                Jobs run by :func:`JobPool.imap` are not recorded.
+                Defaults to False.
+
+            retries (int):
+                the default number of times a failed job is run again.
+                Defaults to 0.
+
+            backoff (float):
+                the default number of seconds to wait before the first retry.
+                The wait doubles with each retry. Defaults to 0.
+
+            job_timeout (float | None):
+                the default number of seconds a job may run before it is
+                abandoned and fails with a TimeoutError (or is retried). In
+                process mode the worker processes are restarted to free the
+                stuck worker, and other running jobs are resubmitted. Jobs
+                submitted before the first job with a timeout cannot be
+                resubmitted, so the restart waits for them to finish. A
+                thread cannot be stopped, so in thread mode the job keeps its
+                worker until it returns. Serial jobs cannot time out.
+                Defaults to None.
+        """
+        import itertools as it
+        import threading
+        import weakref
+
+        if max_pending is not None and max_pending < 1:
+            raise ValueError('max_pending must be positive')
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError('max_inflight must be positive')
+        if retries < 0 or backoff < 0:
+            raise ValueError('retries and backoff must not be negative')
         self.executor = Executor(mode=mode, max_workers=max_workers)
         self.transient = transient
-        self.jobs = []
+        self.max_pending = max_pending
+        self.max_inflight = max_inflight
+        # Priority queue of (priority, order, _QueuedJob) entries
+        self._queue: list = []
+        self._queue_order = it.count()
+        self._queue_groups: dict = {}
+        self._num_queued = 0
+        self._num_inflight = 0
+        self._use_queue = max_inflight is not None
+        self._queue_cond = threading.Condition()
+        self.retries = retries
+        self.backoff = backoff
+        self.job_timeout = job_timeout
+        # Jobs with a retry or timeout policy that have not finished
+        self._retrying: dict[Future, _RetryingJob] = {}
+        # Process workers are only restarted once a job can time out. From
+        # then on every job is submitted so it can be resubmitted.
+        self._may_recycle = mode == 'process' and job_timeout is not None
+        # Executor futures of attempts that are resubmitted if the workers
+        # are restarted
+        self._protected: weakref.WeakSet = weakref.WeakSet()
+        self._watchdog: threading.Thread | None = None
+        self.telemetry = (
+            JobTelemetry(self.executor.max_workers) if telemetry else None
+        )
+        self._jobs = {}
+        # Jobs that count against max_pending
+        self._outstanding: set = set()
+        self._serial_outstanding: collections.deque = collections.deque()
+        self._slot_cond = threading.Condition()
+        # State of an active :func:`JobPool.results` iteration
+        self._window_cond = threading.Condition()
+        self._results_session = 0
+        self._results_active = False
+        self._results_window: int | None = None
+        self._results_ready: Any = None
+        self._num_buffered = 0
+
+    @property
+    def jobs(self) -> _JobList:
+        return _JobList(self)
+
+    @jobs.setter
+    def jobs(self, jobs: Iterable[Future[T]]) -> None:
+        self._jobs = dict.fromkeys(jobs)
 
     def __len__(self) -> int:
-        return len(self.jobs)
+        return len(self._jobs)
 
     def submit(
-        self, func: Callable[..., T], *args: Any, **kwargs: Any
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        priority: float | None = None,
+        group: Any = None,
+        retries: int | None = None,
+        backoff: float | None = None,
+        job_timeout: float | None = None,
+        **kwargs: Any,
     ) -> concurrent.futures.Future[T]:
         """
         Submit a job managed by the pool
@@ -584,18 +3317,633 @@ class JobPool(typing.Generic[T]):
 
             *args : positional arguments to pass to the function
 
+            priority (float | None):
+                if specified, the job waits in the pool's priority queue and
+                jobs with lower values are dispatched first. Jobs with equal
+                priority run in submission order. Defaults to 0 when the
+                queue is in use.
+
+            group (Hashable | None):
+                if specified, queued jobs with the same group key are
+                dispatched together as one task, so they run back to back on
+                the same worker and can reuse its caches. Retry and timeout
+                policies do not apply to jobs in a group.
+
+            retries (int | None):
+                overrides the ``retries`` of the pool for this job.
+
+            backoff (float | None):
+                overrides the ``backoff`` of the pool for this job.
+
+            job_timeout (float | None):
+                overrides the ``job_timeout`` of the pool for this job.
+
             *kwargs : keyword arguments to pass to the function
 
         Returns:
             concurrent.futures.Future:
                 a future representing the job
         """
-        job = self.executor.submit(func, *args, **kwargs)
-        self.jobs.append(job)
+        import time
+
+        if self.max_pending is not None:
+            self._wait_for_slot(self.max_pending)
+        if priority is not None or group is not None:
+            self._use_queue = True
+        submitted = None if self.telemetry is None else time.time()
+        policy = (
+            self.retries if retries is None else retries,
+            self.backoff if backoff is None else backoff,
+            self.job_timeout if job_timeout is None else job_timeout,
+        )
+        if policy[0] < 0 or policy[1] < 0:
+            raise ValueError('retries and backoff must not be negative')
+        if not policy[0] and policy[2] is None:
+            policy = None
+        if self._use_queue and not isinstance(
+            self.executor.backend, SerialExecutor
+        ):
+            # Serial jobs already run in the order their results are needed
+            job = self._enqueue(
+                func, args, kwargs, priority or 0, group, submitted, policy
+            )
+        else:
+            job = self._executor_submit(
+                func, args, kwargs, None, submitted, policy
+            )
+        if self.max_pending is not None:
+            self._track_outstanding(job)
+        with self._window_cond:
+            self._jobs[job] = None
+            if self._results_active:
+                self._watch_result(job)
         return job
 
+    def _executor_submit(
+        self,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+        name: str | None,
+        submitted: float | None,
+        policy: tuple[int, float, float | None] | None,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Submits a job to the executor, applying its retry and timeout policy.
+        """
+        import functools
+
+        if policy is None:
+            if self.executor.mode != 'process' or not self._may_recycle:
+                return self._submit_attempt(func, args, kwargs, name, submitted)
+            # A timed out job restarts every worker process, so any running
+            # process job must be able to be resubmitted.
+            policy = (0, 0.0, None)
+        retries, backoff, timeout = policy
+        if timeout is not None and self.executor.mode == 'process':
+            self._may_recycle = True
+        if isinstance(self.executor.backend, SerialExecutor):
+            # Serial jobs run when their result is requested, so they can be
+            # retried inline, but cannot time out.
+            return self._submit_attempt(
+                _call_with_retries,
+                (func, args, kwargs, retries, backoff),
+                {},
+                name or getattr(func, '__qualname__', None),
+                submitted,
+            )
+        job = _RetryingJob(
+            functools.partial(
+                self._submit_attempt, func, args, kwargs, name, submitted, True
+            ),
+            self.executor,
+            retries,
+            backoff,
+            timeout,
+            self._on_attempt_timeout,
+        )
+        with self._queue_cond:
+            self._retrying[job.proxy] = job
+        job.proxy.add_done_callback(self._forget_retrying)
+        job.start()
+        if timeout is not None:
+            self._ensure_watchdog()
+        return job.proxy
+
+    def _forget_retrying(self, proxy: concurrent.futures.Future) -> None:
+        with self._queue_cond:
+            self._retrying.pop(proxy, None)
+            self._queue_cond.notify_all()
+
+    def _ensure_watchdog(self) -> None:
+        """
+        Starts the thread that enforces job timeouts if it is not running.
+        """
+        import threading
+
+        with self._queue_cond:
+            if self._watchdog is not None:
+                return
+            self._watchdog = threading.Thread(
+                target=self._watch_timeouts, name='JobPoolWatchdog', daemon=True
+            )
+            self._watchdog.start()
+
+    def _watch_timeouts(self) -> None:
+        import time
+
+        while True:
+            with self._queue_cond:
+                jobs = [j for j in self._retrying.values() if j.timeout]
+                if not jobs:
+                    self._watchdog = None
+                    return
+                interval = min(cast(float, j.timeout) for j in jobs) / 10
+            now = time.monotonic()
+            for job in jobs:
+                try:
+                    job.check_timeout(now)
+                except Exception as ex:  # nocover
+                    job._finish(exception=ex)
+            time.sleep(min(max(interval, 0.001), 0.1))
+
+    def _on_attempt_timeout(self, future: concurrent.futures.Future) -> None:
+        """
+        Frees the worker of a timed out attempt when the backend allows it.
+
+        Process workers are freed by restarting all of them, which would also
+        break jobs that were submitted before the first job that could time
+        out. In that case the restart waits until those jobs finish.
+        """
+        import threading
+
+        if not future.running() or self.executor.mode != 'process':
+            return
+        backend = self.executor.backend
+        items = getattr(backend, '_pending_work_items', None) or {}
+        unprotected = [
+            item.future
+            for item in list(items.values())
+            if not item.future.done() and item.future not in self._protected
+        ]
+        if not unprotected:
+            self.executor._recycle_workers(backend)
+            return
+        lock = threading.Lock()
+        remaining = [len(unprotected)]
+
+        def _release(_: concurrent.futures.Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            if future.running():
+                self.executor._recycle_workers(backend)
+
+        for other in unprotected:
+            other.add_done_callback(_release)
+
+    def cancel_pending(self) -> int:
+        """
+        Cancels every job that has not started running, including jobs
+        waiting in the pool's priority queue or waiting to be retried.
+        Jobs that are already running are left alone.
+
+        Returns:
+            int: the number of cancelled jobs
+
+        Example:
+            >>> import ubelt as ub
+            >>> pool = ub.JobPool('serial')
+            >>> jobs = [pool.submit(sum, [i, 1]) for i in range(5)]
+            >>> jobs[0].result()
+            1
+            >>> pool.cancel_pending()
+            4
+            >>> print([job.cancelled() for job in jobs])
+            [False, True, True, True, True]
+        """
+        num = 0
+        with self._queue_cond:
+            retrying = dict(self._retrying)
+        for job in list(self._jobs):
+            if job.cancelled():
+                continue
+            retry = retrying.get(job, None)
+            if retry is None or retry.is_pending() or retry.future is None:
+                # Serial futures can be cancelled until they are run
+                num += job.cancel()
+        return num
+
+    def _submit_attempt(
+        self,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+        name: str | None,
+        submitted: float | None,
+        protect: bool = False,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Submits a job to the executor, recording its timing if telemetry is
+        enabled. ``protect`` marks attempts that are resubmitted if the
+        worker processes are restarted, so a restart does not wait for them.
+        """
+        telemetry = self.telemetry
+        if telemetry is None or submitted is None:
+            future = self.executor.submit(func, *args, **kwargs)
+            if protect:
+                self._protected.add(future)
+            return future
+        if name is None:
+            name = getattr(func, '__qualname__', None) or repr(func)
+        backend = self.executor.backend
+        in_process = self.executor.mode not in {'process', 'interpreter'}
+        if in_process or isinstance(backend, SerialExecutor):
+            wrapped = telemetry.wrap(func, name, submitted)
+            return self.executor.submit(wrapped, *args, **kwargs)
+        # The timing has to be sent back from the worker with the result
+        future = self.executor.submit(_call_timed, func, args, kwargs)
+        if protect:
+            self._protected.add(future)
+        return telemetry.wrap_future(future, name, submitted)
+
+    def _enqueue(
+        self,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+        priority: float,
+        group: Any,
+        submitted: float | None,
+        policy: tuple[int, float, float | None] | None,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Adds a job to the priority queue and returns a future that is
+        resolved when the job is dispatched and finishes.
+        """
+        import heapq
+
+        proxy: concurrent.futures.Future[T] = concurrent.futures.Future()
+        entry = _QueuedJob(proxy, func, args, kwargs, group, submitted, policy)
+        with self._queue_cond:
+            heapq.heappush(
+                self._queue, (priority, next(self._queue_order), entry)
+            )
+            if group is not None:
+                groups = self._queue_groups
+                if group not in groups:
+                    groups[group] = []
+                groups[group].append(entry)
+            self._num_queued += 1
+        self._dispatch()
+        return proxy
+
+    def _pop_batch(self) -> list[_QueuedJob] | None:
+        """
+        Removes the most urgent job, and any queued jobs in its group, from
+        the queue. Must be called while holding the queue lock.
+        """
+        import heapq
+
+        while self._queue:
+            entry = heapq.heappop(self._queue)[2]
+            if entry.taken:
+                # Already dispatched with its group
+                continue
+            if entry.group is None:
+                batch = [entry]
+            else:
+                batch = self._queue_groups.pop(entry.group)
+            for item in batch:
+                item.taken = True
+            self._num_queued -= len(batch)
+            return batch
+        return None
+
+    def _dispatch(self) -> None:
+        """
+        Hands queued jobs to the executor until ``max_inflight`` tasks are
+        running or the queue is empty.
+        """
+        import functools
+
+        limit = self.max_inflight
+        if limit is None:
+            limit = max(1, self.executor.max_workers)
+        while True:
+            with self._queue_cond:
+                if self._num_inflight >= limit:
+                    return
+                window = self._results_window
+                if (
+                    window is not None
+                    and self._num_inflight
+                    and self._num_inflight + self._num_buffered >= window
+                ):
+                    # Wait for the consumer of JobPool.results to catch up.
+                    # Something must stay in flight, or an ordered consumer
+                    # could wait forever on a job that is still queued.
+                    return
+                batch = self._pop_batch()
+                if batch is None:
+                    return
+                self._num_inflight += 1
+            batch = [e for e in batch if e.proxy.set_running_or_notify_cancel()]
+            try:
+                if not batch:
+                    raise concurrent.futures.CancelledError
+                if len(batch) == 1:
+                    e = batch[0]
+                    future = self._executor_submit(
+                        e.func, e.args, e.kwargs, None, e.submitted, e.policy
+                    )
+                else:
+                    calls = [(e.func, e.args, e.kwargs) for e in batch]
+                    future = self._executor_submit(
+                        _call_group,
+                        (calls,),
+                        {},
+                        'group:{}'.format(batch[0].group),
+                        batch[0].submitted,
+                        None,
+                    )
+            except BaseException as ex:
+                for e in batch:
+                    e.proxy.set_exception(ex)
+                self._release_inflight()
+                if not isinstance(ex, concurrent.futures.CancelledError):
+                    raise
+            else:
+                future.add_done_callback(
+                    functools.partial(self._on_dispatched_done, batch)
+                )
+
+    def _release_inflight(self) -> None:
+        with self._queue_cond:
+            self._num_inflight -= 1
+            self._queue_cond.notify_all()
+
+    def _on_dispatched_done(
+        self, batch: list[_QueuedJob], future: concurrent.futures.Future
+    ) -> None:
+        self._release_inflight()
+        # Start the next job before waking anyone waiting on this one
+        self._dispatch()
+        if future.cancelled():
+            for e in batch:
+                e.proxy.set_exception(concurrent.futures.CancelledError())
+        elif future.exception() is not None:
+            for e in batch:
+                e.proxy.set_exception(future.exception())
+        elif len(batch) == 1:
+            batch[0].proxy.set_result(future.result())
+        else:
+            for e, (ok, value) in zip(batch, future.result()):
+                if ok:
+                    e.proxy.set_result(value)
+                else:
+                    e.proxy.set_exception(value)
+
+    def _drain_queue(self) -> None:
+        """
+        Blocks until every queued or retrying job has finished.
+        """
+        with self._queue_cond:
+            while self._num_queued or self._num_inflight or self._retrying:
+                self._queue_cond.wait()
+
+    def _wait_for_slot(self, max_pending: int) -> None:
+        """
+        Blocks until fewer than ``max_pending`` tracked jobs are unfinished.
+        """
+        if isinstance(self.executor.backend, SerialExecutor):
+            # Serial jobs only run when asked, so run the oldest ones
+            while len(self._serial_outstanding) >= max_pending:
+                oldest = self._serial_outstanding.popleft()
+                if not oldest._run_count:
+                    oldest._run()
+        else:
+            with self._slot_cond:
+                while len(self._outstanding) >= max_pending:
+                    self._slot_cond.wait()
+
+    def _track_outstanding(self, job: concurrent.futures.Future[T]) -> None:
+        if isinstance(job, SerialFuture):
+            self._serial_outstanding.append(job)
+            return
+
+        def _release(job: concurrent.futures.Future[T]) -> None:
+            with self._slot_cond:
+                self._outstanding.discard(job)
+                self._slot_cond.notify()
+
+        with self._slot_cond:
+            self._outstanding.add(job)
+        # This runs immediately if the job already finished
+        job.add_done_callback(_release)
+
+    def imap(
+        self,
+        func: Callable[..., T],
+        *iterables: Iterable[Any],
+        max_pending: int | None = None,
+    ) -> Generator[T, None, None]:
+        """
+        Lazily submits ``func`` over the iterables and yields the results in
+        submission order, keeping a bounded number of jobs in flight.
+
+        The futures are not added to :attr:`JobPool.jobs`, so memory usage
+        does not grow with the size of the input.
+
+        Args:
+            func (Callable[..., T]): function to apply to the items
+
+            *iterables (Iterable[Any]): iterables supplying the arguments
+
+            max_pending (int | None):
+                the number of jobs to keep in flight. Defaults to the
+                ``max_pending`` of the pool, or twice the number of workers.
+
+        Yields:
+            T: the result of each job in submission order
+
+        Example:
+            >>> import ubelt as ub
+            >>> import itertools as it
+            >>> pool = ub.JobPool('thread', max_workers=4, max_pending=8)
+            >>> with pool:
+            >>>     results = list(it.islice(pool.imap(abs, it.count(-3)), 6))
+            >>> print(results)
+            [3, 2, 1, 0, 1, 2]
+            >>> assert len(pool) == 0
+        """
+        if max_pending is None:
+            max_pending = self.max_pending
+        if max_pending is None:
+            max_pending = max(1, self.executor.max_workers) * 2
+        if isinstance(self.executor.backend, SerialExecutor):
+            for args in zip(*iterables):
+                yield func(*args)
+            return
+
+        pending: collections.deque = collections.deque()
+        arg_iter = zip(*iterables)
+        try:
+            for args in arg_iter:
+                pending.append(self.executor.submit(func, *args))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for job in pending:
+                job.cancel()
+
+    def results(
+        self,
+        ordered: bool = True,
+        window: int | None = None,
+        timeout: float | None = None,
+    ) -> Generator[T, None, None]:
+        """
+        Yields the results of the jobs in the pool and forgets each job once
+        its result has been yielded.
+
+        Jobs submitted while iterating (e.g. from the loop body to refill
+        the pool) are included. Iteration stops when the pool has no jobs
+        left. If a job raised an exception, it is raised here.
+
+        Args:
+            ordered (bool):
+                if True, yield results in submission order. Otherwise yield
+                them as they complete. Serial pools are always ordered.
+                Defaults to True.
+
+            window (int | None):
+                if specified, jobs submitted from now on wait in the pool's
+                queue, and are only handed to the executor while fewer than
+                ``window`` jobs are running or finished but not yet yielded.
+                This bounds the results buffered behind a slow job while
+                keeping up to ``window`` jobs running. It should be at least
+                the number of workers. Defaults to None (unbounded).
+
+            timeout (float | None):
+                the most seconds to wait for each result.
+
+        Yields:
+            T: the result of each job
+
+        Example:
+            >>> # Stream unbounded inputs in order with constant memory by
+            >>> # submitting a new job each time a result is consumed.
+            >>> import ubelt as ub
+            >>> import itertools as it
+            >>> inputs = it.count()
+            >>> pool = ub.JobPool('thread', max_workers=4)
+            >>> for x in it.islice(inputs, 8):
+            >>>     _ = pool.submit(abs, -x)
+            >>> results = []
+            >>> for result in pool.results(window=8):
+            >>>     results.append(result)
+            >>>     if len(results) < 100:
+            >>>         _ = pool.submit(abs, -next(inputs))
+            >>>     assert len(pool) <= 8
+            >>> assert results[:5] == [0, 1, 2, 3, 4] and len(results) == 107
+            >>> assert len(pool) == 0
+
+        Example:
+            >>> import ubelt as ub
+            >>> pool = ub.JobPool('thread', max_workers=4)
+            >>> for x in [3, 1, 2]:
+            >>>     _ = pool.submit(sum, [x, x])
+            >>> print(sorted(pool.results(ordered=False)))
+            [2, 4, 6]
+        """
+        import queue
+
+        if window is not None and window < 1:
+            raise ValueError('window must be positive')
+        serial = isinstance(self.executor.backend, SerialExecutor)
+        ordered = ordered or serial
+        ready: queue.SimpleQueue = queue.SimpleQueue()
+        cond = self._window_cond
+        with cond:
+            if self._results_active:
+                raise RuntimeError('JobPool.results is already being iterated')
+            self._results_session += 1
+            self._results_active = True
+            # Serial jobs only finish when they are consumed
+            self._results_window = None if serial else window
+            self._results_ready = None if ordered else ready
+            if self._results_window is not None:
+                self._use_queue = True
+            self._num_buffered = 0
+            for job in list(self._jobs):
+                self._watch_result(job)
+        try:
+            while True:
+                if ordered:
+                    with cond:
+                        job = next(iter(self._jobs), None)
+                    if job is None:
+                        return
+                    try:
+                        result = job.result(timeout)
+                    finally:
+                        if job.done():
+                            self._consume_result(job)
+                else:
+                    with cond:
+                        if not self._jobs:
+                            return
+                    try:
+                        job = ready.get(timeout=timeout)
+                    except queue.Empty:
+                        raise concurrent.futures.TimeoutError from None
+                    self._consume_result(job)
+                    result = job.result()
+                yield result
+        finally:
+            with cond:
+                self._results_active = False
+                self._results_window = None
+                self._results_ready = None
+            # Resume dispatching jobs held back by the window
+            self._dispatch()
+
+    def _watch_result(self, job: concurrent.futures.Future[T]) -> None:
+        """
+        Counts the job against the results window once it finishes. Must be
+        called while holding the window lock.
+        """
+        import functools
+
+        job.add_done_callback(
+            functools.partial(self._on_result_ready, self._results_session)
+        )
+
+    def _on_result_ready(
+        self, session: int, job: concurrent.futures.Future[T]
+    ) -> None:
+        with self._window_cond:
+            if session != self._results_session or not self._results_active:
+                return
+            self._num_buffered += 1
+            if self._results_ready is not None:
+                self._results_ready.put(job)
+
+    def _consume_result(self, job: concurrent.futures.Future[T]) -> None:
+        with self._window_cond:
+            self._jobs.pop(job, None)
+            self._num_buffered -= 1
+            window = self._results_window
+        if window is not None:
+            self._dispatch()
+
     def shutdown(self) -> None:
-        self.jobs = []
+        self._drain_queue()
+        self._jobs = {}
         return self.executor.shutdown()
 
     def __enter__(self) -> JobPool[T]:
@@ -617,11 +3965,13 @@ class JobPool(typing.Generic[T]):
         Returns:
             bool | None
         """
+        self._drain_queue()
         return self.executor.__exit__(ex_type, ex_value, ex_traceback)
 
     def _clear_completed(self) -> None:
-        active_jobs = [job for job in self.jobs if job.running()]
-        self.jobs = active_jobs
+        completed = [job for job in self._jobs if job.done()]
+        for job in completed:
+            del self._jobs[job]
 
     def as_completed(
         self,
@@ -673,22 +4023,24 @@ class JobPool(typing.Generic[T]):
         from ubelt.progiter import ProgIter
 
         job_iter: Iterable[concurrent.futures.Future[T]] = as_completed(
-            self.jobs, timeout=timeout
+            self._jobs, timeout=timeout
         )
         if desc is not None:
             if progkw is None:
                 progkw = {}
-            job_iter = ProgIter(
-                job_iter, desc=desc, total=len(self.jobs), **progkw
+            prog = ProgIter(
+                job_iter, desc=desc, total=len(self._jobs), **progkw
             )
+            if self.telemetry is not None:
+                # Show live throughput and utilization
+                prog.set_extra(self.telemetry.status)
+            job_iter = prog
             # adding types to ProgIter should make this not a problem
             self._prog = job_iter
+        jobs = self._jobs
         for job in job_iter:
             if self.transient:
-                # Maybe keep a reference to the job index and then null it out
-                # in our job list? Should probably think about a good
-                # implementation. See kwcoco.CocoDataset._load_multiple
-                self.jobs.remove(job)
+                jobs.pop(job, None)
             yield job
 
     def join(self, **kwargs: Any) -> list[T]:
@@ -732,7 +4084,8 @@ class JobPool(typing.Generic[T]):
 
         NOTE:
             The order of iteration may be changed in the future to be the
-            submission order instead.
+            submission order instead. Use :func:`JobPool.results` to get
+            results in submission order.
 
         Yields:
             concurrent.futures.Future:
@@ -9,7 +9,9 @@ following example demonstrates this.
 In Python 3.8+ :func:`memoize` works similarly to the standard library
 :func:`functools.cache`, but the ubelt version makes use of
 :func:`ubelt.util_hash.hash_data`, which is slower, but handles inputs
-containing mutable containers.
+containing mutable containers. Like :func:`functools.lru_cache`, the size of
+the cache can be bounded with ``maxsize`` and entries can expire after ``ttl``
+seconds.
 
 Example:
     >>> import ubelt as ub
@@ -47,8 +49,9 @@ Example:
 
 from __future__ import annotations
 
+import collections
 import functools
-import sys
+import os
 import typing
 
 from ubelt import util_hash
@@ -60,29 +63,47 @@ except ImportError:  # pragma: no cover
     from typing_extensions import Concatenate, ParamSpec
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Hashable
     from typing import Callable
 
-    CacheKey = tuple[object, object]
+    CacheKey = Hashable
 
 
 # TODO: Need to think if we can fix any of the typing ignores in this file.
 
-__all__ = ['memoize', 'memoize_method', 'memoize_property']
+__all__ = ['SharedCache', 'memoize', 'memoize_method', 'memoize_property']
 
 P = ParamSpec('P')
 T = typing.TypeVar('T')
 S = typing.TypeVar('S')
 
+_CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'maxsize', 'currsize']
+)
+_CacheInfo.__doc__ = 'Cache statistics reported by ``cache_info``'
+
+
+# Marks the start of keyword arguments in a flattened signature key
+_KWD_MARK = object()
+# Marks an argument that was replaced by its hash_data digest
+_UNHASHABLE_MARK = object()
+# Types that hash to themselves quickly and never compare equal to a tuple, so
+# a single argument of these types can be used as the key directly.
+_FASTTYPES = frozenset({int, str})
+
 
 def _hashable(item: object) -> object:
     """
     Returns the item if it is naturally hashable, otherwise it tries to use
     ubelt.util_hash.hash_data to make it hashable. Errors if it cannot.
+
+    The digest of an unhashable item is tagged so it can never collide with a
+    string argument that happens to have the same value.
     """
     try:
         hash(item)
     except TypeError:
-        return util_hash.hash_data(item)
+        return (_UNHASHABLE_MARK, util_hash.hash_data(item))
     else:
         return item
 
@@ -94,12 +115,23 @@ def _make_signature_key(
     """
     Transforms function args into a key that can be used by the cache
 
+    The key is flattened like the one used by :func:`functools.lru_cache`.
+    Calls with a single int or str argument use that argument as the key,
+    calls without keyword arguments use the args tuple, and only the
+    arguments that are not natively hashable are passed to
+    :func:`ubelt.util_hash.hash_data`.
+
     Example:
         >>> from ubelt.util_memoize import _make_signature_key
         >>> args = (4, [1, 2])
         >>> kwargs = {'a': 'b'}
         >>> key = _make_signature_key(args, kwargs)
         >>> print('key = {!r}'.format(key))
+        >>> assert _make_signature_key((4,), {}) == 4
+        >>> assert _make_signature_key((4, 5), {}) == (4, 5)
+        >>> # Keyword arguments cannot be confused with positional ones
+        >>> assert (_make_signature_key((1,), {'a': 2}) !=
+        >>>         _make_signature_key((1, ('a', 2)), {}))
         >>> # Some mutable types cannot be handled by ub.hash_data
         >>> import pytest
         >>> from collections import abc
@@ -114,23 +146,89 @@ def _make_signature_key(
         >>> with pytest.raises(TypeError):
         >>>     _make_signature_key((Dummy(),), kwargs={})
     """
-    kwitems: typing.Iterable[tuple[str, object]] = kwargs.items()
-    # TODO: we should check if Python is at least 3.7 and sort by kwargs
-    # keys otherwise. Should we use hash_data for key generation
-    if (sys.version_info.major, sys.version_info.minor) < (3, 7):  # nocover
-        # We can sort because they keys are guaranteed to be strings
-        kwitems = sorted(kwitems)
-    kwitems = tuple(kwitems)
-
+    if kwargs:
+        key: tuple = args + (_KWD_MARK,) + tuple(kwargs.items())
+    elif len(args) == 1 and type(args[0]) in _FASTTYPES:
+        return args[0]
+    else:
+        key = args
     try:
-        key = _hashable(args), _hashable(kwitems)
+        hash(key)
     except TypeError:
-        msg = 'Signature is not hashable: args={} kwargs{}'.format(args, kwargs)
-        raise TypeError(msg)
+        try:
+            key = tuple(_hashable(v) for v in args)
+            if kwargs:
+                key += (_KWD_MARK,) + tuple(
+                    (k, _hashable(v)) for k, v in kwargs.items()
+                )
+        except TypeError:
+            msg = 'Signature is not hashable: args={} kwargs{}'.format(
+                args, kwargs
+            )
+            raise TypeError(msg)
     return key
 
 
-def memoize(func: Callable[P, T]) -> Callable[P, T]:
+def _make_typed_signature_key(
+    args: tuple[object, ...],
+    kwargs: typing.Mapping[str, object],
+) -> CacheKey:
+    """
+    Like :func:`_make_signature_key`, but arguments of different types
+    produce different keys.
+
+    Example:
+        >>> from ubelt.util_memoize import _make_typed_signature_key
+        >>> key1 = _make_typed_signature_key((3,), {'a': 1})
+        >>> key2 = _make_typed_signature_key((3.0,), {'a': 1})
+        >>> assert key1 != key2
+    """
+    key = _make_signature_key(args, kwargs)
+    types = tuple(type(v) for v in args) + tuple(
+        type(v) for v in kwargs.values()
+    )
+    return key, types
+
+
+@typing.overload
+def memoize(
+    func: Callable[P, T],
+    *,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    typed: bool = False,
+    lock: str | None = None,
+    persist: bool = False,
+    dpath: str | os.PathLike | None = None,
+    shared: SharedCache | None = None,
+) -> Callable[P, T]: ...
+
+
+@typing.overload
+def memoize(
+    func: None = None,
+    *,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    typed: bool = False,
+    lock: str | None = None,
+    persist: bool = False,
+    dpath: str | os.PathLike | None = None,
+    shared: SharedCache | None = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def memoize(
+    func: Callable[P, T] | None = None,
+    *,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    typed: bool = False,
+    lock: str | None = None,
+    persist: bool = False,
+    dpath: str | os.PathLike | None = None,
+    shared: SharedCache | None = None,
+) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
     """
     memoization decorator that respects args and kwargs
 
@@ -138,11 +236,65 @@ def memoize(func: Callable[P, T]) -> Callable[P, T]:
     currently faster than memoize for simple functions [FunctoolsCache]_.
     However, memoize can handle more general non-natively hashable inputs.
 
+    This can be used directly as ``@memoize`` or with options as
+    ``@memoize(maxsize=128, ttl=60)``.
+
     Args:
-        func (Callable): live python function
+        func (Callable | None): live python function
+
+        maxsize (int | None):
+            If specified, the cache holds at most this many results and the
+            least recently used result is evicted first. If None, the cache
+            can grow without bound. Defaults to None.
+
+        ttl (float | None):
+            If specified, cached results expire this many seconds after they
+            are computed. Defaults to None.
+
+        typed (bool):
+            If True, arguments of different types are cached separately, e.g.
+            ``f(3)`` and ``f(3.0)``. Defaults to False.
+
+        lock (str | None):
+            If None, concurrent callers that miss the cache each compute the
+            result. If "per-key", the first caller computes the result and
+            other threads calling with the same arguments wait for it
+            (single-flight). Calls with different arguments still run
+            concurrently. Defaults to None.
+
+        persist (bool):
+            If True, results are also written to disk with a
+            :class:`ubelt.util_cache.Cacher` keyed by the
+            :func:`ubelt.util_hash.hash_data` digest of the arguments. An
+            in-memory miss then checks the disk before calling the function,
+            so results are reused across processes. Results must be
+            picklable. The disk cache is not invalidated when the code of the
+            function changes, and ``cache_clear`` only clears the in-memory
+            cache. Defaults to False.
+
+        dpath (str | PathLike | None):
+            The directory for the persistent cache. Defaults to a
+            "ubelt/memoize" folder in the application cache directory.
+            Only used if ``persist`` is True.
+
+        shared (SharedCache | None):
+            If specified, an in-memory miss checks this cross-process store
+            before calling the function (or the persistent tier), and new
+            results are published to it. This lets sibling worker processes
+            reuse each other's results. Defaults to None.
 
     Returns:
-        Callable: memoized wrapper
+        Callable: memoized wrapper. It has a ``cache_info`` method that
+        returns the number of hits, misses, and the current size of the cache
+        and a ``cache_clear`` method that empties it.
+
+    Note:
+        If ``func`` is a coroutine function, the wrapper is also a coroutine
+        function and the cache stores the :class:`asyncio.Task` created for
+        each signature. Concurrent awaits of the same arguments share one
+        task, and tasks that raise or are cancelled are removed from the
+        cache so they can be retried. The ``ttl`` is measured from when the
+        task was started.
 
     References:
         .. [WikiMemoize] https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize
@@ -170,21 +322,675 @@ def memoize(func: Callable[P, T]) -> Callable[P, T]:
         >>> assert foo('a') == 0 and foo('c') == 1
         >>> assert incr[0] == 6
         >>> assert foo_memo('a') == 'b' and foo_memo('c') == 'd'
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Bound the cache size, evicting least recently used results
+        >>> @ub.memoize(maxsize=2)
+        >>> def square(x):
+        >>>     return x ** 2
+        >>> square(1), square(2), square(1), square(3)
+        >>> print(square.cache_info())
+        CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+        >>> # The result for 2 was the least recently used, so it was evicted
+        >>> print(list(square.cache.values()))
+        [1, 9]
+        >>> square.cache_clear()
+        >>> print(square.cache_info())
+        CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Unhashable arguments are still supported by bounded caches
+        >>> calls = []
+        >>> @ub.memoize(maxsize=8, ttl=1000, typed=True)
+        >>> def total(items):
+        >>>     calls.append(items)
+        >>>     return sum(items)
+        >>> assert total([1, 2]) == 3 and total([1, 2]) == 3
+        >>> assert total((1, 2)) == 3
+        >>> assert len(calls) == 2
+        >>> print(total.cache_parameters())
+        {'maxsize': 8, 'ttl': 1000, 'typed': True, 'lock': None}
+
+    Example:
+        >>> import ubelt as ub
+        >>> import asyncio
+        >>> # Coroutine functions cache the task, so results can be awaited
+        >>> # many times and concurrent callers share the same computation.
+        >>> calls = []
+        >>> @ub.memoize
+        >>> async def fetch(key):
+        >>>     calls.append(key)
+        >>>     await asyncio.sleep(0.01)
+        >>>     return key.upper()
+        >>> async def main():
+        >>>     first = await asyncio.gather(*[fetch('a') for _ in range(4)])
+        >>>     second = await fetch('a')
+        >>>     return first, second
+        >>> first, second = asyncio.run(main())
+        >>> assert first == ['A'] * 4 and second == 'A'
+        >>> assert calls == ['a']
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Persist results to disk so later processes can reuse them
+        >>> dpath = ub.Path.appdir('ubelt/tests/memoize/doctest').delete()
+        >>> calls = []
+        >>> def expensive(x):
+        >>>     calls.append(x)
+        >>>     return x * 2
+        >>> first = ub.memoize(expensive, persist=True, dpath=dpath)
+        >>> assert first(21) == 42 and first(21) == 42
+        >>> # A new wrapper (e.g. in a new process) loads the result from disk
+        >>> second = ub.memoize(expensive, persist=True, dpath=dpath)
+        >>> assert second(21) == 42
+        >>> assert calls == [21]
+
+    Example:
+        >>> import ubelt as ub
+        >>> import time
+        >>> # With a per-key lock, concurrent calls compute the result once
+        >>> calls = []
+        >>> @ub.memoize(lock='per-key')
+        >>> def slow_square(x):
+        >>>     calls.append(x)
+        >>>     time.sleep(0.01)
+        >>>     return x ** 2
+        >>> with ub.Executor(mode='thread', max_workers=4) as executor:
+        >>>     results = list(executor.map(slow_square, [3] * 8))
+        >>> assert results == [9] * 8
+        >>> assert calls == [3]
     """
-    cache = {}
+    if lock not in {None, 'per-key'}:
+        raise KeyError(lock)
+    single_flight = lock == 'per-key'
 
-    @functools.wraps(func)
-    def memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
-        key = _make_signature_key(args, cast(Mapping, kwargs))
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
+    if func is None:
+
+        def _decorator(func: Callable[P, T]) -> Callable[P, T]:
+            return memoize(
+                func,
+                maxsize=maxsize,
+                ttl=ttl,
+                typed=typed,
+                lock=lock,
+                persist=persist,
+                dpath=dpath,
+                shared=shared,
+            )
+
+        return _decorator
+
+    if persist:
+        func = _tiered(func, _CacherTier(_func_name(func), dpath))
+    if shared is not None:
+        func = _tiered(func, _SharedTier(_func_name(func), shared))
+
+    if _iscoroutinefunction(func):
+        return _memoize_coroutine(
+            func, maxsize=maxsize, ttl=ttl, typed=typed, lock=lock
+        )
+
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+
+    fasttypes = _FASTTYPES
+    make_key = _make_signature_key
+    if typed:
+        make_key = _make_typed_signature_key
+
+    # hits and misses
+    stats = [0, 0]
+
+    if maxsize is None and ttl is None and not single_flight:
+        cache: dict = {}
+
+        @functools.wraps(func)
+        def memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
+            # Inline the common cases of _make_signature_key to avoid the
+            # function call overhead for cheap functions.
+            if kwargs or typed:
+                key = make_key(args, cast(Mapping, kwargs))
+            elif len(args) == 1 and type(args[0]) in fasttypes:
+                key = args[0]
+            else:
+                key = args
+                try:
+                    hash(key)
+                except TypeError:
+                    key = make_key(args, cast(Mapping, kwargs))
+            try:
+                result = cache[key]
+            except KeyError:
+                stats[1] += 1
+                result = cache[key] = func(*args, **kwargs)
+            else:
+                stats[0] += 1
+            return result
+
+        def cache_clear() -> None:
+            cache.clear()
+            stats[:] = [0, 0]
+
+    else:
+        import threading
+        import time
+
+        # An ordered dictionary gives us O(1) LRU bookkeeping.
+        cache = collections.OrderedDict()
+        # Insertion ordered (and therefore expiration ordered) timestamps
+        expires_at: dict = {}
+        # Maps keys that are currently being computed to an event that is set
+        # when the computation finishes.
+        inflight: dict = {}
+        mutex = threading.Lock()
+        clock = time.monotonic
+
+        def _purge_expired(now: float) -> None:
+            # Expiration times are in insertion order, so we can stop at the
+            # first one that has not expired.
+            while expires_at:
+                key = next(iter(expires_at))
+                if expires_at[key] > now:
+                    break
+                del expires_at[key]
+                cache.pop(key, None)
+
+        @functools.wraps(func)
+        def memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
+            if kwargs or typed:
+                key = make_key(args, cast(Mapping, kwargs))
+            elif len(args) == 1 and type(args[0]) in fasttypes:
+                key = args[0]
+            else:
+                key = args
+                try:
+                    hash(key)
+                except TypeError:
+                    key = make_key(args, cast(Mapping, kwargs))
+            while True:
+                with mutex:
+                    if ttl is not None:
+                        _purge_expired(clock())
+                    try:
+                        result = cache[key]
+                    except KeyError:
+                        pass
+                    else:
+                        stats[0] += 1
+                        cache.move_to_end(key)
+                        return result
+                    if not single_flight:
+                        stats[1] += 1
+                        break
+                    event = inflight.get(key, None)
+                    if event is None:
+                        stats[1] += 1
+                        event = inflight[key] = threading.Event()
+                        break
+                # Another thread is computing this key. Wait for it and then
+                # check the cache again. If it failed, we will try ourselves.
+                event.wait()
+            try:
+                result = func(*args, **kwargs)
+                if maxsize != 0:
+                    with mutex:
+                        cache[key] = result
+                        cache.move_to_end(key)
+                        if ttl is not None:
+                            expires_at.pop(key, None)
+                            expires_at[key] = clock() + ttl
+                        if maxsize is not None:
+                            while len(cache) > maxsize:
+                                old_key, _ = cache.popitem(last=False)
+                                expires_at.pop(old_key, None)
+            finally:
+                if single_flight:
+                    with mutex:
+                        inflight.pop(key, None)
+                    event.set()
+            return result
+
+        def cache_clear() -> None:
+            with mutex:
+                cache.clear()
+                expires_at.clear()
+                stats[:] = [0, 0]
+
+    def cache_info() -> _CacheInfo:
+        return _CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+    def cache_parameters() -> dict:
+        return {'maxsize': maxsize, 'ttl': ttl, 'typed': typed, 'lock': lock}
 
     # memoizer.cache = cache
     setattr(memoizer, 'cache', cache)
+    setattr(memoizer, 'cache_info', cache_info)
+    setattr(memoizer, 'cache_clear', cache_clear)
+    setattr(memoizer, 'cache_parameters', cache_parameters)
     return memoizer
 
 
+def _func_name(func: Callable) -> str:
+    """
+    A name for a function that is safe to use as a file name prefix.
+    """
+    import re
+
+    name = '{}.{}'.format(
+        getattr(func, '__module__', None),
+        getattr(func, '__qualname__', getattr(func, '__name__', 'func')),
+    )
+    return re.sub(r'[^\w.-]+', '_', name)
+
+
+class _CacherTier:
+    """
+    Stores memoized results on disk with :class:`ubelt.util_cache.Cacher`.
+    """
+
+    def __init__(self, name: str, dpath: str | os.PathLike | None = None):
+        self.name = name
+        self.cacher_kw: dict = {'dpath': dpath, 'verbose': 0}
+        if dpath is None:
+            self.cacher_kw['appname'] = 'ubelt/memoize'
+
+    def key(self, args: tuple, kwargs: dict) -> str:
+        return util_hash.hash_data([args, kwargs])
+
+    def load(self, key: str) -> tuple[bool, typing.Any]:
+        from ubelt.util_cache import Cacher
+
+        try:
+            return True, Cacher(self.name, depends=key, **self.cacher_kw).load()
+        except Exception:
+            # Missing or corrupted entries are recomputed
+            return False, None
+
+    def save(self, key: str, value: typing.Any) -> None:
+        from ubelt.util_cache import Cacher
+
+        Cacher(self.name, depends=key, **self.cacher_kw).save(value)
+
+
+class _SharedTier:
+    """
+    Stores memoized results in a :class:`SharedCache`.
+    """
+
+    def __init__(self, name: str, store: SharedCache):
+        self.name = name
+        self.store = store
+
+    def key(self, args: tuple, kwargs: dict) -> str:
+        # The store may be shared by several functions
+        return util_hash.hash_data([self.name, args, kwargs])
+
+    def load(self, key: str) -> tuple[bool, typing.Any]:
+        return self.store.load(key)
+
+    def save(self, key: str, value: typing.Any) -> None:
+        self.store.save(key, value)
+
+
+def _tiered(func: Callable, tier: typing.Any) -> Callable:
+    """
+    Wraps a function so its results are loaded from and saved to a slower
+    cache tier keyed by the :func:`ubelt.util_hash.hash_data` digest of its
+    arguments. Arguments that cannot be hashed by ``hash_data`` bypass the
+    tier.
+
+    Example:
+        >>> from ubelt.util_memoize import _tiered, _CacherTier, _func_name
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/memoize/_tiered').delete()
+        >>> calls = []
+        >>> def func(x, y=None):
+        >>>     calls.append(x)
+        >>>     return None
+        >>> persistent = _tiered(func, _CacherTier(_func_name(func), dpath))
+        >>> assert persistent(1, y=[2]) is None
+        >>> assert persistent(1, y=[2]) is None
+        >>> assert calls == [1]
+        >>> assert len(list(dpath.glob('*.pkl'))) == 1
+    """
+
+    def _key(args: tuple, kwargs: dict) -> str | None:
+        try:
+            return tier.key(args, kwargs)
+        except TypeError:
+            return None
+
+    if _iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def tiered(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            key = _key(args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+            found, result = tier.load(key)
+            if not found:
+                result = await func(*args, **kwargs)
+                tier.save(key, result)
+            return result
+
+    else:
+
+        @functools.wraps(func)
+        def tiered(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            key = _key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            found, result = tier.load(key)
+            if not found:
+                result = func(*args, **kwargs)
+                tier.save(key, result)
+            return result
+
+    return tiered
+
+
+class SharedCache:
+    """
+    A store of memoized results that is shared between processes.
+
+    Results are serialized and published to a dictionary held by a
+    :class:`multiprocessing.managers.SyncManager` server process and are keyed
+    by the :func:`ubelt.util_hash.hash_data` digest of the function name and
+    its arguments. The store can be passed to worker processes (e.g. as an
+    argument of a job submitted to :class:`ubelt.Executor`) and used with
+    ``ub.memoize(shared=store)`` so workers reuse results computed by their
+    siblings.
+
+    Results that cannot be serialized, or that are larger than
+    ``max_item_bytes``, are not shared. Once the store holds ``maxsize``
+    results new results are no longer published.
+
+    Example:
+        >>> # xdoctest: +REQUIRES(--slow)
+        >>> import ubelt as ub
+        >>> with ub.SharedCache(maxsize=100) as store:
+        >>>     with ub.Executor(mode='process', max_workers=2) as executor:
+        >>>         jobs = [executor.submit(_demo_shared_worker, x, store)
+        >>>                 for x in [1, 2, 1, 2]]
+        >>>         results = [job.result() for job in jobs]
+        >>>     assert results == [1, 4, 1, 4]
+        >>>     assert len(store) == 2
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        max_item_bytes: int | None = None,
+        serializer: str | tuple[Callable, Callable] = 'pickle',
+        manager: typing.Any | None = None,
+    ) -> None:
+        """
+        Args:
+            maxsize (int | None):
+                The maximum number of results to hold. Defaults to None,
+                which is unbounded.
+
+            max_item_bytes (int | None):
+                Serialized results larger than this are not shared.
+                Defaults to None, which is unbounded.
+
+            serializer (str | Tuple[Callable, Callable]):
+                Either "pickle", "json", or a tuple of ``(dumps, loads)``
+                functions that convert results to and from bytes.
+                Defaults to "pickle".
+
+            manager (SyncManager | None):
+                An existing started manager to host the store. If None, a new
+                one is started and is shut down by :func:`SharedCache.close`.
+        """
+        if isinstance(serializer, str):
+            if serializer not in {'pickle', 'json'}:
+                raise KeyError(serializer)
+        self.maxsize = maxsize
+        self.max_item_bytes = max_item_bytes
+        self.serializer = serializer
+        self._owns_manager = manager is None
+        if manager is None:
+            import multiprocessing
+
+            manager = multiprocessing.Manager()
+        self._manager = manager
+        self._data = manager.dict()
+
+    def __getstate__(self) -> dict:
+        # The manager stays in the creating process, only the proxy is sent
+        state = self.__dict__.copy()
+        state['_manager'] = None
+        state['_owns_manager'] = False
+        return state
+
+    def __enter__(self) -> SharedCache:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _dumps(self, value: typing.Any) -> bytes:
+        if self.serializer == 'pickle':
+            import pickle
+
+            return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        elif self.serializer == 'json':
+            import json
+
+            return json.dumps(value).encode('utf8')
+        else:
+            return self.serializer[0](value)  # type: ignore[index]
+
+    def _loads(self, data: bytes) -> typing.Any:
+        if self.serializer == 'pickle':
+            import pickle
+
+            return pickle.loads(data)
+        elif self.serializer == 'json':
+            import json
+
+            return json.loads(data.decode('utf8'))
+        else:
+            return self.serializer[1](data)  # type: ignore[index]
+
+    def load(self, key: str) -> tuple[bool, typing.Any]:
+        """
+        Args:
+            key (str): digest of the function name and arguments
+
+        Returns:
+            Tuple[bool, Any]: a flag indicating if the key was found and the
+            deserialized result.
+        """
+        data = self._data.get(key, None)
+        if data is None:
+            return False, None
+        return True, self._loads(data)
+
+    def save(self, key: str, value: typing.Any) -> bool:
+        """
+        Publishes a result if it is serializable and within the size limits.
+
+        Args:
+            key (str): digest of the function name and arguments
+            value (Any): the result to publish
+
+        Returns:
+            bool: True if the result was published
+        """
+        try:
+            data = self._dumps(value)
+        except Exception:
+            return False
+        if self.max_item_bytes is not None:
+            if len(data) > self.max_item_bytes:
+                return False
+        if self.maxsize is not None:
+            if len(self._data) >= self.maxsize:
+                return False
+        self._data[key] = data
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes all results from the store.
+        """
+        self._data.clear()
+
+    def close(self) -> None:
+        """
+        Shuts down the manager if this store started it.
+        """
+        if self._owns_manager and self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+
+def _demo_shared_worker(x: int, store: SharedCache) -> int:
+    """
+    Helper for the :class:`SharedCache` doctest
+    """
+    return memoize(_demo_square, shared=store)(x)
+
+
+def _demo_square(x: int) -> int:
+    return x * x
+
+
+def _iscoroutinefunction(func: object) -> bool:
+    import inspect
+
+    return inspect.iscoroutinefunction(func)
+
+
+def _task_starter(
+    func: Callable, get_cache: Callable[[], typing.MutableMapping]
+) -> Callable:
+    """
+    Returns a function that starts ``func`` as an :class:`asyncio.Task`.
+    Tasks that raise or are cancelled are removed from the cache returned by
+    ``get_cache`` so only successful results are kept.
+    """
+    import asyncio
+
+    def _forget_failure(task: asyncio.Future) -> None:
+        # Scanning for the value avoids needing to recompute the key and
+        # only happens on failure.
+        if task.cancelled() or task.exception() is not None:
+            cache = get_cache()
+            for key, value in list(cache.items()):
+                if value is task:
+                    cache.pop(key, None)
+
+    def _start(*args: typing.Any, **kwargs: typing.Any) -> asyncio.Future:
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        task.add_done_callback(_forget_failure)
+        return task
+
+    return _start
+
+
+def _await_shielded(func: Callable, starter: Callable) -> Callable:
+    """
+    Wraps a memoized task starter in a coroutine function that awaits the
+    shared task. The task is shielded so cancelling one caller does not
+    cancel the computation for everyone else awaiting it.
+    """
+    import asyncio
+
+    @functools.wraps(func)
+    async def memoizer(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return await asyncio.shield(starter(*args, **kwargs))
+
+    return memoizer
+
+
+def _memoize_coroutine(func: Callable, **kwargs: typing.Any) -> Callable:
+    """
+    Memoize a coroutine function by caching the task that runs it.
+
+    The keyword arguments are the options of :func:`memoize`, which is used
+    to cache the tasks.
+    """
+    starter = memoize(
+        _task_starter(func, lambda: starter.cache),  # type: ignore
+        **kwargs,
+    )
+    memoizer = _await_shielded(func, starter)
+    for attr in ['cache', 'cache_info', 'cache_clear', 'cache_parameters']:
+        setattr(memoizer, attr, getattr(starter, attr))
+    return memoizer
+
+
+class _WeakIdentityTable:
+    """
+    Associates values with objects by identity without keeping the objects
+    alive. Unlike :class:`weakref.WeakKeyDictionary` the objects do not need
+    to be hashable, which matters for classes that define ``__eq__``.
+
+    Example:
+        >>> from ubelt.util_memoize import _WeakIdentityTable
+        >>> class Slotted:
+        >>>     __slots__ = ('__weakref__',)
+        >>> table = _WeakIdentityTable()
+        >>> obj = Slotted()
+        >>> table.set(obj, 'value')
+        >>> assert table.get(obj) == 'value'
+        >>> assert len(table) == 1
+        >>> del obj
+        >>> import gc
+        >>> _ = gc.collect()
+        >>> assert len(table) == 0
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[int, tuple[typing.Any, typing.Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, obj: object, default: typing.Any = None) -> typing.Any:
+        item = self._data.get(id(obj), None)
+        if item is None or item[0]() is not obj:
+            return default
+        return item[1]
+
+    def set(self, obj: object, value: typing.Any) -> None:
+        """
+        Raises:
+            TypeError: if ``obj`` cannot be weakly referenced
+        """
+        import weakref
+
+        key = id(obj)
+        data = self._data
+
+        def _remove(ref: weakref.ref) -> None:
+            # The id may have been reused by a newer object
+            item = data.get(key, None)
+            if item is not None and item[0] is ref:
+                del data[key]
+
+        data[key] = (weakref.ref(obj, _remove), value)
+
+    def values(self) -> list[typing.Any]:
+        return [value for _, value in list(self._data.values())]
+
+    def keys(self) -> list[typing.Any]:
+        """
+        Returns:
+            List[Any]: the objects that are still alive
+        """
+        objs = [ref() for ref, _ in list(self._data.values())]
+        return [obj for obj in objs if obj is not None]
+
+
 class memoize_method(typing.Generic[S, P, T]):
     """
     memoization decorator for a method that respects args and kwargs
@@ -199,6 +1005,18 @@ class memoize_method(typing.Generic[S, P, T]):
         This is very thread-unsafe, and has an issue as pointed out in
         [ActiveState_Miller_2010]_, next version may work on fixing this.
 
+    Note:
+        Coroutine methods are supported and cache their tasks in the same way
+        as :func:`memoize`.
+
+    Note:
+        Each instance has its own cache. It is stored on the instance when
+        possible and otherwise in a side table keyed by a weak reference,
+        which supports classes that use ``__slots__`` (these must include
+        ``__weakref__``). For such classes, a cached result that refers to
+        the instance keeps it alive. The caches of all instances of a class
+        can be cleared with ``Class.method.cache_clear()``.
+
     Example:
         >>> import ubelt as ub
         >>> closure1 = closure = {'a': 'b', 'c': 'd', 'z': 'z1'}
@@ -258,15 +1076,56 @@ class memoize_method(typing.Generic[S, P, T]):
         >>> assert method2('a') == (0, 'F2')
         >>> assert method1('z') == ('z2', 'F1')
         >>> assert method2('z') == ('z2', 'F2')
+
+    Example:
+        >>> import ubelt as ub
+        >>> # The per-instance cache can be bounded and works with __slots__
+        >>> class Point:
+        >>>     __slots__ = ('x', '__weakref__')
+        >>>     def __init__(self, x):
+        >>>         self.x = x
+        >>>     @ub.memoize_method(maxsize=2)
+        >>>     def scaled(self, factor):
+        >>>         return self.x * factor
+        >>> pt = Point(3)
+        >>> assert pt.scaled(2) == 6 and pt.scaled(3) == 9
+        >>> assert pt.scaled(4) == 12
+        >>> assert len(Point.scaled.cache_for(pt)) == 2
+        >>> Point.scaled.cache_clear()
+        >>> assert len(Point.scaled.cache_for(pt)) == 0
     """
 
     __func__: Callable[Concatenate[S, P], T]
 
-    def __init__(self, func: Callable[Concatenate[S, P], T]) -> None:
+    def __init__(
+        self,
+        func: Callable[Concatenate[S, P], T] | None = None,
+        *,
+        maxsize: int | None = None,
+    ) -> None:
         """
         Args:
-            func (Callable): method to wrap
+            func (Callable | None):
+                method to wrap. If None, the memoize_method is used as
+                a decorator factory, e.g. ``@memoize_method(maxsize=8)``.
+
+            maxsize (int | None):
+                If specified, each instance caches at most this many results
+                and evicts the least recently used result first.
+                Defaults to None.
         """
+        if maxsize is not None and maxsize < 0:
+            maxsize = 0
+        self._maxsize = maxsize
+        # Caches for instances that cannot store an attribute (__slots__)
+        self._side_caches = _WeakIdentityTable()
+        # Every instance with a cache, without keeping them alive, so
+        # cache_clear can find them.
+        self._instances = _WeakIdentityTable()
+        if func is not None:
+            self._set_func(func)
+
+    def _set_func(self, func: Callable[Concatenate[S, P], T]) -> None:
         self._func = func
         func_name = getattr(func, '__name__', None)
         if func_name is None:  # nocover
@@ -276,6 +1135,61 @@ class memoize_method(typing.Generic[S, P, T]):
         # Mimic the bound method attribute that some callers may inspect.
         self.__func__ = func
 
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """
+        Finishes decorator factory usage, or calls the method with an explicit
+        instance, e.g. ``Class.method(instance, *args)``.
+        """
+        if not hasattr(self, '_func'):
+            (func,) = args
+            self._set_func(func)
+            return self
+        instance, *rest = args
+        return self.__get__(instance)(*rest, **kwargs)
+
+    def cache_for(self, instance: S) -> dict:
+        """
+        Returns the cache used for a specific instance.
+
+        Args:
+            instance (object): an instance of the class with the method
+
+        Returns:
+            dict: maps signature keys to results
+        """
+        cache = getattr(instance, self._cache_name, None)
+        if cache is None:
+            cache = self._side_caches.get(instance, None)
+        if cache is None:
+            cache = {} if self._maxsize is None else collections.OrderedDict()
+            try:
+                setattr(instance, self._cache_name, cache)
+            except AttributeError:
+                # The side table holds the cache strongly, so it is only
+                # used when the instance cannot hold it.
+                try:
+                    self._side_caches.set(instance, cache)
+                except TypeError:
+                    raise TypeError(
+                        'Cannot memoize {} on {} because instances have '
+                        'neither a __dict__ nor a __weakref__ slot'.format(
+                            self._func_name, type(instance).__name__
+                        )
+                    ) from None
+            try:
+                self._instances.set(instance, None)
+            except TypeError:
+                # Without a __weakref__ slot, cache_clear cannot find it
+                pass
+        return cache
+
+    def cache_clear(self) -> None:
+        """
+        Clears the caches of every instance that uses this method.
+        """
+        for instance in self._instances.keys():
+            self.cache_for(instance).clear()
+
     @typing.overload
     def __get__(
         self, instance: None, cls: type[S] | None = None
@@ -301,22 +1215,49 @@ class memoize_method(typing.Generic[S, P, T]):
             return self
 
         unbound = self._func
-        cache = getattr(instance, self._cache_name, None)
-        if cache is None:  # pragma: no branch
-            cache = {}
-            setattr(instance, self._cache_name, cache)
+        cache = self.cache_for(instance)
+        is_coroutine = _iscoroutinefunction(unbound)
+        if is_coroutine:
+            # Coroutine methods cache the task created for each signature
+            unbound = _task_starter(unbound, lambda: cache)
+        maxsize = self._maxsize
 
         # https://stackoverflow.com/questions/71413937/what-does-using-get-on-a-function-do
-        @functools.wraps(unbound)
-        def bound_memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
-            key = _make_signature_key(args, dict(kwargs))
-            if key not in cache:
-                cache[key] = unbound(instance, *args, **kwargs)
-            return cache[key]
-
-        # Set the attribute to prevent calling __get__ again
-        # Is there a better way to do this?
-        setattr(instance, self._func_name, bound_memoizer)
+        if maxsize is None:
+
+            @functools.wraps(unbound)
+            def bound_memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
+                key = _make_signature_key(args, dict(kwargs))
+                if key not in cache:
+                    cache[key] = unbound(instance, *args, **kwargs)
+                return cache[key]
+
+        else:
+
+            @functools.wraps(unbound)
+            def bound_memoizer(*args: P.args, **kwargs: P.kwargs) -> T:
+                key = _make_signature_key(args, dict(kwargs))
+                try:
+                    result = cache[key]
+                except KeyError:
+                    result = unbound(instance, *args, **kwargs)
+                    if maxsize:
+                        cache[key] = result
+                        if len(cache) > maxsize:
+                            cache.popitem(last=False)
+                else:
+                    cache.move_to_end(key)
+                return result
+
+        if is_coroutine:
+            bound_memoizer = _await_shielded(self._func, bound_memoizer)
+
+        # Set the attribute to prevent calling __get__ again. This is not
+        # possible for classes with __slots__, which use the side table.
+        try:
+            setattr(instance, self._func_name, bound_memoizer)
+        except AttributeError:
+            pass
         return bound_memoizer
 
 
@@ -373,6 +1314,17 @@ def memoize_property(fget: property | typing.Callable[[S], T]) -> property:
         >>> c.load_name_count
         1
         >>> c.another_name
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Classes with __slots__ are supported if they are weakrefable
+        >>> class Slotted:
+        ...     __slots__ = ('__weakref__',)
+        ...     @ub.memoize_property
+        ...     def value(self):
+        ...         return object()
+        >>> obj = Slotted()
+        >>> assert obj.value is obj.value
     """
     # Unwrap any existing property decorator
     getter: typing.Callable[[S], T]
@@ -383,11 +1335,21 @@ def memoize_property(fget: property | typing.Callable[[S], T]) -> property:
         getter = fget
 
     attr_name = '_' + getattr(getter, '__name__')
+    # Used for instances that cannot store the attribute, e.g. __slots__
+    side_table = _WeakIdentityTable()
+    missing = object()
 
     @functools.wraps(getter)
     def fget_memoized(self: S) -> T:
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, getter(self))
-        return getattr(self, attr_name)
+        value = getattr(self, attr_name, missing)
+        if value is missing:
+            value = side_table.get(self, missing)
+            if value is missing:
+                value = getter(self)
+                try:
+                    setattr(self, attr_name, value)
+                except AttributeError:
+                    side_table.set(self, value)
+        return typing.cast(T, value)
 
     return property(fget_memoized)
@@ -0,0 +1,854 @@
+"""
+This module exposes :class:`Pipeline` and :class:`Stage`, which provide a
+small make-like layer on top of :class:`ubelt.util_cache.CacheStamp`.
+
+A :class:`Stage` is a function that produces files. It declares the files it
+reads (``inputs``), the files it writes (``products``), any configuration that
+changes its result (``params``), and the stages it depends on (``depends``).
+Dependencies are also inferred whenever one stage lists the product of another
+as an input.
+
+A :class:`Pipeline` sorts its stages topologically and runs them on a
+:class:`ubelt.util_futures.Executor`, so independent stages can run in
+parallel. Each stage is guarded by a :class:`ubelt.util_cache.CacheStamp`,
+which is skipped if it is up to date. The stamp of a stage depends on the
+fingerprints of its upstream stages, so when an upstream stage produces
+different results, all stages downstream of it are rerun. Like ``redo``, if
+an upstream stage is rerun but produces identical products, downstream stages
+remain up to date.
+
+Example:
+    >>> import ubelt as ub
+    >>> dpath = ub.Path.appdir('ubelt/demo/pipeline').delete().ensuredir()
+    >>> def make_numbers(fpath, n):
+    >>>     fpath.write_text(' '.join(map(str, range(n))))
+    >>> def make_sum(src, dst):
+    >>>     dst.write_text(str(sum(map(int, src.read_text().split()))))
+    >>> numbers = dpath / 'numbers.txt'
+    >>> total = dpath / 'total.txt'
+    >>> pipe = ub.Pipeline(dpath / 'stamps', verbose=0)
+    >>> pipe.add(ub.Stage('numbers', make_numbers, args=[numbers],
+    >>>                   kwargs={'n': 10}, params={'n': 10},
+    >>>                   products=[numbers]))
+    >>> pipe.add(ub.Stage('total', make_sum, args=[numbers, total],
+    >>>                   inputs=[numbers], products=[total]))
+    >>> print(pipe.order())
+    ['numbers', 'total']
+    >>> print(pipe.run())
+    {'numbers': 'ran', 'total': 'ran'}
+    >>> print(total.read_text())
+    45
+    >>> # Nothing is rerun if everything is up to date
+    >>> print(pipe.run())
+    {'numbers': 'skipped', 'total': 'skipped'}
+    >>> # Deleting an intermediate product causes it and everything
+    >>> # downstream of it to rerun.
+    >>> numbers.delete()
+    >>> print(pipe.status())
+    {'numbers': 'missing_products', 'total': 'upstream_expired'}
+    >>> print(pipe.run())
+    {'numbers': 'ran', 'total': 'skipped'}
+
+This module also exposes :class:`StreamPipeline`, which streams items through
+a chain of map, filter, and batch steps. Parallel steps are connected by
+bounded queues, so the pipeline holds a bounded number of items in memory.
+"""
+
+from __future__ import annotations
+
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Any, Callable, Iterable, Iterator
+
+    from ubelt.util_cache import CacheStamp
+
+__all__ = ['Pipeline', 'Stage', 'StreamPipeline']
+
+
+class Stage:
+    """
+    A single step in a :class:`Pipeline` that produces files.
+
+    Attributes:
+        name (str): unique name of the stage
+        func (Callable): the function that computes the products
+        args (Tuple): positional arguments passed to ``func``
+        kwargs (Dict): keyword arguments passed to ``func``
+        inputs (List[str | os.PathLike]): files read by the stage
+        products (List[str | os.PathLike]): files written by the stage
+        depends (List[str]): names of upstream stages
+        params (object): configuration that the products depend on
+
+    Example:
+        >>> import ubelt as ub
+        >>> stage = ub.Stage('demo', print, args=['hello'], depends=['other'])
+        >>> print(stage)
+        <Stage(demo)>
+    """
+
+    name: str
+    func: typing.Callable[..., typing.Any]
+    args: tuple[typing.Any, ...]
+    kwargs: dict[str, typing.Any]
+    inputs: list[str | os.PathLike]
+    products: list[str | os.PathLike]
+    depends: list[str]
+    params: object
+
+    def __init__(
+        self,
+        name: str,
+        func: typing.Callable[..., typing.Any],
+        args: typing.Sequence[typing.Any] = (),
+        kwargs: dict[str, typing.Any] | None = None,
+        inputs: typing.Sequence[str | os.PathLike] | None = None,
+        products: typing.Sequence[str | os.PathLike] | None = None,
+        depends: typing.Sequence[str | Stage] | None = None,
+        params: object = None,
+    ) -> None:
+        """
+        Args:
+            name (str):
+                Unique name of the stage. This is also the name of its stamp.
+
+            func (Callable):
+                Called as ``func(*args, **kwargs)`` to compute the products.
+
+            args (Sequence): positional arguments passed to ``func``.
+
+            kwargs (Dict[str, Any] | None): keyword arguments passed to ``func``.
+
+            inputs (Sequence[str | os.PathLike] | None):
+                Files or directories read by the stage. If an input is the
+                product of another stage, that stage becomes an upstream
+                dependency. Otherwise the size and modification time of the
+                input are part of the stage stamp.
+
+            products (Sequence[str | os.PathLike] | None):
+                Files or directories written by the stage. These are passed
+                to :class:`ubelt.util_cache.CacheStamp`.
+
+            depends (Sequence[str | Stage] | None):
+                Upstream stages that must run before this one.
+
+            params (object):
+                Configuration that the products depend on. This must be
+                hashable by :func:`ubelt.util_hash.hash_data`.
+        """
+        self.name = name
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = {} if kwargs is None else dict(kwargs)
+        self.inputs = [] if inputs is None else list(inputs)
+        self.products = [] if products is None else list(products)
+        self.depends = [
+            d.name if isinstance(d, Stage) else d for d in (depends or [])
+        ]
+        self.params = params
+
+    def __repr__(self) -> str:
+        return '<Stage({})>'.format(self.name)
+
+
+class Pipeline:
+    """
+    Runs a graph of :class:`Stage` objects, skipping the ones that are up to
+    date.
+
+    Attributes:
+        dpath (str | os.PathLike): directory where stage stamps are written
+        stages (Dict[str, Stage]): the registered stages in insertion order
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/pipeline/diamond')
+        >>> dpath.delete().ensuredir()
+        >>> def write(fpath, *srcs):
+        >>>     text = ''.join(ub.Path(s).read_text() for s in srcs)
+        >>>     ub.Path(fpath).write_text(text + fpath.stem)
+        >>> paths = {k: dpath / f'{k}.txt' for k in 'abcd'}
+        >>> pipe = ub.Pipeline(dpath / 'stamps', mode='thread', max_workers=2,
+        >>>                    verbose=0)
+        >>> pipe.add(ub.Stage('a', write, args=[paths['a']],
+        >>>                   products=[paths['a']]))
+        >>> pipe.add(ub.Stage('b', write, args=[paths['b'], paths['a']],
+        >>>                   inputs=[paths['a']], products=[paths['b']]))
+        >>> pipe.add(ub.Stage('c', write, args=[paths['c'], paths['a']],
+        >>>                   inputs=[paths['a']], products=[paths['c']]))
+        >>> pipe.add(ub.Stage('d', write, args=[paths['d'], paths['b'], paths['c']],
+        >>>                   inputs=[paths['b'], paths['c']],
+        >>>                   products=[paths['d']]))
+        >>> print(pipe.run())
+        {'a': 'ran', 'b': 'ran', 'c': 'ran', 'd': 'ran'}
+        >>> print(paths['d'].read_text())
+        abacd
+        >>> # Changing the parameters of a stage reruns it. Its dependents are
+        >>> # only rerun if it produces different outputs.
+        >>> pipe.stages['c'].params = 'new-config'
+        >>> print(pipe.run())
+        {'a': 'skipped', 'b': 'skipped', 'c': 'ran', 'd': 'skipped'}
+        >>> # Rerunning a stage that reproduces identical outputs does not
+        >>> # invalidate the stages downstream of it.
+        >>> paths['a'].write_text('corrupted')
+        >>> print(pipe.status())
+        {'a': 'size_diff', 'b': 'upstream_expired', 'c': 'upstream_expired', 'd': 'upstream_expired'}
+        >>> print(pipe.run())
+        {'a': 'ran', 'b': 'skipped', 'c': 'skipped', 'd': 'skipped'}
+    """
+
+    dpath: str | os.PathLike
+    stages: dict[str, Stage]
+    mode: str
+    max_workers: int
+    hasher: str
+    verify: str
+    verbose: int
+
+    def __init__(
+        self,
+        dpath: str | os.PathLike,
+        stages: typing.Iterable[Stage] | None = None,
+        mode: str = 'thread',
+        max_workers: int = 0,
+        hasher: str = 'sha1',
+        verify: str = 'hash',
+        verbose: int = 1,
+    ) -> None:
+        """
+        Args:
+            dpath (str | os.PathLike):
+                Directory where the stamps of each stage are written.
+
+            stages (Iterable[Stage] | None): initial stages
+
+            mode (str):
+                The :class:`ubelt.util_futures.Executor` backend used to run
+                stages. Can be thread, process, or serial. Defaults to
+                'thread'.
+
+            max_workers (int):
+                Number of stages that can run at the same time. If 0, stages
+                run serially. Defaults to 0.
+
+            hasher (str):
+                Hash algorithm used by the stage stamps. Defaults to sha1.
+
+            verify (str):
+                Verification policy used by the stage stamps. See
+                :class:`ubelt.util_cache.CacheStamp`. Defaults to 'hash'.
+
+            verbose (int): verbosity level. Defaults to 1.
+        """
+        self.dpath = dpath
+        self.stages = {}
+        self.mode = mode
+        self.max_workers = max_workers
+        self.hasher = hasher
+        self.verify = verify
+        self.verbose = verbose
+        for stage in stages or []:
+            self.add(stage)
+
+    def add(self, stage: Stage) -> Stage:
+        """
+        Register a new stage.
+
+        Args:
+            stage (Stage): the stage to add
+
+        Returns:
+            Stage: the same stage
+        """
+        if stage.name in self.stages:
+            raise KeyError('Duplicate stage name: {!r}'.format(stage.name))
+        self.stages[stage.name] = stage
+        return stage
+
+    def _producers(self) -> dict[str, str]:
+        """
+        Returns:
+            Dict[str, str]: maps each normalized product path to its stage
+        """
+        producers = {}
+        for stage in self.stages.values():
+            for p in stage.products:
+                producers[os.path.normpath(os.fspath(p))] = stage.name
+        return producers
+
+    def _upstream(self) -> dict[str, list[str]]:
+        """
+        Returns:
+            Dict[str, List[str]]: the upstream stages of each stage
+        """
+        producers = self._producers()
+        upstream = {}
+        for stage in self.stages.values():
+            parents = list(stage.depends)
+            for p in stage.inputs:
+                parent = producers.get(os.path.normpath(os.fspath(p)), None)
+                if parent is not None and parent != stage.name:
+                    parents.append(parent)
+            for parent in parents:
+                if parent not in self.stages:
+                    raise KeyError(
+                        'Stage {!r} depends on unknown stage {!r}'.format(
+                            stage.name, parent
+                        )
+                    )
+            upstream[stage.name] = list(dict.fromkeys(parents))
+        return upstream
+
+    def order(self) -> list[str]:
+        """
+        Topologically sort the stages. Ties are broken by insertion order.
+
+        Returns:
+            List[str]: stage names in an order that respects dependencies
+
+        Raises:
+            ValueError: if the dependencies contain a cycle
+
+        Example:
+            >>> import ubelt as ub
+            >>> pipe = ub.Pipeline('.')
+            >>> pipe.add(ub.Stage('c', print, depends=['b']))
+            >>> pipe.add(ub.Stage('b', print, depends=['a']))
+            >>> pipe.add(ub.Stage('a', print))
+            >>> print(pipe.order())
+            ['a', 'b', 'c']
+            >>> pipe.stages['a'].depends.append('c')
+            >>> import pytest
+            >>> with pytest.raises(ValueError):
+            >>>     pipe.order()
+        """
+        upstream = self._upstream()
+        rank = {name: idx for idx, name in enumerate(self.stages)}
+        num_parents = {name: len(parents) for name, parents in upstream.items()}
+        downstream: dict[str, list[str]] = {name: [] for name in self.stages}
+        for name, parents in upstream.items():
+            for parent in parents:
+                downstream[parent].append(name)
+        import heapq
+
+        heap = [(rank[n], n) for n, count in num_parents.items() if count == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            _, name = heapq.heappop(heap)
+            order.append(name)
+            for child in downstream[name]:
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    heapq.heappush(heap, (rank[child], child))
+        if len(order) != len(self.stages):
+            cyclic = sorted(set(self.stages) - set(order))
+            raise ValueError(
+                'Stages have cyclic dependencies: {}'.format(cyclic)
+            )
+        return order
+
+    def _stamp(
+        self,
+        stage: Stage,
+        upstream_fprints: dict[str, object],
+        producers: dict[str, str],
+    ) -> CacheStamp:
+        """
+        Build the stamp that guards a stage.
+
+        Args:
+            stage (Stage): the stage
+            upstream_fprints (Dict[str, object]):
+                fingerprints of the stages upstream of this one
+            producers (Dict[str, str]):
+                maps product paths to the stage that produces them
+        """
+        from ubelt.util_cache import CacheStamp
+
+        # Inputs produced by an upstream stage are covered by its fingerprint.
+        # Using their stats instead would rerun this stage whenever the
+        # upstream stage reruns, even if it reproduced identical outputs.
+        external_inputs = [
+            p
+            for p in stage.inputs
+            if producers.get(os.path.normpath(os.fspath(p)), None)
+            not in upstream_fprints
+        ]
+        depends = {
+            'params': stage.params,
+            'upstream': upstream_fprints,
+            'inputs': _input_fingerprints(external_inputs),
+        }
+        stamp = CacheStamp(
+            stage.name,
+            dpath=self.dpath,
+            depends=depends,
+            product=stage.products or None,
+            hasher=self.hasher,
+            verify=self.verify,
+            verbose=max(self.verbose - 2, 0),
+        )
+        return stamp
+
+    def status(self) -> dict[str, bool | str]:
+        """
+        Report which stages would run without running anything.
+
+        Returns:
+            Dict[str, bool | str]:
+                Maps each stage to False if it is up to date, otherwise the
+                reason it would be rerun. Stages that are only stale because
+                a stage upstream of them will rerun are marked as
+                ``'upstream_expired'``.
+        """
+        from ubelt.util_cache import CacheStamp
+
+        order = self.order()
+        upstream = self._upstream()
+        producers = self._producers()
+        fprints: dict[str, object] = {}
+        stamps = {}
+        for name in order:
+            stage = self.stages[name]
+            stamp = self._stamp(
+                stage, {u: fprints[u] for u in upstream[name]}, producers
+            )
+            stamps[name] = stamp
+            fprints[name] = _stamp_fingerprint(stamp._get_certificate())
+        reasons = CacheStamp.expired_many(
+            [stamps[name] for name in order], workers=self.max_workers
+        )
+        status: dict[str, bool | str] = {}
+        for name, reason in zip(order, reasons):
+            if not reason and any(status[u] for u in upstream[name]):
+                reason = 'upstream_expired'
+            status[name] = reason
+        return status
+
+    def run(self, force: bool = False) -> dict[str, str]:
+        """
+        Run all stages that are not up to date.
+
+        Independent stages are run in parallel on an
+        :class:`ubelt.util_futures.Executor`. A stage is submitted as soon as
+        all of its upstream stages finish. If a stage raises an exception, no
+        new stages are started, the running ones are allowed to finish, and
+        the exception is re-raised.
+
+        Args:
+            force (bool): if True, every stage is rerun. Defaults to False.
+
+        Returns:
+            Dict[str, str]:
+                Maps each stage name to ``'ran'`` or ``'skipped'``, in
+                topological order.
+        """
+        import concurrent.futures
+
+        from ubelt.util_futures import Executor
+
+        order = self.order()
+        upstream = self._upstream()
+        producers = self._producers()
+        downstream: dict[str, list[str]] = {name: [] for name in order}
+        for name, parents in upstream.items():
+            for parent in parents:
+                downstream[parent].append(name)
+        rank = {name: idx for idx, name in enumerate(order)}
+        waiting_on = {name: set(upstream[name]) for name in order}
+
+        fprints: dict[str, object] = {}
+        results: dict[str, str] = {}
+        running: dict[Future, str] = {}
+        error: BaseException | None = None
+        ready = [name for name in order if not waiting_on[name]]
+
+        with Executor(mode=self.mode, max_workers=self.max_workers) as executor:
+            while ready or running:
+                for name in sorted(ready, key=rank.__getitem__):
+                    stage = self.stages[name]
+                    stamp = self._stamp(
+                        stage,
+                        {u: fprints[u] for u in upstream[name]},
+                        producers,
+                    )
+                    job = executor.submit(_run_stage, stage, stamp, force)
+                    running[job] = name
+                ready = []
+                done, _ = concurrent.futures.wait(
+                    list(running),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for job in done:
+                    name = running.pop(job)
+                    try:
+                        status, fprint = job.result()
+                    except BaseException as ex:
+                        if error is None:
+                            error = ex
+                        continue
+                    if self.verbose:
+                        print('[pipeline] {} stage {}'.format(status, name))
+                    results[name] = status
+                    fprints[name] = fprint
+                    if error is None:
+                        for child in downstream[name]:
+                            waiting_on[child].discard(name)
+                            if not waiting_on[child]:
+                                ready.append(child)
+        if error is not None:
+            raise error
+        return {name: results[name] for name in order}
+
+
+def _stamp_fingerprint(certificate: dict[str, typing.Any] | None) -> object:
+    """
+    Summarize a stage certificate so downstream stamps can depend on it.
+    The product hashes are used when available so that an upstream stage that
+    reproduces identical outputs does not invalidate its dependents.
+    """
+    if certificate is None:
+        return None
+    if certificate.get('hash', None) is not None:
+        return certificate['hash']
+    return certificate.get('timestamp', None)
+
+
+def _input_fingerprints(
+    inputs: list[str | os.PathLike],
+) -> list[tuple[str, int, int]]:
+    """
+    Summarize input files (or the files in input directories) by their size
+    and modification time. Missing inputs are recorded with a size of -1.
+    """
+    from ubelt.util_cache import _walk_files
+
+    fingerprints = []
+    for p in inputs:
+        key = os.path.normpath(os.fspath(p))
+        if os.path.isdir(key):
+            for fpath, stat in _walk_files(key):
+                fingerprints.append((fpath, stat.st_size, stat.st_mtime_ns))
+        elif os.path.exists(key):
+            stat = os.stat(key)
+            fingerprints.append((key, stat.st_size, stat.st_mtime_ns))
+        else:
+            fingerprints.append((key, -1, -1))
+    return fingerprints
+
+
+def _run_stage(
+    stage: Stage, stamp: CacheStamp, force: bool = False
+) -> tuple[str, object]:
+    """
+    Run a stage if its stamp is expired. This is a module level function so
+    it can be sent to process workers.
+
+    Returns:
+        Tuple[str, object]: the status and the new fingerprint of the stage
+    """
+    if force or stamp.expired():
+        stage.func(*stage.args, **stage.kwargs)
+        certificate = stamp.renew()
+        status = 'ran'
+    else:
+        certificate = stamp._get_certificate()
+        status = 'skipped'
+    return status, _stamp_fingerprint(certificate)
+
+
+class _StageError:
+    """
+    Carries an exception raised inside a stage thread to the consumer.
+    """
+
+    __slots__ = ('exception',)
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+# Marks the end of a stage's output
+_STAGE_DONE = object()
+
+
+class StreamPipeline:
+    """
+    A lazy, composable pipeline that streams items through a chain of map,
+    filter, and batch steps, where each map step can run in parallel.
+
+    A parallel map step runs on its own :class:`ubelt.util_futures.Executor`
+    in a background thread and hands its results to the next step through a
+    bounded queue. When the queue is full the step stops pulling new input,
+    so a slow step applies backpressure upstream and memory stays bounded.
+    Consecutive steps that are not parallel are run inline by the thread
+    that consumes them. This lets I/O bound and CPU bound steps overlap
+    without writing any queue handling.
+
+    Each method returns a new pipeline, and nothing runs until the pipeline
+    is iterated. Closing the iterator early stops all of the stages.
+
+    Example:
+        >>> import ubelt as ub
+        >>> def load(x):
+        >>>     return x * 10
+        >>> pipe = (
+        >>>     ub.StreamPipeline(range(20))
+        >>>     .map(load, workers=4, mode='thread')
+        >>>     .filter(lambda x: x % 20 == 0)
+        >>>     .map(str, workers=2, mode='thread')
+        >>>     .batch(4)
+        >>> )
+        >>> for batch in pipe:
+        >>>     print(batch)
+        ['0', '20', '40', '60']
+        ['80', '100', '120', '140']
+        ['160', '180']
+
+    Example:
+        >>> # Process mode steps need functions that can be pickled
+        >>> import ubelt as ub
+        >>> pipe = ub.StreamPipeline(range(-5, 5)).map(abs, workers=2,
+        >>>                                              mode='process')
+        >>> print(sorted(pipe.map(abs, workers=2, ordered=False)))
+        [0, 1, 1, 2, 2, 3, 3, 4, 4, 5]
+    """
+
+    source: Iterable[Any]
+
+    def __init__(
+        self, source: Iterable[Any], _steps: tuple[tuple, ...] = ()
+    ) -> None:
+        """
+        Args:
+            source (Iterable): the items to stream. Can be unbounded.
+        """
+        self.source = source
+        self._steps = _steps
+
+    def _extend(self, step: tuple) -> StreamPipeline:
+        return StreamPipeline(self.source, self._steps + (step,))
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        workers: int = 0,
+        mode: str = 'thread',
+        ordered: bool = True,
+        buffer: int | None = None,
+        chunksize: int | str = 'auto',
+        desc: str | None = None,
+    ) -> StreamPipeline:
+        """
+        Adds a step that applies ``func`` to each item.
+
+        Args:
+            func (Callable): the function to apply
+
+            workers (int):
+                the number of workers. If 0, the step runs inline in the
+                thread that consumes it. Defaults to 0.
+
+            mode (str):
+                the :class:`ubelt.util_futures.Executor` backend for the
+                step. Defaults to 'thread'.
+
+            ordered (bool):
+                if False, results are passed on as soon as they finish.
+                Defaults to True.
+
+            buffer (int | None):
+                the most finished results to hold for the next step.
+                Defaults to twice the number of workers.
+
+            chunksize (int | str):
+                passed to :func:`ubelt.util_futures.Executor.imap`. Up to
+                twice the number of workers chunks are in flight in addition
+                to the buffered results, so use a small value when the
+                items themselves are large. Defaults to 'auto'.
+
+            desc (str | None):
+                if specified, the step reports its progress with a
+                :class:`ubelt.progiter.ProgIter`.
+
+        Returns:
+            StreamPipeline: a new pipeline
+        """
+        if buffer is None:
+            buffer = max(1, workers) * 2
+        if buffer < 1:
+            raise ValueError('buffer must be positive')
+        options = {
+            'workers': workers,
+            'mode': mode,
+            'ordered': ordered,
+            'buffer': buffer,
+            'chunksize': chunksize,
+        }
+        return self._extend(('map', func, options, desc))
+
+    def filter(
+        self,
+        func: Callable[[Any], Any] | None = None,
+        desc: str | None = None,
+    ) -> StreamPipeline:
+        """
+        Adds a step that only keeps items for which ``func`` is truthy.
+
+        Args:
+            func (Callable | None):
+                the predicate. If None, falsy items are dropped.
+
+            desc (str | None):
+                if specified, reports the number of kept items with a
+                :class:`ubelt.progiter.ProgIter`.
+
+        Returns:
+            StreamPipeline: a new pipeline
+        """
+        return self._extend(('filter', func, None, desc))
+
+    def batch(self, size: int, desc: str | None = None) -> StreamPipeline:
+        """
+        Adds a step that groups items into lists of ``size`` items. The last
+        list may be shorter.
+
+        Args:
+            size (int): the number of items in each batch
+
+            desc (str | None):
+                if specified, reports the number of batches with a
+                :class:`ubelt.progiter.ProgIter`.
+
+        Returns:
+            StreamPipeline: a new pipeline
+        """
+        if size < 1:
+            raise ValueError('size must be positive')
+        return self._extend(('batch', size, None, desc))
+
+    def __iter__(self) -> Iterator[Any]:
+        import threading
+
+        from ubelt.progiter import ProgIter
+
+        stop = threading.Event()
+        threads: list[threading.Thread] = []
+        items: Iterator[Any] = iter(self.source)
+        try:
+            for kind, arg, options, desc in self._steps:
+                if kind == 'map':
+                    if options['workers'] > 0:
+                        items = _parallel_map(
+                            items, arg, options, desc, stop, threads
+                        )
+                        # The stage thread reports the progress
+                        desc = None
+                    else:
+                        items = map(arg, items)
+                elif kind == 'filter':
+                    items = filter(arg, items)
+                elif kind == 'batch':
+                    items = _batched(items, arg)
+                else:  # nocover
+                    raise KeyError(kind)
+                if desc is not None:
+                    items = iter(ProgIter(items, desc=desc))
+            yield from items
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    import itertools as it
+
+    items = iter(items)
+    while True:
+        chunk = list(it.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parallel_map(
+    items: Iterator[Any],
+    func: Callable[[Any], Any],
+    options: dict[str, Any],
+    desc: str | None,
+    stop: Any,
+    threads: list,
+) -> Iterator[Any]:
+    """
+    Starts a thread that maps ``func`` over ``items`` on an executor and
+    returns an iterator over its results, which are passed through a bounded
+    queue.
+    """
+    import queue
+    import threading
+
+    from ubelt.progiter import ProgIter
+    from ubelt.util_futures import Executor
+
+    results: queue.Queue = queue.Queue(maxsize=options['buffer'])
+
+    def _put(item: Any) -> bool:
+        # Wake up regularly so the stage can stop if the consumer is gone
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _run() -> None:
+        try:
+            executor = Executor(options['mode'], options['workers'])
+            with executor:
+                if options['ordered']:
+                    mapped = executor.imap(
+                        func, items, chunksize=options['chunksize']
+                    )
+                else:
+                    mapped = executor.imap_unordered(
+                        func, items, chunksize=options['chunksize']
+                    )
+                if desc is not None:
+                    mapped = iter(ProgIter(mapped, desc=desc))
+                try:
+                    for result in mapped:
+                        if not _put(result):
+                            break
+                finally:
+                    close = getattr(mapped, 'close', None)
+                    if close is not None:
+                        close()
+        except BaseException as ex:
+            _put(_StageError(ex))
+        else:
+            _put(_STAGE_DONE)
+
+    thread = threading.Thread(target=_run, name='StreamPipeline', daemon=True)
+    threads.append(thread)
+    thread.start()
+
+    def _consume() -> Iterator[Any]:
+        while True:
+            try:
+                item = results.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    return
+                continue
+            if item is _STAGE_DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.exception
+            yield item
+
+    return _consume()